@@ -29,6 +29,7 @@ from backend.routes.preferences import router as preferences_router
 from backend.routes.integrations import router as integrations_router
 from backend.routes.calendar import router as calendar_router
 from backend.routes.analytics import router as analytics_router
+from backend.routes.events import router as events_router
 
 app = FastAPI(title="Personal Analytics Dashboard API")
 
@@ -57,6 +58,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # conditional GETs from the widget (backend/etags.py)
 )
 
 # ── Routers ───────────────────────────────────────────────────────────────────
@@ -68,6 +70,7 @@ app.include_router(preferences_router,  prefix="/preferences",  tags=["preferenc
 app.include_router(integrations_router)
 app.include_router(calendar_router)
 app.include_router(analytics_router,    prefix="/analytics",    tags=["analytics"])
+app.include_router(events_router,       prefix="/events",       tags=["events"])
 
 # ── SPA (Vite build): same origin as API on :8000 — no separate Vite server needed ──
 _REPO_ROOT = Path(__file__).resolve().parent.parent
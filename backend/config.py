@@ -65,6 +65,18 @@ elif _disable_env in ("0", "false", "no"):
 else:
     DISABLE_SMTP_SENDING = not _smtp_configured
 
+# ── Schedule cache ────────────────────────────────────────────────────────────
+# Max cached build_schedule() results per process (0 disables the cache).
+SCHEDULE_CACHE_SIZE = int(os.environ.get("SCHEDULE_CACHE_SIZE", "1024"))
+
+# ── Scheduler ─────────────────────────────────────────────────────────────────
+# Placement mode for /schedules/*: "greedy" or "optimize" (see
+# scheduler/optimizer.py). The budget caps how long one optimize run takes.
+SCHEDULER_MODE           = os.environ.get("SCHEDULER_MODE", "greedy").strip().lower()
+SCHEDULER_TIME_BUDGET_MS = int(os.environ.get("SCHEDULER_TIME_BUDGET_MS", "50"))
+# Slot resolution in minutes: 5, 10, 15 or 30.
+SCHEDULER_STEP_MINUTES   = int(os.environ.get("SCHEDULER_STEP_MINUTES", "15"))
+
 # ── Password rules ────────────────────────────────────────────────────────────
 MIN_PASSWORD_LENGTH = 8
 
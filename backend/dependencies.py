@@ -21,32 +21,39 @@ def get_db() -> Generator[Session, Any, None]:  # pragma: no cover
         db.close()                               # pragma: no cover
 
 
-def get_current_user(
-    token: str     = Depends(oauth2_scheme),
-    db:    Session = Depends(get_db),
-) -> User:
-    credentials_exception = HTTPException(
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def get_current_user(
+    token: str     = Depends(oauth2_scheme),
+    db:    Session = Depends(get_db),
+) -> User:
     try:
         payload: dict[str, Any] = decode_access_token(token)
         user_id_raw: Any = payload.get("sub")
         if user_id_raw is None:
-            raise credentials_exception
+            raise credentials_exception()
         user_id: int = int(user_id_raw)
     except (JWTError, ValueError):
-        raise credentials_exception
+        raise credentials_exception()
+
+    return load_active_user(db, user_id)
+
 
+def load_active_user(db: Session, user_id: int) -> User:
+    """The user a validated token names, if they may still sign in."""
     user: User | None = db.query(User).filter(User.id == user_id).first()
 
     if user is None:
-        raise credentials_exception
+        raise credentials_exception()
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Account is disabled")
     if not user.is_verified:
         raise HTTPException(status_code=403, detail="Please verify your email address first")
 
-    return user
\ No newline at end of file
+    return user
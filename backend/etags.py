@@ -0,0 +1,55 @@
+"""
+etags.py
+--------
+Conditional GET (ETag / If-None-Match) for the read endpoints the
+dashboard, analytics page and desktop widget poll.
+
+Every change to a user's tasks, task occurrences or preferences bumps
+User.data_version (see models._track_changes), and get_current_user
+has already loaded the user, so a route can name the version of its
+response before running a query of its own:
+
+    not_modified = conditional_get(request, response, "tasks", current_user.id, current_user.data_version)
+    if not_modified is not None:
+        return not_modified
+
+The ETag is a hash of the parts given; pass everything else the response
+depends on (the date asked for, today's date, ...). A client that already
+holds that ETag gets an empty 304 and nothing is loaded or serialized.
+"""
+
+import hashlib
+
+from fastapi import Request, Response
+
+# Browsers may keep a copy but must revalidate it on every use.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Weak ETag for a response fully determined by parts."""
+    digest = hashlib.sha256(":".join(map(str, parts)).encode()).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def conditional_get(request: Request, response: Response, *parts: object) -> Response | None:
+    """
+    Stamp response with the ETag for parts. Returns the 304 to send instead
+    if the request's If-None-Match already names it, else None.
+    """
+    etag    = make_etag(*parts)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
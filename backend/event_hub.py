@@ -0,0 +1,101 @@
+"""
+event_hub.py
+------------
+In-process pub/sub for change events, streamed to clients by
+GET /events/stream (routes/events.py).
+
+Routes publish compact events after they commit:
+
+    publish(user_id, "task.updated", id=task.id)
+
+and every open stream of that user gets a copy. One channel per user
+fans out to all of that user's subscribers (dashboard, widget, another
+tab), so a publisher never needs to know how many are listening, and a
+user with no open stream costs one dict lookup.
+
+Event types:
+    task.created / task.updated / task.deleted   {"id": task id}
+    schedule.invalidated                         cached schedules are stale
+    preferences.updated
+    sync.finished                                {"provider", "imported", "updated", "skipped"}
+    resync                                       events were dropped; refetch everything
+
+Routes are sync (run in the threadpool) while streams live on the event
+loop, so publish() hands events to each subscriber's loop with
+call_soon_threadsafe(). Each subscriber is an asyncio.Queue of at most
+QUEUE_SIZE events -- an idle connection costs a queue and a suspended
+coroutine, no thread -- and one that falls behind gets a single "resync"
+instead of an unbounded backlog.
+
+The hub is per worker process: with several workers, a write handled by
+one is not seen by streams held by another.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+# Events a subscriber may have waiting before it is told to resync.
+QUEUE_SIZE = 100
+
+
+class EventHub:
+    """user id -> the queues (and their event loops) of that user's open streams."""
+
+    def __init__(self, queue_size: int = QUEUE_SIZE) -> None:
+        self._queue_size = queue_size
+        self._channels   : dict[int, dict[asyncio.Queue, asyncio.AbstractEventLoop]] = {}
+        self._lock       = threading.Lock()
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        """Open a subscription for user_id. Call from the event loop that will read it."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._channels.setdefault(user_id, {})[queue] = loop
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        with self._lock:
+            channel = self._channels.get(user_id)
+            if channel is None:
+                return
+            channel.pop(queue, None)
+            if not channel:
+                del self._channels[user_id]
+
+    def publish(self, user_id: int, event_type: str, **data: object) -> None:
+        """Send {"type": event_type, **data} to every stream user_id has open. Safe from any thread."""
+        with self._lock:
+            subscribers = list(self._channels.get(user_id, {}).items())
+        event = {"type": event_type, **data}
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(_deliver, queue, event)
+            except RuntimeError:  # that loop has shut down; its stream is gone
+                self.unsubscribe(user_id, queue)
+
+    def subscriber_count(self, user_id: int | None = None) -> int:
+        """Open subscriptions for user_id, or in total."""
+        with self._lock:
+            if user_id is not None:
+                return len(self._channels.get(user_id, {}))
+            return sum(len(channel) for channel in self._channels.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._channels.clear()
+
+
+def _deliver(queue: asyncio.Queue, event: dict) -> None:
+    """Runs on the subscriber's loop. A full queue is emptied and told to resync."""
+    if queue.full():
+        while not queue.empty():
+            queue.get_nowait()
+        event = {"type": "resync"}
+    queue.put_nowait(event)
+
+
+hub = EventHub()
+publish = hub.publish
@@ -1,8 +1,9 @@
-from sqlalchemy import ForeignKey, String, Integer, Boolean, Float, DateTime, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, String, Integer, Boolean, Float, DateTime, Text, UniqueConstraint, Index, event, inspect, select, update
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, validates
 from datetime import datetime, timezone
 from typing import Optional
 from backend.database import Base
+from backend.scheduler.constraints import parse_hhmm, weekday_mask
 
 
 def utcnow() -> datetime:
@@ -25,6 +26,9 @@ class User(Base):
     email_2fa_enabled : Mapped[bool]           = mapped_column(Boolean, default=False, nullable=False)
     created_at        : Mapped[datetime]       = mapped_column(default=utcnow)
     last_login        : Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    # Bumped on every flush that changes this user's tasks or preferences
+    # (see _track_changes below); stamps materialized schedules.
+    data_version      : Mapped[int]            = mapped_column(Integer, default=0, nullable=False)
 
     tasks                 : Mapped[list["Task"]]                   = relationship(back_populates="owner",      cascade="all, delete-orphan")
     feedback_entries      : Mapped[list["DailyFeedback"]]          = relationship(back_populates="owner",      cascade="all, delete-orphan")
@@ -113,6 +117,13 @@ class Task(Base):
         recurrence_days: comma-separated day numbers (0=Mon ... 6=Sun)
         e.g. "0,2,4" = Mon/Wed/Fri
 
+    Pre-parsed copies (kept in sync by the validators below, so the
+    scheduler and eligibility checks never parse strings):
+        fixed_start_min / fixed_end_min -- fixed_start / fixed_end as minutes
+                                           since midnight (None if unset)
+        recurrence_mask                 -- recurrence_days as a weekday
+                                           bitmask, bit 0 = Monday
+
     Outcome fields (filled after completion -- ML training signal):
         actual_duration     -- how long it really took
         actual_time_of_day  -- when it was actually done
@@ -120,6 +131,15 @@ class Task(Base):
     """
 
     __tablename__ = "tasks"
+    # Schedule reads select a user's incomplete tasks by deadline range
+    # (routes/schedules.eligibility_clause); GET /tasks/ pages through them
+    # newest first by (created_at, id); GET /tasks/changes reads them by
+    # change_seq.
+    __table_args__ = (
+        Index("ix_tasks_user_completed_deadline", "user_id", "completed", "deadline"),
+        Index("ix_tasks_user_created", "user_id", "created_at", "id"),
+        Index("ix_tasks_user_change_seq", "user_id", "change_seq"),
+    )
 
     # ── Identity ──────────────────────────────────────────────────────────────
     id      : Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -133,6 +153,8 @@ class Task(Base):
     importance       : Mapped[int]           = mapped_column(Integer,  default=3)       # 1-5
     completed        : Mapped[bool]          = mapped_column(Boolean,  default=False)
     created_at       : Mapped[datetime]      = mapped_column(default=utcnow)
+    updated_at       : Mapped[datetime]      = mapped_column(default=utcnow)  # set by _track_changes
+    change_seq       : Mapped[int]           = mapped_column(Integer,  default=0, nullable=False)  # likewise
 
     # ── Task classification ────────────────────────────────────────────────────
     task_type : Mapped[str] = mapped_column(String(10), default="flexible", nullable=False)
@@ -142,6 +164,9 @@ class Task(Base):
     fixed_end   : Mapped[Optional[str]] = mapped_column(String(5), nullable=True)  # HH:MM
     location    : Mapped[Optional[str]] = mapped_column(String,    nullable=True)  # for travel time later
 
+    fixed_start_min : Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # derived from fixed_start
+    fixed_end_min   : Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # derived from fixed_end
+
     # ── Energy & time preference ───────────────────────────────────────────────
     energy_level          : Mapped[str]  = mapped_column(String(10), default="medium", nullable=False)
     preferred_time        : Mapped[str]  = mapped_column(String(10), default="none",   nullable=False)
@@ -150,6 +175,7 @@ class Task(Base):
     # ── Recurrence ────────────────────────────────────────────────────────────
     recurrence      : Mapped[str]           = mapped_column(String(10), default="none", nullable=False)
     recurrence_days : Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # "0,2,4"
+    recurrence_mask : Mapped[int]           = mapped_column(Integer, default=0, nullable=False)  # derived
 
     # ── Source / integrations ────────────────────────────────────────────────
     # source:
@@ -166,9 +192,24 @@ class Task(Base):
     times_rescheduled   : Mapped[int]                = mapped_column(Integer,    default=0, nullable=False)
     last_scheduled_date : Mapped[Optional[str]]      = mapped_column(String(10), nullable=True)  # YYYY-MM-DD
 
+    # ── Recurrence bookkeeping ────────────────────────────────────────────────
+    occurrences_through : Mapped[Optional[str]] = mapped_column(String(10), nullable=True)  # last materialized date
+
     # ── Relationships ─────────────────────────────────────────────────────────
-    owner    : Mapped["User"]              = relationship(back_populates="tasks")
-    feedback : Mapped[list["TaskFeedback"]] = relationship(back_populates="task", cascade="all, delete-orphan")
+    owner       : Mapped["User"]                 = relationship(back_populates="tasks")
+    feedback    : Mapped[list["TaskFeedback"]]   = relationship(back_populates="task", cascade="all, delete-orphan")
+    occurrences : Mapped[list["TaskOccurrence"]] = relationship(back_populates="task", cascade="all, delete-orphan")
+
+    # ── Derived columns ───────────────────────────────────────────────────────
+    @validates("fixed_start", "fixed_end")
+    def _set_fixed_minutes(self, key: str, value: Optional[str]) -> Optional[str]:
+        setattr(self, f"{key}_min", parse_hhmm(value))
+        return value
+
+    @validates("recurrence_days")
+    def _set_recurrence_mask(self, key: str, value: Optional[str]) -> Optional[str]:
+        self.recurrence_mask = weekday_mask(value)
+        return value
 
 
 class UserPreferences(Base):
@@ -333,3 +374,200 @@ class IntegrationCredential(Base):
     updated_at : Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
 
     user: Mapped["User"] = relationship()
+
+
+class ScheduleSnapshot(Base):
+    """
+    The materialized schedule for one user and date: written whenever
+    /schedules/today or /schedules/date/{date} builds one, and ahead of
+    time by the nightly batch job (backend/precompute.py).
+
+    Two fingerprints say what it was built from:
+        inputs_version -- the user's data_version plus the scheduler
+                          settings at build time. While it still matches,
+                          a read is served from this row alone.
+        inputs_hash    -- a hash of the day's eligible tasks, preferences
+                          and scheduler settings. Checked when the version
+                          moved on, since many edits do not touch this day.
+
+    result is the JSON-encoded schedule exactly as /schedules/* returns it;
+    blocks holds the same placements as rows, one per scheduled task.
+    """
+
+    __tablename__ = "schedule_snapshots"
+    __table_args__ = (UniqueConstraint("user_id", "date", name="uq_schedule_snapshots_user_date"),)
+
+    id             : Mapped[int]           = mapped_column(Integer, primary_key=True, index=True)
+    user_id        : Mapped[int]           = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    date           : Mapped[str]           = mapped_column(String(10), nullable=False)  # YYYY-MM-DD
+    inputs_hash    : Mapped[str]           = mapped_column(String(64), nullable=False)
+    inputs_version : Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
+    result         : Mapped[str]           = mapped_column(Text,       nullable=False)
+    built_at       : Mapped[datetime]      = mapped_column(DateTime, default=utcnow, nullable=False)
+
+    user   : Mapped["User"]                 = relationship()
+    blocks : Mapped[list["ScheduledBlock"]] = relationship(back_populates="snapshot", cascade="all, delete-orphan")
+
+
+class ScheduledBlock(Base):
+    """
+    One placed task in a materialized schedule (start/end in minutes since
+    midnight). user_id and date repeat the snapshot's so "what is on this
+    user's day" is one indexed query without the JSON.
+    """
+
+    __tablename__ = "scheduled_blocks"
+    __table_args__ = (Index("ix_scheduled_blocks_user_date", "user_id", "date"),)
+
+    id          : Mapped[int] = mapped_column(Integer, primary_key=True)
+    snapshot_id : Mapped[int] = mapped_column(ForeignKey("schedule_snapshots.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id     : Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    date        : Mapped[str] = mapped_column(String(10), nullable=False)  # YYYY-MM-DD
+    task_id     : Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    start_min   : Mapped[int] = mapped_column(Integer, nullable=False)
+    end_min     : Mapped[int] = mapped_column(Integer, nullable=False)
+
+    snapshot : Mapped["ScheduleSnapshot"] = relationship(back_populates="blocks")
+
+
+class TaskOccurrence(Base):
+    """
+    One day a recurring task falls on (see backend/recurrence.py). Rows are
+    written ahead over a rolling window; completing a recurring task checks
+    off its occurrence for that day and leaves Task.completed alone, so the
+    series carries on.
+    """
+
+    __tablename__ = "task_occurrences"
+    __table_args__ = (
+        UniqueConstraint("task_id", "date", name="uq_task_occurrences_task_date"),
+        Index("ix_task_occurrences_user_date", "user_id", "date"),
+    )
+
+    id           : Mapped[int]                = mapped_column(Integer, primary_key=True)
+    task_id      : Mapped[int]                = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    user_id      : Mapped[int]                = mapped_column(ForeignKey("users.id"), nullable=False)
+    date         : Mapped[str]                = mapped_column(String(10), nullable=False)  # YYYY-MM-DD
+    completed    : Mapped[bool]               = mapped_column(Boolean, default=False, nullable=False)
+    completed_at : Mapped[Optional[datetime]] = mapped_column(nullable=True)
+
+    task : Mapped["Task"] = relationship(back_populates="occurrences")
+
+
+class TaskTombstone(Base):
+    """
+    A deleted task, kept so GET /tasks/changes can tell a client holding a
+    copy to drop it. Written by _track_changes (and by the bulk deletes of
+    POST /tasks/bulk); task_id is not a foreign key since the row is gone.
+    """
+
+    __tablename__ = "task_tombstones"
+    __table_args__ = (Index("ix_task_tombstones_user_change_seq", "user_id", "change_seq"),)
+
+    id         : Mapped[int]      = mapped_column(Integer, primary_key=True)
+    user_id    : Mapped[int]      = mapped_column(ForeignKey("users.id"), nullable=False)
+    task_id    : Mapped[int]      = mapped_column(Integer, nullable=False)
+    deleted_at : Mapped[datetime] = mapped_column(DateTime, default=utcnow, nullable=False)
+    change_seq : Mapped[int]      = mapped_column(Integer, default=0, nullable=False)
+
+
+# ── Change tracking ──────────────────────────────────────────────────────────
+
+# Task columns the scheduler writes itself; changing them is not an input change.
+_UNTRACKED_TASK_COLUMNS = frozenset({"last_scheduled_date", "occurrences_through"})
+
+
+def _changes_inputs(obj: object) -> bool:
+    state = inspect(obj)
+    return any(
+        state.attrs[attr.key].history.has_changes()
+        for attr in state.mapper.column_attrs
+        if attr.key not in _UNTRACKED_TASK_COLUMNS
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _track_changes(session: Session, flush_context, instances) -> None:
+    """
+    Bump User.data_version for every user whose tasks or preferences this
+    flush changes. Occurrences count once they are completed: a new open
+    one only restates the task's recurrence rule.
+
+    New and changed tasks are stamped with the user's new data_version as
+    change_seq (and get a new updated_at); deleted ones leave a
+    TaskTombstone with the same stamp. GET /tasks/changes reads both.
+    """
+    now = utcnow()
+    user_ids = {
+        obj.user_id
+        for obj in (*session.new, *session.deleted)
+        if isinstance(obj, (Task, UserPreferences))
+        or (isinstance(obj, TaskOccurrence) and obj.completed)
+    }
+    changed = [obj for obj in session.new if isinstance(obj, Task)]
+    for obj in session.dirty:
+        if isinstance(obj, (Task, UserPreferences, TaskOccurrence)) and _changes_inputs(obj):
+            user_ids.add(obj.user_id)
+            if isinstance(obj, Task):
+                obj.updated_at = now
+                changed.append(obj)
+    user_ids.discard(None)
+    versions = bump_data_versions(session, user_ids)
+
+    for obj in changed:
+        obj.change_seq = versions.get(obj.user_id, 0)
+    gone = {obj.id for obj in session.deleted if isinstance(obj, User)}
+    for obj in session.deleted:
+        if isinstance(obj, Task) and obj.user_id not in gone:
+            session.add(TaskTombstone(
+                user_id=obj.user_id, task_id=obj.id, deleted_at=now, change_seq=versions[obj.user_id],
+            ))
+
+
+def bump_data_versions(session: Session, user_ids: set[int]) -> dict[int, int]:
+    """
+    Bump User.data_version for user_ids and return the new versions. Bulk
+    INSERT/UPDATE/DELETE statements bypass the flush hook above, so code
+    that changes inputs with them calls this itself (and stamps change_seq).
+
+    The new versions are also kept on the session for
+    take_data_version_bump(). The UPDATE holds the user rows until commit,
+    so no other writer can bump them in between: a user's versions are
+    handed out, and become visible, in commit order.
+    """
+    versions: dict[int, int] = {}
+    if user_ids:
+        session.execute(
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(data_version=User.data_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        transaction = session.get_transaction()
+        owner, bumps = session.info.get("data_version_bumps", (None, {}))
+        if owner is not transaction:
+            bumps = {}
+            session.info["data_version_bumps"] = (transaction, bumps)
+        for user_id, version in session.execute(
+            select(User.id, User.data_version).where(User.id.in_(user_ids))
+        ):
+            bumps[user_id] = (bumps.get(user_id, (version - 1,))[0], version)
+            versions[user_id] = version
+    return versions
+
+
+def take_data_version_bump(session: Session, user_id: int) -> tuple[int, int] | None:
+    """
+    (before, after) of the user's data_version across the bumps made by the
+    session's last writing transaction, or None if it made none (or they
+    were already taken). Only that one transaction counts, so whatever
+    changed from before to after is exactly what it wrote.
+    """
+    _, bumps = session.info.get("data_version_bumps", (None, {}))
+    return bumps.pop(user_id, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_data_version_bumps(session: Session, previous_transaction) -> None:
+    if session.info.get("data_version_bumps", (None,))[0] is previous_transaction:
+        del session.info["data_version_bumps"]
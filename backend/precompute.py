@@ -0,0 +1,239 @@
+"""
+precompute.py
+-------------
+Nightly batch job: build every active user's schedule for tomorrow ahead
+of time, so the first GET /schedules/today of the morning is a DB read
+instead of a scheduler run.
+
+    python -m backend.precompute                     # tomorrow, all CPUs
+    python -m backend.precompute --date 2030-01-07 --workers 4 --chunk-size 500
+
+Run it from cron (or any job runner) late in the evening, before midnight
+on the server's clock: "tomorrow" is taken from that clock, so a run after
+midnight would build the day after the one about to start. Pass --date to
+build a specific day, or call precompute_schedules() directly.
+
+How it works:
+  1. Active users are streamed from the DB in chunks of chunk_size (keyset
+     pagination on users.id, so memory stays flat however many users
+     there are). Each chunk costs five queries: users, their
+     preferences, their incomplete tasks that can be eligible in the
+     planning window (routes/schedules.eligibility_clause), what is
+     already materialized for the date and the recurring tasks already
+     completed for it.
+  2. For each user the semi-task plan is made starting on the date, and
+     the eligible tasks for the date are picked in the parent process
+     (same rules as GET /schedules/*) and turned into plain dicts.
+  3. The pure-CPU build_schedule() calls are farmed out to a
+     ProcessPoolExecutor. Jobs carry only dicts, never ORM objects.
+  4. Results are upserted into schedule_snapshots (with their
+     scheduled_blocks rows) stamped with the user's data_version and a
+     hash of their inputs; the read path only serves a snapshot while one
+     of those still matches (see routes/schedules._build_for_date).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date as date_type, timedelta
+from pathlib import Path
+from typing import Callable, Iterator
+
+if __package__ in (None, ""):  # pragma: no cover -- run as a plain script
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy.orm import Session
+
+from backend.database import Base, SessionLocal, engine
+from backend.models import ScheduledBlock, ScheduleSnapshot, Task, TaskOccurrence, User, UserPreferences
+from backend.routes.schedules import (
+    SCHEDULER_SETTINGS,
+    build_day,
+    eligibility_clause,
+    inputs_version,
+    is_eligible_on,
+    load_window,
+    prefs_to_dict,
+    store_snapshots,
+    task_to_dict,
+)
+from backend.schedule_cache import inputs_hash
+from backend.scheduler.horizon import plan_horizon
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 200
+
+# (user_id, date_str, task dicts, prefs dict or None, inputs_version)
+Job = tuple[int, str, list[dict], dict | None, str]
+
+# (user_id, date_str, inputs_hash, inputs_version, result)
+BuildResult = tuple[int, str, str, str, dict]
+
+
+# ── Loading ───────────────────────────────────────────────────────────────────
+
+def iter_jobs(db: Session, date_str: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[Job]]:
+    """Yield one list of build jobs per chunk of active users, in user id order."""
+    weekday = date_type.fromisoformat(date_str).weekday()
+    # Planned from date_str itself: that is "today" when the snapshot is read.
+    first, last, _ = load_window(date_str, date_str, date_str)
+    last_id = 0
+
+    while True:
+        versions = dict(
+            db.query(User.id, User.data_version)
+            .filter(User.is_active == True, User.id > last_id)
+            .order_by(User.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not versions:
+            return
+        user_ids = list(versions)
+        last_id  = user_ids[-1]
+
+        prefs_by_user = {
+            p.user_id: prefs_to_dict(p)
+            for p in db.query(UserPreferences).filter(UserPreferences.user_id.in_(user_ids))
+        }
+        scheduled_ids = {
+            task_id for (task_id,) in db.query(ScheduledBlock.task_id).filter(
+                ScheduledBlock.user_id.in_(user_ids), ScheduledBlock.date == date_str,
+            )
+        }
+        done = {
+            (task_id, date_str) for (task_id,) in db.query(TaskOccurrence.task_id).filter(
+                TaskOccurrence.user_id.in_(user_ids),
+                TaskOccurrence.date      == date_str,
+                TaskOccurrence.completed == True,
+            )
+        }
+        rows_by_user: dict[int, list[Task]] = {uid: [] for uid in user_ids}
+        for task in db.query(Task).filter(
+            Task.user_id.in_(user_ids), Task.completed == False, eligibility_clause(first, last),
+        ):
+            rows_by_user[task.user_id].append(task)
+
+        jobs = []
+        for uid in user_ids:
+            prefs = prefs_by_user.get(uid) or None
+            rows  = rows_by_user[uid]
+            plan  = plan_horizon(
+                [task_to_dict(t) for t in rows], prefs, date_str,
+                {t.id: t.last_scheduled_date for t in rows if t.last_scheduled_date},
+            )
+            tasks = [task_to_dict(t) for t in rows if is_eligible_on(t, date_str, weekday, scheduled_ids, plan, done)]
+            jobs.append((uid, date_str, tasks, prefs, inputs_version(versions[uid], date_str)))
+
+        yield jobs
+        db.expunge_all()
+
+
+# ── Building (runs in worker processes) ───────────────────────────────────────
+
+def build_job(job: Job) -> BuildResult:
+    """Build one user's day. Returns (user_id, date_str, inputs_hash, inputs_version, result)."""
+    user_id, date_str, tasks, prefs, version = job
+    digest = inputs_hash(tasks, prefs, SCHEDULER_SETTINGS)
+    return user_id, date_str, digest, version, build_day(tasks, prefs, date_str)
+
+
+# ── Saving ────────────────────────────────────────────────────────────────────
+
+def save_snapshots(db: Session, results: list[BuildResult]) -> None:
+    """Insert or replace the snapshot rows (and their blocks) for a chunk of results, then commit."""
+    if not results:
+        return
+    date_str = results[0][1]
+    existing = {
+        s.user_id: s
+        for s in db.query(ScheduleSnapshot).filter(
+            ScheduleSnapshot.date == date_str,
+            ScheduleSnapshot.user_id.in_([r[0] for r in results]),
+        )
+    }
+    rows = []
+    for user_id, _, digest, version, result in results:
+        row = existing.get(user_id)
+        if row is None:
+            row = ScheduleSnapshot(user_id=user_id, date=date_str)
+            db.add(row)
+        rows.append((row, digest, version, result))
+    store_snapshots(db, rows)
+    db.commit()
+
+
+# ── Entry points ──────────────────────────────────────────────────────────────
+
+def precompute_schedules(
+    date_str        : str | None = None,
+    workers         : int | None = None,
+    chunk_size      : int        = DEFAULT_CHUNK_SIZE,
+    session_factory : Callable[[], Session] = SessionLocal,
+) -> dict:
+    """
+    Build and store schedules for every active user for date_str
+    (default: tomorrow).
+
+    workers is the process pool size (default: CPU count). workers=0 builds
+    in this process, which is handy for tests and tiny installs.
+
+    Returns {"date", "users", "chunks"} counts.
+    """
+    date_str = date_str or (date_type.today() + timedelta(days=1)).isoformat()
+    users = chunks = 0
+
+    pool: Executor | None = None
+    if workers != 0:
+        workers = workers or os.cpu_count() or 1
+        pool    = ProcessPoolExecutor(max_workers=workers)
+
+    db = session_factory()
+    try:
+        for jobs in iter_jobs(db, date_str, chunk_size):
+            if pool is None:
+                results = [build_job(job) for job in jobs]
+            else:
+                batch   = max(1, len(jobs) // (4 * workers))
+                results = list(pool.map(build_job, jobs, chunksize=batch))
+            save_snapshots(db, results)
+            users  += len(results)
+            chunks += 1
+            logger.info("precompute %s: %d users done", date_str, users)
+    finally:
+        db.close()
+        if pool is not None:
+            pool.shutdown()
+
+    return {"date": date_str, "users": users, "chunks": chunks}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompute schedules for all active users.")
+    parser.add_argument("--date",       help="YYYY-MM-DD (default: tomorrow)")
+    parser.add_argument("--workers",    type=int, default=None, help="process pool size (0 = no pool)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="users loaded per batch")
+    args = parser.parse_args(argv)
+
+    if args.date:
+        try:
+            date_type.fromisoformat(args.date)
+        except ValueError:
+            parser.error("--date must be YYYY-MM-DD")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    Base.metadata.create_all(bind=engine)
+
+    stats = precompute_schedules(args.date, args.workers, args.chunk_size)
+    print(json.dumps(stats))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
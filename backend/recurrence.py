@@ -0,0 +1,219 @@
+"""
+recurrence.py
+-------------
+Materialized occurrences of recurring tasks.
+
+A recurring task (recurrence "daily", or "weekly" with recurrence_days)
+is one Task row. Every day it falls on gets a TaskOccurrence row, written
+ahead over a rolling window of OCCURRENCE_WINDOW_DAYS, and completion is
+tracked per occurrence: checking off today's run leaves tomorrow's alone.
+Task.completed still ends the whole series.
+
+    materialize()         -- write a task's missing occurrences for a span
+    sync_occurrences()    -- (re)write a task's window after it is created
+                             or its recurrence rule changes
+    extend_window()       -- top up every recurring task of a user; the
+                             schedule routes run it as a background task
+                             (schedule_extension) at most once a day per
+                             user, so reads never wait for it
+    completed_on()        -- (task_id, date) pairs checked off in a span:
+                             one range scan on ix_task_occurrences_user_date
+    completed_for()       -- the same for given tasks, for apply_task_changes()
+    complete_occurrence() -- check off one day of a recurring task
+
+Schedules only need the completed occurrences (is_eligible_on drops
+those). A date past the materialized window has no rows yet, so the
+recurrence rule alone decides it and a read never has to wait for the
+window to be extended.
+"""
+
+from datetime import date as date_type, datetime, timedelta, timezone
+from typing import Collection
+
+from fastapi import BackgroundTasks
+from sqlalchemy import insert, or_
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from backend.models import Task, TaskOccurrence, bump_data_versions
+
+# How far ahead occurrences are written.
+OCCURRENCE_WINDOW_DAYS = 28
+
+# extend_window() skips tasks still materialized at least this far ahead,
+# so the window is topped up in batches rather than one day per read.
+OCCURRENCE_REFILL_DAYS = 7
+
+# user id -> the day extend_window() was last scheduled for them (this
+# worker process only).
+_extended_on: dict[int, str] = {}
+
+
+def recurs(task: Task) -> bool:
+    """True for tasks that get occurrences (the recurrence branches of is_eligible_on)."""
+    return task.task_type != "fixed" and (
+        task.recurrence == "daily" or (task.recurrence == "weekly" and bool(task.recurrence_days))
+    )
+
+
+def occurrence_dates(task: Task, start_str: str, end_str: str) -> list[str]:
+    """The dates in start..end (inclusive) task falls on."""
+    if not recurs(task):
+        return []
+    start = date_type.fromisoformat(start_str)
+    days  = (date_type.fromisoformat(end_str) - start).days + 1
+    mask  = 0b1111111 if task.recurrence == "daily" else task.recurrence_mask or 0
+    return [
+        day.isoformat()
+        for day in (start + timedelta(days=i) for i in range(max(days, 0)))
+        if mask >> day.weekday() & 1
+    ]
+
+
+def window_end(today_str: str | None = None) -> str:
+    """Last date the rolling window reaches from today_str (default today)."""
+    today = date_type.fromisoformat(today_str) if today_str else date_type.today()
+    return (today + timedelta(days=OCCURRENCE_WINDOW_DAYS - 1)).isoformat()
+
+
+def materialize(db: Session, task: Task, start_str: str, end_str: str) -> int:
+    """
+    Write task's missing occurrences for start..end and move its
+    occurrences_through up to end_str. Flushes nothing itself; returns the
+    number of rows written.
+    """
+    have = {
+        d for (d,) in db.query(TaskOccurrence.date).filter(
+            TaskOccurrence.task_id == task.id,
+            TaskOccurrence.date.between(start_str, end_str),
+        )
+    }
+    rows = [
+        {"task_id": task.id, "user_id": task.user_id, "date": d}
+        for d in occurrence_dates(task, start_str, end_str) if d not in have
+    ]
+    if rows:
+        db.execute(insert(TaskOccurrence), rows)
+    if recurs(task) and (task.occurrences_through or "") < end_str:
+        task.occurrences_through = end_str
+    return len(rows)
+
+
+def sync_occurrences(db: Session, task: Task, today_str: str | None = None) -> None:
+    """
+    Rewrite task's open occurrences from today_str (default today) on to
+    match its current recurrence rule, and fill its window. Call after
+    creating a task or changing its recurrence; task must have an id.
+    Completed occurrences are history and stay.
+    """
+    today_str = today_str or date_type.today().isoformat()
+    db.query(TaskOccurrence).filter(
+        TaskOccurrence.task_id   == task.id,
+        TaskOccurrence.date      >= today_str,
+        TaskOccurrence.completed == False,
+    ).delete(synchronize_session=False)
+    task.occurrences_through = None
+    materialize(db, task, today_str, window_end(today_str))
+
+
+def extend_window(db: Session, user_id: int, today_str: str | None = None) -> int:
+    """
+    Top up the window of every incomplete recurring task of user_id whose
+    occurrences run out within OCCURRENCE_REFILL_DAYS, then commit.
+    Returns the number of rows written.
+
+    New rows show up in /analytics/daily, so writing any bumps the user's
+    data_version (it is a bulk insert, which the flush hook does not see).
+    """
+    today_str = today_str or date_type.today().isoformat()
+    end_str   = window_end(today_str)
+    low       = (date_type.fromisoformat(end_str) - timedelta(days=OCCURRENCE_REFILL_DAYS)).isoformat()
+
+    written = 0
+    for task in db.query(Task).filter(
+        Task.user_id   == user_id,
+        Task.completed == False,
+        Task.task_type != "fixed",
+        Task.recurrence.in_(("daily", "weekly")),
+        or_(Task.occurrences_through.is_(None), Task.occurrences_through < low),
+    ):
+        first = today_str
+        if task.occurrences_through and task.occurrences_through >= today_str:
+            first = (date_type.fromisoformat(task.occurrences_through) + timedelta(days=1)).isoformat()
+        written += materialize(db, task, first, end_str)
+    if written:
+        bump_data_versions(db, {user_id})
+    db.commit()
+    return written
+
+
+def _extend_window_job(bind: Engine | Connection, user_id: int, today_str: str) -> None:
+    with Session(bind=bind) as db:
+        extend_window(db, user_id, today_str)
+
+
+def schedule_extension(background: BackgroundTasks, db: Session, user_id: int) -> None:
+    """
+    Queue extend_window() for user_id to run after the response is sent,
+    at most once a day per user. It gets a session of its own on db's
+    engine, since the request's session is closed by then.
+    """
+    today_str = date_type.today().isoformat()
+    if _extended_on.get(user_id) == today_str:
+        return
+    _extended_on[user_id] = today_str
+    background.add_task(_extend_window_job, db.get_bind(), user_id, today_str)
+
+
+def completed_on(
+    db        : Session,
+    user_id   : int,
+    start_str : str | None = None,
+    end_str   : str | None = None,
+    task_ids  : Collection[int] | None = None,
+) -> set[tuple[int, str]]:
+    """(task_id, date) of user_id's completed occurrences, optionally limited to a span and tasks."""
+    query = db.query(TaskOccurrence.task_id, TaskOccurrence.date).filter(
+        TaskOccurrence.user_id   == user_id,
+        TaskOccurrence.completed == True,
+    )
+    if start_str is not None:
+        query = query.filter(TaskOccurrence.date >= start_str)
+    if end_str is not None:
+        query = query.filter(TaskOccurrence.date <= end_str)
+    if task_ids is not None:
+        query = query.filter(TaskOccurrence.task_id.in_(list(task_ids)))
+    return {(task_id, d) for task_id, d in query}
+
+
+def completed_for(db: Session, tasks: list[Task]) -> set[tuple[int, str]]:
+    """completed_on() for the recurring ones among tasks -- the done set apply_task_changes() takes."""
+    ids = [t.id for t in tasks if recurs(t)]
+    if not ids:
+        return set()
+    return completed_on(db, tasks[0].user_id, task_ids=ids)
+
+
+def complete_occurrence(db: Session, task: Task, date_str: str) -> TaskOccurrence:
+    """
+    Check off task's occurrence on date_str, writing the row if the window
+    has not reached that day yet. Raises ValueError if task does not fall
+    on date_str. Does not commit.
+    """
+    if not occurrence_dates(task, date_str, date_str):
+        raise ValueError(f"Task does not recur on {date_str}.")
+    occurrence = db.query(TaskOccurrence).filter(
+        TaskOccurrence.task_id == task.id,
+        TaskOccurrence.date    == date_str,
+    ).first()
+    if occurrence is None:
+        occurrence = TaskOccurrence(task_id=task.id, user_id=task.user_id, date=date_str)
+        db.add(occurrence)
+    occurrence.completed    = True
+    occurrence.completed_at = datetime.now(timezone.utc)
+    return occurrence
+
+
+def reset_extension_marks() -> None:
+    """Forget which users had their window extended today (for tests)."""
+    _extended_on.clear()
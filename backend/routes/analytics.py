@@ -5,18 +5,23 @@ Analytics endpoints.
 
 GET /analytics/daily?date=YYYY-MM-DD
     Returns all tasks relevant to a given date plus a category breakdown.
-    "Relevant" = completed that day (via completed_at) OR deadline == date.
+    "Relevant" = completed that day (via completed_at) OR deadline == date,
+    plus recurring tasks with an occurrence on the date (TaskOccurrence,
+    read with one range scan; completed per occurrence).
+    Answers If-None-Match with 304 while the user's tasks are unchanged
+    (see backend/etags.py).
 """
 
 from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
-from backend.models import Task, User
+from backend.models import Task, TaskOccurrence, User
 from backend.dependencies import get_db, get_current_user
+from backend.etags import conditional_get
 
 router = APIRouter()
 
@@ -31,6 +36,8 @@ def _format_duration(minutes: int) -> str:
 
 @router.get("/daily")
 def daily_summary(
+    request      : Request,
+    response     : Response,
     date         : str     = Query(..., description="Date in YYYY-MM-DD format"),
     db           : Session = Depends(get_db),
     current_user : User    = Depends(get_current_user),
@@ -39,6 +46,8 @@ def daily_summary(
     Returns tasks relevant to `date`:
       - Completed tasks where completed_at date == date
       - Any task whose deadline == date (completed or not)
+      - Recurring tasks with an occurrence on date, completed if that
+        occurrence is
 
     Response includes:
       - tasks list with title, duration_minutes, category, completed
@@ -46,16 +55,38 @@ def daily_summary(
       - total_formatted  e.g. "6h 30m"
       - by_category dict  e.g. { "Work": 120, "Study": 90 }
     """
+    not_modified = conditional_get(request, response, "analytics/daily", current_user.id, current_user.data_version, date)
+    if not_modified is not None:
+        return not_modified
+
     all_tasks = (
         db.query(Task)
         .filter(Task.user_id == current_user.id)
         .all()
     )
 
+    occurrences = (
+        db.query(TaskOccurrence)
+        .filter(TaskOccurrence.user_id == current_user.id, TaskOccurrence.date == date)
+        .all()
+    )
+
     seen_ids: set[int] = set()
     result: list[Task] = []
+    completed: dict[int, bool] = {}
+
+    # Recurring tasks: one row per day, completed on its own
+    tasks_by_id = {t.id: t for t in all_tasks}
+    for occurrence in occurrences:
+        task = tasks_by_id.get(occurrence.task_id)
+        if task is not None:
+            seen_ids.add(task.id)
+            result.append(task)
+            completed[task.id] = occurrence.completed
 
     for task in all_tasks:
+        if task.id in seen_ids:
+            continue
         # Include if deadline matches
         if task.deadline == date:
             seen_ids.add(task.id)
@@ -82,7 +113,7 @@ def daily_summary(
             "category"        : t.category,
             "duration_minutes": t.duration_minutes,
             "duration_label"  : _format_duration(t.duration_minutes),
-            "completed"       : t.completed,
+            "completed"       : completed.get(t.id, t.completed),
             "task_type"       : t.task_type,
             "fixed_start"     : t.fixed_start,
             "fixed_end"       : t.fixed_end,
@@ -9,7 +9,11 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from backend.dependencies import get_current_user, get_db
+from backend.event_hub import publish
 from backend.models import IntegrationCredential, Task, User, UserPreferences
+from backend.routes.schedules import apply_task_changes, task_to_dict
+from backend.scheduler.constraints import hhmm_to_min, validate_schedule
+from backend.scheduler.rule_based import fixed_and_flexible
 
 
 router = APIRouter(prefix="/calendar", tags=["calendar"])
@@ -102,6 +106,22 @@ class SyncResult(BaseModel):
     imported: int
     updated: int
     skipped: int
+    out_of_hours: int = 0  # synced events outside the user's wake/sleep window
+
+
+def _count_out_of_hours(tasks: list[Task], prefs: UserPreferences) -> int:
+    """Validate the synced events day by day; count those outside wake/sleep."""
+    by_day: dict[str, list[dict]] = {}
+    for t in tasks:
+        by_day.setdefault(t.deadline, []).append(task_to_dict(t))
+
+    day_start = hhmm_to_min(prefs.wake_time or "07:00")
+    day_end   = hhmm_to_min(prefs.sleep_time or "23:00")
+    count = 0
+    for day_tasks in by_day.values():
+        fixed, _ = fixed_and_flexible(day_tasks)
+        count += len(validate_schedule(fixed, day_start, day_end, buffer_minutes=0))
+    return count
 
 
 @router.post("/google/sync", response_model=SyncResult)
@@ -151,6 +171,7 @@ def sync_google_calendar(
     imported = 0
     updated = 0
     skipped = 0
+    touched: list[Task] = []
 
     page_token: Optional[str] = None
     while True:
@@ -251,6 +272,7 @@ def sync_google_calendar(
                     imported_at=_utc_now(),
                 )
                 db.add(t)
+                touched.append(t)
                 imported += 1
             else:
                 # Keep user completion; if they completed it, don't stomp fields.
@@ -268,6 +290,7 @@ def sync_google_calendar(
                 existing.external_provider = "google"
                 existing.external_id = str(external_id)
                 existing.imported_at = _utc_now()
+                touched.append(existing)
                 updated += 1
 
         page_token = data.get("nextPageToken")
@@ -275,5 +298,14 @@ def sync_google_calendar(
             break
 
     db.commit()
-    return SyncResult(imported=imported, updated=updated, skipped=skipped)
+    # Imported events are fixed tasks: cached days get them slotted in and
+    # only the flexible tasks they collide with are moved.
+    apply_task_changes(db, current_user.id, changed=touched)
+    publish(current_user.id, "sync.finished", provider="google", imported=imported, updated=updated, skipped=skipped)
+    return SyncResult(
+        imported=imported,
+        updated=updated,
+        skipped=skipped,
+        out_of_hours=_count_out_of_hours(touched, prefs),
+    )
 
@@ -0,0 +1,136 @@
+"""
+events.py
+---------
+Push channel for changes made on other devices.
+
+POST /events/ticket
+    A ticket for opening the stream from a browser EventSource, which
+    cannot set headers. It is valid for EVENT_TICKET_EXPIRE_SECONDS and
+    only for GET /events/stream, so the access token never goes in a URL
+    (where proxies and access logs would record it).
+
+GET /events/stream
+    Server-sent events (text/event-stream) for the current user's changes:
+    task created/updated/deleted, schedule invalidated, preferences
+    updated, calendar sync finished. See backend/event_hub.py for the
+    event types. Authenticate with the usual Bearer header, or with
+    ?ticket=<ticket from POST /events/ticket>. A ticket is checked when the
+    stream opens; once it has expired, EventSource's automatic reconnect
+    gets a 401, so fetch a fresh ticket and reconnect.
+
+Each event is sent as
+
+    event: task.updated
+    data: {"type":"task.updated","id":42}
+
+with a comment line every HEARTBEAT_SECONDS so proxies keep an idle
+stream open. Events carry ids only; clients refetch what they show (the
+read endpoints answer unchanged data with 304, see backend/etags.py).
+Nothing is replayed after a reconnect, so a client should refetch once
+when it (re)connects.
+
+The database session is released as soon as the user is authenticated:
+an open stream holds a queue and a suspended coroutine, not a connection.
+"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.orm import Session
+
+from backend.dependencies import credentials_exception, get_current_user, get_db, load_active_user
+from backend.event_hub import hub
+from backend.models import User
+from backend.security import EVENT_TICKET_EXPIRE_SECONDS, JWTError, create_event_ticket, decode_event_ticket
+
+router = APIRouter()
+
+# Seconds of silence before a keep-alive comment is sent.
+HEARTBEAT_SECONDS = 15
+
+# Like dependencies.oauth2_scheme, but lets ?ticket= stand in for the header.
+_optional_bearer = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def format_event(event: dict) -> str:
+    """One SSE message for an event dict."""
+    return f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+
+async def event_stream(
+    queue           : asyncio.Queue,
+    is_disconnected : Callable[[], Awaitable[bool]],
+    heartbeat       : float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """SSE text for the events arriving on queue, with heartbeats, until the client goes away."""
+    yield "retry: 5000\n\n"
+    while True:
+        try:
+            event = await asyncio.wait_for(queue.get(), heartbeat)
+        except asyncio.TimeoutError:
+            if await is_disconnected():
+                return
+            yield ": ping\n\n"
+            continue
+        yield format_event(event)
+
+
+def user_for_ticket(ticket: str, db: Session) -> User:
+    """The user an event ticket was issued to (401 if it is invalid or expired)."""
+    try:
+        user_id = int(decode_event_ticket(ticket)["sub"])
+    except (JWTError, ValueError, KeyError):
+        raise credentials_exception()
+    return load_active_user(db, user_id)
+
+
+# ── Routes ────────────────────────────────────────────────────────────────────
+
+@router.post("/ticket")
+def create_ticket(current_user: User = Depends(get_current_user)):
+    """Issue a short-lived ticket for GET /events/stream?ticket=..."""
+    return {"ticket": create_event_ticket(current_user.id), "expires_in": EVENT_TICKET_EXPIRE_SECONDS}
+
+
+@router.get("/stream")
+async def stream_events(
+    request : Request,
+    ticket  : Optional[str] = Query(None, description="From POST /events/ticket, for clients that cannot send headers"),
+    bearer  : Optional[str] = Depends(_optional_bearer),
+    db      : Session       = Depends(get_db),
+):
+    """Open the current user's event stream."""
+    if bearer:
+        user = await run_in_threadpool(get_current_user, bearer, db)
+    elif ticket:
+        user = await run_in_threadpool(user_for_ticket, ticket, db)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    user_id = user.id
+    db.close()  # streams stay open for hours; do not pin a pooled connection
+
+    queue = hub.subscribe(user_id)
+
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for chunk in event_stream(queue, request.is_disconnected):
+                yield chunk
+        finally:
+            hub.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        body(),
+        media_type = "text/event-stream",
+        headers    = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -6,7 +6,8 @@ Routes for saving and retrieving feedback.
 POST /feedback/task
     Save per-task feedback when a user marks a task complete.
     Updates the task itself (actual_duration, actual_time_of_day, completed_at)
-    and saves a TaskFeedback row.
+    and saves a TaskFeedback row. For a recurring task only its occurrence
+    on the feedback's date is completed.
     If the user said would_move=True and preferred_time_given is set,
     updates preferred_time on the task (unless preferred_time_locked=True).
 
@@ -34,7 +35,11 @@ from pydantic import BaseModel, field_validator
 from sqlalchemy.orm import Session
 
 from backend.dependencies import get_db, get_current_user
+from backend.event_hub import publish
 from backend.models import Task, User, TaskFeedback, DailyFeedback
+from backend.recurrence import completed_for
+from backend.routes.schedules import apply_task_changes
+from backend.routes.tasks import complete
 from backend.scheduler.constraints import time_of_day, hhmm_to_min
 from backend.scheduler.learning_engine import run_end_of_day_learning
 
@@ -131,7 +136,8 @@ def submit_task_feedback(
     Save feedback for a completed task.
 
     Also:
-    - Marks the task as completed with a timestamp
+    - Marks the task as completed with a timestamp (a recurring task:
+      its occurrence on body.date)
     - Saves actual_duration and actual_time_of_day back onto the task
     - Updates preferred_time on the task if would_move=True and not locked
     """
@@ -145,8 +151,7 @@ def submit_task_feedback(
         raise HTTPException(status_code=404, detail="Task not found.")
 
     # ── Mark task complete and record outcome fields ───────────────────────────
-    task.completed    = True
-    task.completed_at = utcnow()
+    complete(db, task, body.date)
 
     if body.actual_duration is not None:
         task.actual_duration = body.actual_duration
@@ -174,6 +179,8 @@ def submit_task_feedback(
     db.add(feedback)
     db.commit()
     db.refresh(feedback)
+    apply_task_changes(db, current_user.id, changed=[task], done=completed_for(db, [task]))
+    publish(current_user.id, "task.updated", id=task.id)
 
     return {
         "saved"   : True,
@@ -237,6 +244,9 @@ def submit_daily_feedback(
             date_str = body.date,
             db       = db,
         )
+        # Learning rewrites preference weights and tasks' preferred_time
+        publish(current_user.id, "preferences.updated")
+        publish(current_user.id, "schedule.invalidated")
 
     # Tell the frontend which periods are now complete
     response = {
@@ -15,14 +15,19 @@ GET /preferences/figures
 PUT /preferences
     Updates the user-set fields (wake_time, sleep_time, chronotype, timezone).
     ML-learned fields are read-only through this endpoint.
+
+GET /preferences answers If-None-Match with 304 while the preferences are
+unchanged (see backend/etags.py).
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from pydantic import BaseModel, field_validator
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from backend.dependencies import get_db, get_current_user
+from backend.etags import conditional_get
+from backend.event_hub import publish
 from backend.models import User, UserPreferences
 
 router = APIRouter()
@@ -90,10 +95,16 @@ class UpdatePreferencesRequest(BaseModel):
 
 @router.get("")
 def get_preferences(
+    request      : Request,
+    response     : Response,
     db           : Session = Depends(get_db),
     current_user : User    = Depends(get_current_user),
 ):
     """Return all preference fields for the current user."""
+    not_modified = conditional_get(request, response, "preferences", current_user.id, current_user.data_version)
+    if not_modified is not None:
+        return not_modified
+
     prefs = _get_or_create_prefs(current_user, db)
 
     return {
@@ -232,6 +243,8 @@ def update_preferences(
 
     db.commit()
     db.refresh(prefs)
+    publish(current_user.id, "preferences.updated")
+    publish(current_user.id, "schedule.invalidated")
 
     return {
         "saved"     : True,
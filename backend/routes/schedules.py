@@ -12,21 +12,100 @@ GET /schedules/date/{date}
     Same as above but for a specific date (YYYY-MM-DD).
     Useful for the weekly calendar view.
 
+GET /schedules/range?start=YYYY-MM-DD&end=YYYY-MM-DD
+    Schedules for every day in [start, end] (inclusive, max 31 days).
+    Tasks and preferences are loaded once for the whole range.
+
 POST /schedules/reschedule/{task_id}
-    Increments times_rescheduled on a task and regenerates today's schedule.
+    Increments times_rescheduled on a task and re-places it in today's schedule.
     Called when the user manually pushes a task to tomorrow.
+
+GET /schedules/cache/stats
+    Hit/miss/eviction counters for the in-process schedule cache.
+
+Profiling: add ?profile=true (or the header X-Schedule-Profile: 1) to any
+of the GET schedule routes to get a `_profile` block in the response --
+wall time per phase (db, planning, eligibility, free_slots, ranking,
+slot_search, constraints, serialization, overflow_filter) and counters such as cache hits and task
+counts. The same block is logged as one JSON line on the
+backend.routes.schedules logger, tagged with the user id.
+
+Semi-flexible tasks due on a later day are not offered to every day up to
+their deadline: horizon_plan() spreads them over those days in one pass
+(scheduler/horizon.py) and each day only gets the ones planned on it.
+The plan is cached next to the schedules, so a single-day read looks it up.
+
+Built schedules are cached per (user, date, data_version) -- see
+backend/schedule_cache.py. Every write to tasks or preferences bumps the
+user's data_version, so a cached schedule is never served after its
+inputs change. Task writes then call apply_task_changes(), which patches
+the user's cached days incrementally (scheduler/incremental.py) rather
+than leaving them to rebuild; a preference change still means a full
+rebuild.
+
+On a cache miss, /today and /date read the materialized schedule for the
+day (ScheduleSnapshot, written by every build and by the nightly
+precompute job in backend/precompute.py). While its inputs_version still
+matches the user's data_version that is the whole read: one indexed
+query. Otherwise the current inputs are loaded and hashed; an unchanged
+hash re-stamps the row, anything else rebuilds and writes the new
+schedule (and its ScheduledBlock rows) back.
+
+Recurring tasks are completed one day at a time (backend/recurrence.py):
+a checked-off TaskOccurrence drops the task from that day only. The
+schedule reads also queue the background job that keeps each user's
+occurrences materialized ahead.
+
+/today and /date answer If-None-Match with 304 while the day's inputs are
+unchanged: the ETag is inputs_version() plus the date and its time bucket,
+all known once the user is loaded (backend/etags.py). Profiled requests
+always build.
 """
 
-from datetime import date as date_type
-from fastapi import APIRouter, Depends, HTTPException
+import json
+import logging
+from datetime import date as date_type, datetime, timedelta, timezone
+from typing import Collection, Iterable
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request, Response
+from sqlalchemy import ColumnElement, and_, insert, not_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from backend.config import SCHEDULER_MODE, SCHEDULER_STEP_MINUTES, SCHEDULER_TIME_BUDGET_MS
 from backend.dependencies import get_db, get_current_user
-from backend.models import Task, User, UserPreferences
-from backend.scheduler.rule_based import build_schedule
+from backend.etags import conditional_get
+from backend.event_hub import publish
+from backend.models import ScheduledBlock, ScheduleSnapshot, Task, User, UserPreferences, take_data_version_bump
+from backend.recurrence import completed_for, completed_on, recurs, schedule_extension
+from backend.schedule_cache import (
+    CachedPlan,
+    CachedSchedule,
+    cache_key,
+    inputs_hash,
+    now_bucket,
+    plan_cache,
+    plan_key,
+    schedule_cache,
+)
+from backend.scheduler.horizon import MAX_HORIZON_DAYS, HorizonPlan, plan_horizon
+from backend.scheduler.incremental import patch_schedule
+from backend.scheduler.profiling import NO_PROFILE, Profile
+from backend.scheduler.rule_based import build_schedule, earliest_start
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+# Longest span GET /schedules/range will build in one request.
+MAX_RANGE_DAYS = 31
+
+# Scheduler settings that change the output; part of every inputs_hash().
+SCHEDULER_SETTINGS = {"mode": SCHEDULER_MODE, "step_minutes": SCHEDULER_STEP_MINUTES}
+
+# Short fingerprint of SCHEDULER_SETTINGS, so a deploy that changes them
+# invalidates every materialized schedule's inputs_version.
+SETTINGS_DIGEST = inputs_hash([], None, SCHEDULER_SETTINGS)[:16]
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
@@ -70,6 +149,8 @@ def task_to_dict(task: Task) -> dict:
         "preferred_time_locked": task.preferred_time_locked,
         "fixed_start"         : task.fixed_start,
         "fixed_end"           : task.fixed_end,
+        "fixed_start_min"     : task.fixed_start_min,
+        "fixed_end_min"       : task.fixed_end_min,
         "recurrence"          : task.recurrence,
         "recurrence_days"     : task.recurrence_days,
         "times_rescheduled"   : task.times_rescheduled,
@@ -78,9 +159,13 @@ def task_to_dict(task: Task) -> dict:
 
 
 def get_tasks_for_date(
-    user_id   : int,
-    date_str  : str,
-    db        : Session,
+    user_id       : int,
+    date_str      : str,
+    db            : Session,
+    profile       : Profile | None = None,
+    scheduled_ids : Iterable[int]  = (),
+    prefs         : dict | None    = None,
+    data_version  : int | None     = None,
 ) -> list[Task]:
     """
     Return all tasks that should appear on a given date for a user.
@@ -91,78 +176,400 @@ def get_tasks_for_date(
       - Recurring tasks that fall on this day of week
       - Fixed tasks whose fixed_start date matches (deadline used as date anchor)
       - Excludes completed tasks
+
+    scheduled_ids are the tasks already materialized on this date (see
+    is_eligible_on); prefs (None = defaults) size the days of the semi-task
+    plan, which is cached under the user's data_version when given.
+    Recurring tasks already completed for date_str are left out.
+
+    The rules run in SQL (eligibility_clause), so only candidate rows are
+    loaded. When the date is inside the semi-task plan's window the query
+    covers the whole window, because the plan needs every day's tasks.
     """
-    from datetime import date as date_type
     try:
         target_date = date_type.fromisoformat(date_str)
     except ValueError:
         return []
 
-    day_of_week = str(target_date.weekday())  # 0=Mon, 6=Sun
+    weekday = target_date.weekday()  # 0=Mon, 6=Sun
+    prof    = profile or NO_PROFILE
+
+    lo, hi, planned = load_window(date_str, date_str, date_type.today().isoformat())
+
+    with prof.phase("db"):
+        all_tasks = (
+            db.query(Task)
+            .filter(Task.user_id == user_id, Task.completed == False, eligibility_clause(lo, hi))
+            .all()
+        )
+        done = completed_on(db, user_id, date_str, date_str) if any(recurs(t) for t in all_tasks) else set()
+
+    with prof.phase("planning"):
+        plan = horizon_plan(user_id, data_version, all_tasks, prefs) if planned else None
 
-    all_tasks = (
-        db.query(Task)
-        .filter(Task.user_id == user_id, Task.completed == False)
-        .all()
+    with prof.phase("eligibility"):
+        scheduled_ids = set(scheduled_ids)
+        eligible = [t for t in all_tasks if is_eligible_on(t, date_str, weekday, scheduled_ids, plan, done)]
+    prof.count("tasks_loaded", len(all_tasks))
+    prof.count("tasks_eligible", len(eligible))
+    return eligible
+
+
+def eligibility_clause(start_str: str, end_str: str) -> ColumnElement[bool]:
+    """
+    SQL version of is_eligible_on() for the dates start_str..end_str: true
+    for a task that is eligible on at least one of them. Pass the same date
+    twice for a single day.
+
+    It matches is_eligible_on() exactly except for semi-flexible tasks due
+    later, which all pass here, and recurring tasks completed for the day
+    -- the horizon plan, last_scheduled_date, scheduled_ids and completed
+    occurrences are applied to the loaded rows by is_eligible_on(). Add
+    the user and completed filters alongside; with them the query walks
+    ix_tasks_user_completed_deadline.
+    """
+    weekly_days = and_(
+        Task.recurrence == "weekly",
+        Task.recurrence_days.is_not(None),
+        Task.recurrence_days != "",
+    )
+    return or_(
+        and_(Task.task_type == "fixed", Task.deadline.between(start_str, end_str)),
+        and_(Task.task_type != "fixed", Task.recurrence == "daily"),
+        and_(Task.task_type != "fixed", weekly_days, Task.recurrence_mask.op("&")(weekdays_between(start_str, end_str)) != 0),
+        and_(
+            Task.task_type != "fixed",
+            Task.recurrence != "daily",
+            not_(weekly_days),
+            or_(
+                Task.deadline.is_(None),
+                Task.deadline.between(start_str, end_str),
+                and_(Task.task_type == "semi", Task.deadline > end_str),
+            ),
+        ),
     )
 
-    eligible = []
-    for task in all_tasks:
-        # Fixed tasks: include if deadline matches target date
-        if task.task_type == "fixed":
-            if task.deadline == date_str:
-                eligible.append(task)
-            continue
 
-        # Recurring daily: always include
-        if task.recurrence == "daily":
-            eligible.append(task)
-            continue
+def weekdays_between(start_str: str, end_str: str) -> int:
+    """Weekday bitmask (bit 0 = Monday, as Task.recurrence_mask) of the dates start..end."""
+    first = date_type.fromisoformat(start_str)
+    days  = (date_type.fromisoformat(end_str) - first).days + 1
+    mask  = 0
+    for i in range(min(days, 7)):
+        mask |= 1 << (first + timedelta(days=i)).weekday()
+    return mask
 
-        # Recurring weekly: include if today is in recurrence_days
-        if task.recurrence == "weekly" and task.recurrence_days:
-            if day_of_week in task.recurrence_days.split(","):
-                eligible.append(task)
-            continue
 
-        # Non-recurring: include if deadline is today or no deadline
-        if task.deadline is None or task.deadline == date_str:
-            eligible.append(task)
-            continue
+def load_window(start_str: str, end_str: str, plan_start: str) -> tuple[str, str, bool]:
+    """
+    (first, last, planned): the dates to load tasks for to build start..end.
 
-        # Semi-flexible tasks with a future deadline still get scheduled today
-        # if they haven't been placed yet (last_scheduled_date is not today)
-        if task.task_type == "semi" and task.deadline and task.deadline >= date_str:
-            if task.last_scheduled_date != date_str:
-                eligible.append(task)
+    If start..end overlaps the semi-task plan starting on plan_start, the
+    window is widened to cover the plan as well and planned is True;
+    otherwise it is start..end and no plan is needed.
+    """
+    plan_end = (date_type.fromisoformat(plan_start) + timedelta(days=MAX_HORIZON_DAYS - 1)).isoformat()
+    if start_str > plan_end or end_str < plan_start:
+        return start_str, end_str, False
+    return min(start_str, plan_start), max(end_str, plan_end), True
+
+
+def build_day(
+    tasks    : list[dict],
+    prefs    : dict | None,
+    date_str : str,
+    profile  : Profile | None = None,
+) -> dict:
+    """
+    Build one day from already-loaded eligible task dicts: build_schedule(),
+    then filter_overflow() as its own stage, so the result is what the
+    routes return. Pure -- no DB access -- so the precompute job can run it
+    in worker processes.
+    """
+    prof   = profile or NO_PROFILE
+    result = build_schedule(
+        tasks          = tasks,
+        prefs          = prefs,
+        today_str      = date_str,
+        mode           = SCHEDULER_MODE,
+        time_budget_ms = SCHEDULER_TIME_BUDGET_MS,
+        step_minutes   = SCHEDULER_STEP_MINUTES,
+        profile        = profile,
+    )
+    with prof.phase("overflow_filter"):
+        result["overflow"] = filter_overflow(result["overflow"], {t["id"]: t for t in tasks}, date_str)
+    return result
+
+
+def filter_overflow(overflow: list[dict], task_dicts: dict[int, dict], date_str: str) -> list[dict]:
+    """
+    The overflow tasks to show as "didn't fit", looked up in task_dicts
+    (the day's task dicts keyed by id -- the ones the day was built from).
+
+    Only semi-flexible tasks due on date_str are shown. Flexible tasks and
+    semi-flexible tasks with later deadlines remain available for other
+    days, so they don't appear. An entry whose task is not in task_dicts is
+    kept rather than silently dropped.
+    """
+    filtered = []
+    for overflow_task in overflow:
+        task = task_dicts.get(overflow_task["task_id"])
+        if task is None or (task["task_type"] == "semi" and task["deadline"] == date_str):
+            filtered.append(overflow_task)
+    return filtered
+
+
+def is_eligible_on(
+    task          : Task,
+    date_str      : str,
+    weekday       : int,
+    scheduled_ids : Collection[int]             = (),
+    plan          : HorizonPlan | None          = None,
+    done          : Collection[tuple[int, str]] = (),
+) -> bool:
+    """
+    Eligibility rules for a single incomplete task on one date.
+    weekday is the date's weekday (0=Mon ... 6=Sun); scheduled_ids are the
+    tasks placed in the schedule materialized for date_str, if any; plan
+    is the user's semi-task horizon plan, if any; done holds the
+    (task_id, date) of completed occurrences of recurring tasks.
+    """
+    # Fixed tasks: include if deadline matches target date
+    if task.task_type == "fixed":
+        return task.deadline == date_str
+
+    # Recurring daily: always include, unless this day's run is done
+    if task.recurrence == "daily":
+        return (task.id, date_str) not in done
+
+    # Recurring weekly: include if today is in recurrence_days
+    if task.recurrence == "weekly" and task.recurrence_days:
+        return bool((task.recurrence_mask or 0) >> weekday & 1) and (task.id, date_str) not in done
+
+    # Semi-flexible tasks due later: only on the day the horizon plan gave them
+    if plan is not None and task.id in plan.days and plan.covers(date_str):
+        return plan.days[task.id] == date_str
+
+    # Non-recurring: include if deadline is today or no deadline
+    if task.deadline is None or task.deadline == date_str:
+        return True
+
+    # Outside the plan (no plan given, or a date it does not cover):
+    # semi-flexible tasks with a future deadline still get scheduled today
+    # if they haven't been placed yet (last_scheduled_date is not today).
+    # Being placed today is what set last_scheduled_date, so a task in
+    # today's materialized schedule keeps its slot when the day is rebuilt.
+    if task.task_type == "semi" and task.deadline and task.deadline >= date_str:
+        return task.last_scheduled_date != date_str or task.id in scheduled_ids
+
+    return False
+
+
+def horizon_plan(
+    user_id      : int,
+    data_version : int | None,
+    tasks        : list[Task],
+    prefs        : dict | None,
+    start_str    : str | None = None,
+) -> HorizonPlan:
+    """
+    The user's semi-task plan from start_str (default today): from
+    plan_cache, or planned now from tasks and cached. tasks must hold every
+    incomplete task eligible somewhere in the plan's window (load_window).
+    Without the user's data_version the plan is neither looked up nor cached.
+    """
+    start_str = start_str or date_type.today().isoformat()
+    key       = plan_key(user_id, start_str, data_version)
+    cached    = plan_cache.get(key) if data_version is not None else None
+    if cached is not None:
+        return cached.plan
+
+    task_dicts = [task_to_dict(t) for t in tasks]
+    pins       = {t.id: t.last_scheduled_date for t in tasks if t.last_scheduled_date}
+    plan       = plan_horizon(task_dicts, prefs, start_str, pins)
+    if data_version is not None:
+        plan_cache.put(key, CachedPlan(plan, task_dicts, pins, prefs))
+    return plan
+
+
+def _schedule_etag(request: Request, response: Response, user: User, date_str: str) -> Response | None:
+    """conditional_get() for one day: the same inputs its snapshot stamp and cache key use."""
+    version = inputs_version(user.data_version, date_type.today().isoformat())
+    return conditional_get(request, response, "schedule", user.id, version, date_str, now_bucket(date_str))
+
+
+# ── Profiling ─────────────────────────────────────────────────────────────────
+
+def get_profile(
+    profile            : bool       = Query(False, description="Add a _profile block with per-phase timings"),
+    x_schedule_profile : str | None = Header(None),
+) -> Profile | None:
+    """A fresh Profile if the client asked for one (query flag or header), else None."""
+    if profile or (x_schedule_profile or "").lower() in ("1", "true", "yes"):
+        return Profile()
+    return None
 
-    return eligible
+
+def _with_profile(result: dict, profile: Profile | None, user_id: int, route: str) -> dict:
+    """Log the profile and return a copy of result with it attached (cached dicts stay clean)."""
+    if profile is None:
+        return result
+    block = profile.as_dict()
+    logger.info("schedule_profile %s", json.dumps({"user_id": user_id, "route": route, **block}, sort_keys=True))
+    return {**result, "_profile": block}
 
 
 # ── Routes ────────────────────────────────────────────────────────────────────
 
 @router.get("/today")
 def get_todays_schedule(
-    db           : Session = Depends(get_db),
-    current_user : User    = Depends(get_current_user),
+    request      : Request,
+    response     : Response,
+    background   : BackgroundTasks,
+    db           : Session        = Depends(get_db),
+    current_user : User           = Depends(get_current_user),
+    profile      : Profile | None = Depends(get_profile),
 ):
     """Generate and return today's schedule for the authenticated user."""
     today_str = date_type.today().isoformat()
-    return _build_for_date(current_user, today_str, db)
+    schedule_extension(background, db, current_user.id)
+    if profile is None:
+        not_modified = _schedule_etag(request, response, current_user, today_str)
+        if not_modified is not None:
+            return not_modified
+
+    result = _build_for_date(current_user, today_str, db, profile)
+    return _with_profile(result, profile, current_user.id, "today")
 
 
 @router.get("/date/{date_str}")
 def get_schedule_for_date(
     date_str     : str,
-    db           : Session = Depends(get_db),
-    current_user : User    = Depends(get_current_user),
+    request      : Request,
+    response     : Response,
+    background   : BackgroundTasks,
+    db           : Session        = Depends(get_db),
+    current_user : User           = Depends(get_current_user),
+    profile      : Profile | None = Depends(get_profile),
 ):
     """Generate and return the schedule for a specific date (YYYY-MM-DD)."""
     try:
         date_type.fromisoformat(date_str)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
-    return _build_for_date(current_user, date_str, db)
+    schedule_extension(background, db, current_user.id)
+    if profile is None:
+        not_modified = _schedule_etag(request, response, current_user, date_str)
+        if not_modified is not None:
+            return not_modified
+
+    result = _build_for_date(current_user, date_str, db, profile)
+    return _with_profile(result, profile, current_user.id, "date")
+
+
+@router.get("/range")
+def get_schedule_range(
+    background   : BackgroundTasks,
+    start        : str            = Query(..., description="First date, YYYY-MM-DD"),
+    end          : str            = Query(..., description="Last date (inclusive), YYYY-MM-DD"),
+    db           : Session        = Depends(get_db),
+    current_user : User           = Depends(get_current_user),
+    profile      : Profile | None = Depends(get_profile),
+):
+    """
+    Build the schedule for every date from start to end in one request.
+
+    Tasks (the candidates for the range, see eligibility_clause),
+    preferences and the materialized blocks for the range are queried
+    once and the semi-task plan is looked up once; eligibility for
+    each day is worked out in memory, so a week costs three queries
+    instead of a full _build_for_date per day. Days already in the
+    schedule cache are reused, and if every day is cached the database is
+    not touched at all.
+    """
+    try:
+        start_date = date_type.fromisoformat(start)
+        end_date   = date_type.fromisoformat(end)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
+
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end must not be before start.")
+    if (end_date - start_date).days + 1 > MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range too long. At most {MAX_RANGE_DAYS} days per request.",
+        )
+
+    dates = [
+        start_date + timedelta(days=i)
+        for i in range((end_date - start_date).days + 1)
+    ]
+    prof    = profile or NO_PROFILE
+    keys    = [cache_key(current_user.id, d.isoformat(), current_user.data_version) for d in dates]
+    entries = [schedule_cache.get(key) for key in keys]
+    days    = [entry.result if entry else None for entry in entries]
+    prof.count("cache_hits", sum(entry is not None for entry in entries))
+
+    if any(result is None for result in days):
+        lo, hi, planned = load_window(start, end, date_type.today().isoformat())
+        with prof.phase("db"):
+            prefs_obj = db.query(UserPreferences).filter(
+                UserPreferences.user_id == current_user.id
+            ).first()
+            prefs_dict = prefs_to_dict(prefs_obj)
+
+            all_tasks = (
+                db.query(Task)
+                .filter(Task.user_id == current_user.id, Task.completed == False, eligibility_clause(lo, hi))
+                .all()
+            )
+
+            scheduled_ids: dict[str, set[int]] = {}
+            for block_date, task_id in db.query(ScheduledBlock.date, ScheduledBlock.task_id).filter(
+                ScheduledBlock.user_id == current_user.id,
+                ScheduledBlock.date.between(start_date.isoformat(), end_date.isoformat()),
+            ):
+                scheduled_ids.setdefault(block_date, set()).add(task_id)
+
+            done = set()
+            if any(recurs(t) for t in all_tasks):
+                done = completed_on(db, current_user.id, start_date.isoformat(), end_date.isoformat())
+        task_dicts = {t.id: task_to_dict(t) for t in all_tasks}
+        prefs      = prefs_dict if prefs_dict else None
+        prof.count("tasks_loaded", len(all_tasks))
+
+        with prof.phase("planning"):
+            plan = horizon_plan(current_user.id, current_user.data_version, all_tasks, prefs) if planned else None
+
+        for i, day in enumerate(dates):
+            if days[i] is not None:
+                continue
+            date_str    = day.isoformat()
+            weekday     = day.weekday()
+            with prof.phase("eligibility"):
+                placed   = scheduled_ids.get(date_str, set())
+                eligible = [
+                    task_dicts[t.id] for t in all_tasks
+                    if is_eligible_on(t, date_str, weekday, placed, plan, done)
+                ]
+
+            result = build_day(eligible, prefs, date_str, profile)
+            schedule_cache.put(keys[i], CachedSchedule(result, eligible, prefs))
+            days[i] = result
+            prof.count("days_built")
+
+    schedule_extension(background, db, current_user.id)
+    result = {"start": start, "end": end, "days": days}
+    return _with_profile(result, profile, current_user.id, "range")
+
+
+@router.get("/cache/stats")
+def get_schedule_cache_stats(
+    current_user : User = Depends(get_current_user),
+):
+    """Counters for sizing the schedule cache (this worker process only)."""
+    return schedule_cache.stats()
 
 
 @router.post("/reschedule/{task_id}")
@@ -186,54 +593,245 @@ def reschedule_task(
 
     task.times_rescheduled += 1
     db.commit()
+    apply_task_changes(db, current_user.id, changed=[task], done=completed_for(db, [task]))
+    publish(current_user.id, "task.updated", id=task.id)
 
-    # Return the refreshed schedule without this task
+    # Cached days were patched in place: the task was lifted out and
+    # re-placed with its higher rescheduling count, nothing else moved.
     today_str = date_type.today().isoformat()
     return _build_for_date(current_user, today_str, db)
 
 
 # ── Internal builder ──────────────────────────────────────────────────────────
 
-def _build_for_date(user: User, date_str: str, db: Session) -> dict:
+def _build_for_date(
+    user     : User,
+    date_str : str,
+    db       : Session,
+    profile  : Profile | None = None,
+) -> dict:
     """Shared logic for building a schedule for any date."""
+    prof   = profile or NO_PROFILE
+    key    = cache_key(user.id, date_str, user.data_version)
+    cached = schedule_cache.get(key)
+    if cached is not None:
+        prof.count("cache_hits")
+        return cached.result
+
+    # Read the version before any inputs, so a concurrent edit can only
+    # make the stamp older than what was built, never newer.
+    version = inputs_version(user.data_version, date_type.today().isoformat())
+
+    # Materialized and nothing changed since? Then this is the whole read.
+    with prof.phase("db"):
+        snapshot = db.query(ScheduleSnapshot).filter(
+            ScheduleSnapshot.user_id == user.id,
+            ScheduleSnapshot.date    == date_str,
+        ).first()
+    if snapshot is not None and snapshot.inputs_version == version:
+        result = _usable_snapshot(snapshot, date_str)
+        if result is not None:
+            prof.count("snapshot_hits")
+            return result
+
     # Get user preferences (or None -- scheduler falls back to defaults)
-    prefs_obj  = db.query(UserPreferences).filter(
-        UserPreferences.user_id == user.id
-    ).first()
-    prefs_dict = prefs_to_dict(prefs_obj)
+    with prof.phase("db"):
+        prefs_obj  = db.query(UserPreferences).filter(
+            UserPreferences.user_id == user.id
+        ).first()
+        prefs_dict = prefs_to_dict(prefs_obj)
+        # Tasks placed on this day before stay eligible for it (see is_eligible_on)
+        scheduled_ids = {b.task_id for b in snapshot.blocks} if snapshot is not None else set()
 
     # Get eligible tasks for this date
-    tasks     = get_tasks_for_date(user.id, date_str, db)
+    prefs      = prefs_dict if prefs_dict else None
+    tasks      = get_tasks_for_date(user.id, date_str, db, profile, scheduled_ids, prefs, user.data_version)
     task_dicts = [task_to_dict(t) for t in tasks]
+    digest     = inputs_hash(task_dicts, prefs, SCHEDULER_SETTINGS)
+
+    # The edits since were to other days: re-stamp the row and serve it.
+    if snapshot is not None and snapshot.inputs_hash == digest:
+        result = _usable_snapshot(snapshot, date_str)
+        if result is not None:
+            prof.count("snapshot_hits")
+            with prof.phase("db"):
+                snapshot.inputs_version = version
+                _commit_snapshot(db)
+            schedule_cache.put(key, CachedSchedule(result, task_dicts, prefs))
+            return result
 
     # Build and return schedule
-    result = build_schedule(
-        tasks     = task_dicts,
-        prefs     = prefs_dict if prefs_dict else None,
-        today_str = date_str,
-    )
+    result = build_day(task_dicts, prefs, date_str, profile)
 
-    # Filter overflow tasks: don't show flexible tasks or semi-flexible tasks
-    # that aren't due today as "didn't fit" - they remain available for scheduling
-    filtered_overflow = []
-    for overflow_task in result["overflow"]:
-        # Find the original task to check its type and deadline
-        task = db.query(Task).filter(
-            Task.id == overflow_task["task_id"],
-            Task.user_id == user.id
-        ).first()
+    with prof.phase("db"):
+        if snapshot is None:
+            snapshot = ScheduleSnapshot(user_id=user.id, date=date_str)
+            db.add(snapshot)
+        store_snapshots(db, [(snapshot, digest, version, result)])
+        _commit_snapshot(db)
 
-        if task:
-            # Only include in overflow if it's a semi-flexible task due today
-            if task.task_type == "semi" and task.deadline == date_str:
-                filtered_overflow.append(overflow_task)
-            # Flexible tasks and semi-flexible tasks with future deadlines
-            # remain available and don't appear in "didn't fit"
-        else:
-            # Fallback: include if we can't find the task
-            filtered_overflow.append(overflow_task)
+    schedule_cache.put(key, CachedSchedule(result, task_dicts, prefs))
+    return result
 
-    # Update the result with filtered overflow
-    result["overflow"] = filtered_overflow
 
+def _usable_snapshot(snapshot: ScheduleSnapshot, date_str: str) -> dict | None:
+    """
+    The stored schedule, or None if (for today) it has flexible tasks in
+    slots the scheduler would no longer use because they are about to pass.
+    """
+    result = json.loads(snapshot.result)
+    cutoff = earliest_start(date_str)
+    if any(t["task_type"] != "fixed" and t["start_min"] < cutoff for t in result["scheduled"]):
+        return None
     return result
+
+
+def _commit_snapshot(db: Session) -> None:
+    """
+    Commit a materialized schedule written during a read. Losing the race
+    to another request writing the same day is fine -- its row is as good.
+    """
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+
+
+# ── Materialized schedules ────────────────────────────────────────────────────
+
+def inputs_version(data_version: int, plan_start: str) -> str:
+    """
+    The ScheduleSnapshot.inputs_version stamp for a user's data_version,
+    with plan_start the first day of the semi-task plan it was built with.
+    """
+    return f"{data_version}:{SETTINGS_DIGEST}:{plan_start}"
+
+
+def store_snapshots(
+    db        : Session,
+    snapshots : list[tuple[ScheduleSnapshot, str, str, dict]],
+) -> None:
+    """
+    Fill in (snapshot, inputs_hash, inputs_version, result) rows, replace
+    their ScheduledBlock rows and set last_scheduled_date on the non-fixed
+    tasks they place. Flushes but does not commit.
+
+    Blocks are swapped with one bulk delete and one multi-row insert for
+    the whole batch, so the statement count does not grow with the number
+    of tasks placed, and the nightly job pays the same few statements per
+    chunk as a single read.
+    """
+    for snapshot, digest, version, result in snapshots:
+        snapshot.inputs_hash    = digest
+        snapshot.inputs_version = version
+        snapshot.result         = json.dumps(result)
+        snapshot.built_at       = datetime.now(timezone.utc)
+    db.flush()  # new rows need their ids
+
+    db.query(ScheduledBlock).filter(
+        ScheduledBlock.snapshot_id.in_([s.id for s, *_ in snapshots])
+    ).delete()
+
+    blocks = []
+    placed: dict[str, list[int]] = {}
+    for snapshot, _, _, result in snapshots:
+        for st in result["scheduled"]:
+            blocks.append({
+                "snapshot_id": snapshot.id,
+                "user_id"    : snapshot.user_id,
+                "date"       : snapshot.date,
+                "task_id"    : st["task_id"],
+                "start_min"  : st["start_min"],
+                "end_min"    : st["end_min"],
+            })
+            if st["task_type"] != "fixed":
+                placed.setdefault(snapshot.date, []).append(st["task_id"])
+    if blocks:
+        db.execute(insert(ScheduledBlock), blocks)
+
+    # A bulk UPDATE, not attribute sets: this is the scheduler's own
+    # bookkeeping and must not bump the users' data_version.
+    for date_str, task_ids in placed.items():
+        db.query(Task).filter(Task.id.in_(task_ids)).update(
+            {Task.last_scheduled_date: date_str}, synchronize_session=False,
+        )
+
+
+# ── Incremental cache maintenance ─────────────────────────────────────────────
+
+def apply_task_changes(
+    db          : Session,
+    user_id     : int,
+    changed     : Iterable[Task]              = (),
+    removed_ids : Iterable[int]               = (),
+    done        : Collection[tuple[int, str]] = (),
+) -> None:
+    """
+    Call after committing a write to a user's tasks.
+
+    changed     : Task rows that were created or updated (including ones
+                  that were just completed -- they drop out as ineligible)
+    removed_ids : ids of Task rows that were deleted
+    done        : (task_id, date) of the changed recurring tasks' completed
+                  occurrences (see is_eligible_on)
+
+    The commit moved the user's data_version on (take_data_version_bump()
+    gives the versions before and after). Every schedule cached under the
+    old one is patched with patch_schedule() and stored under the new one.
+    Only the changed tasks, anything they displace and anything that did
+    not fit before are (re)placed; the rest of each day stays put. Days
+    whose time bucket has rolled over are left to rebuild on the next read.
+
+    The semi-task plan is re-planned from its cached inputs first; semi
+    tasks it moves to another day are treated as changed on both days.
+    Without a cached plan the days are left to rebuild as well.
+
+    Publishes schedule.invalidated to the user's event streams.
+    """
+    changed     = list({t.id: t for t in changed}.values())
+    changed_ids = {t.id for t in changed} | set(removed_ids)
+    publish(user_id, "schedule.invalidated")
+    bump = take_data_version_bump(db, user_id)
+    if bump is None:
+        return
+    old, new = bump
+
+    today = date_type.today().isoformat()
+    plans = [entry for key, entry in plan_cache.entries_for(user_id, old) if key[1] == today]
+    if not plans:
+        return
+    plan_inputs = [t for t in plans[0].tasks if t["id"] not in changed_ids]
+    plan_inputs.extend(task_to_dict(t) for t in changed if not t.completed)
+    pins = {tid: day for tid, day in plans[0].pins.items() if tid not in changed_ids}
+    pins.update({t.id: t.last_scheduled_date for t in changed if t.last_scheduled_date})
+
+    plan = plan_horizon(plan_inputs, plans[0].prefs, today, pins)
+    plan_cache.put(plan_key(user_id, today, new), CachedPlan(plan, plan_inputs, pins, plans[0].prefs))
+    by_id = {t["id"]: t for t in plan_inputs}
+    moved = {
+        tid for tid, day in plan.days.items()
+        if tid not in changed_ids and plans[0].plan.days.get(tid) != day
+    }
+
+    for key, entry in schedule_cache.entries_for(user_id, old):
+        date_str = key[1]
+        if key[3] != now_bucket(date_str):
+            continue
+        weekday = date_type.fromisoformat(date_str).weekday()
+        placed  = {st["task_id"] for st in entry.result["scheduled"]}
+        touched = changed_ids | moved if plan.covers(date_str) else changed_ids
+
+        tasks = [t for t in entry.tasks if t["id"] not in touched]
+        tasks.extend(
+            task_to_dict(t) for t in changed
+            if not t.completed and is_eligible_on(t, date_str, weekday, placed, plan, done)
+        )
+        tasks.extend(by_id[tid] for tid in touched - changed_ids if plan.days[tid] == date_str)
+
+        result = patch_schedule(
+            entry.result, tasks, touched, entry.prefs, date_str, step=SCHEDULER_STEP_MINUTES,
+        )
+        result["overflow"] = filter_overflow(
+            result["overflow"], {t["id"]: t for t in tasks}, date_str,
+        )
+        schedule_cache.put(cache_key(user_id, date_str, new), CachedSchedule(result, tasks, entry.prefs))
@@ -3,25 +3,51 @@ tasks.py
 --------
 CRUD routes for tasks.
 
-GET  /tasks/          -- list all tasks for the current user
+GET  /tasks/          -- list the current user's tasks, newest first
+                         (filters + keyset pagination, see list_tasks)
+GET  /tasks/changes   -- tasks created/updated/deleted since a sync cursor
+                         (see task_changes)
 POST /tasks/          -- create a new task
+POST /tasks/bulk      -- apply a batch of create/update/patch/complete/delete
+                         operations in one transaction (see bulk_tasks)
 GET  /tasks/{id}      -- get a single task
 PUT  /tasks/{id}      -- update a task (all fields)
 PATCH /tasks/{id}     -- partial update (e.g. just mark complete)
 DELETE /tasks/{id}    -- delete a task
 POST /tasks/{id}/complete -- mark complete without full feedback flow
                              (quick complete, no survey)
+
+Completing a recurring task (either /complete route) checks off one day
+of it -- today, or ?date=YYYY-MM-DD -- and the series carries on; see
+backend/recurrence.py. PATCH /tasks/{id} with completed=true still ends
+the whole series.
+
+Every write is published to the user's event streams (task.created /
+task.updated / task.deleted, see backend/event_hub.py).
+
+GET /tasks/ and GET /tasks/changes answer If-None-Match with 304 while
+the user's tasks are unchanged (see backend/etags.py).
 """
 
-from datetime import datetime, timezone
+import base64
+import json
+from datetime import date as date_type, datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, field_validator
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel, ValidationError, field_validator
+from sqlalchemy import and_, delete, func, insert, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from backend.models import Task, User
+from backend.models import (
+    ScheduleSnapshot, Task, TaskFeedback, TaskOccurrence, TaskTombstone, User, bump_data_versions,
+)
 from backend.dependencies import get_db, get_current_user
+from backend.etags import conditional_get
+from backend.event_hub import publish
+from backend.recurrence import complete_occurrence, completed_for, recurs, sync_occurrences
+from backend.routes.schedules import apply_task_changes
 
 router = APIRouter()
 
@@ -38,6 +64,76 @@ VALID_PREF_TIMES    = ("morning", "afternoon", "evening", "none")
 VALID_RECURRENCE    = ("none", "daily", "weekly")
 VALID_CATEGORIES    = ("Work", "Study", "Exercise", "Rest")
 
+# Largest page GET /tasks/ returns when a limit is given.
+MAX_PAGE_SIZE = 200
+
+# Most operations POST /tasks/bulk accepts in one request.
+MAX_BULK_OPERATIONS = 500
+BULK_OPS            = ("create", "update", "patch", "complete", "delete")
+
+
+def encode_cursor(task: Task) -> str:
+    """Opaque keyset cursor for the position just after task in GET /tasks/ order."""
+    raw = json.dumps([task.created_at.isoformat(), task.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """(created_at, id) from encode_cursor(). Raises 400 on anything else."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, task_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def encode_sync_cursor(change_seq: int) -> str:
+    """Opaque GET /tasks/changes cursor: every change up to and including change_seq."""
+    return base64.urlsafe_b64encode(str(change_seq).encode()).decode().rstrip("=")
+
+
+def decode_sync_cursor(cursor: str) -> int:
+    """The change_seq in encode_sync_cursor(). Raises 400 on anything else."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return int(raw.decode())
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def _parse_date(value: Optional[str], name: str) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        date_type.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} must be YYYY-MM-DD.")
+    return value
+
+
+def complete(db: Session, task: Task, date_str: Optional[str]) -> Optional[str]:
+    """
+    Check a task off. A recurring task only has its occurrence on date_str
+    (default today) completed, and that date is returned; any other task is
+    marked completed as a whole and None is returned. Does not commit.
+    """
+    if not recurs(task):
+        task.completed    = True
+        task.completed_at = utcnow()
+        return None
+
+    date_str = date_str or date_type.today().isoformat()
+    try:
+        date_type.fromisoformat(date_str)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
+    try:
+        complete_occurrence(db, task, date_str)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return date_str
+
 
 # ── Request schemas ───────────────────────────────────────────────────────────
 
@@ -163,6 +259,38 @@ class TaskPatch(BaseModel):
         return v
 
 
+class BulkOperation(BaseModel):
+    """
+    One entry of POST /tasks/bulk. data is the TaskCreate / TaskUpdate /
+    TaskPatch body for create / update / patch; date is the day of a
+    recurring task to complete.
+    """
+    op   : str
+    id   : Optional[int]  = None
+    data : Optional[dict] = None
+    date : Optional[str]  = None
+
+    @field_validator("op")
+    @classmethod
+    def validate_op(cls, v):
+        if v not in BULK_OPS:
+            raise ValueError(f"op must be one of: {', '.join(BULK_OPS)}")
+        return v
+
+
+class BulkRequest(BaseModel):
+    operations : list[BulkOperation]
+
+    @field_validator("operations")
+    @classmethod
+    def validate_operations(cls, v):
+        if not v:
+            raise ValueError("operations cannot be empty")
+        if len(v) > MAX_BULK_OPERATIONS:
+            raise ValueError(f"at most {MAX_BULK_OPERATIONS} operations per request")
+        return v
+
+
 # ── Serializer ────────────────────────────────────────────────────────────────
 
 def serialize_task(task: Task) -> dict:
@@ -194,62 +322,16 @@ def serialize_task(task: Task) -> dict:
         "times_rescheduled"    : task.times_rescheduled,
         "last_scheduled_date"  : task.last_scheduled_date,
         "created_at"           : task.created_at.isoformat() if task.created_at else None,
+        "updated_at"           : task.updated_at.isoformat() if task.updated_at else None,
     }
 
 
-# ── Routes ───────────────────────────────────────────────────────────────────
-
-@router.get("/")
-def list_tasks(
-    db           : Session = Depends(get_db),
-    current_user : User    = Depends(get_current_user),
-):
-    """
-    Returns all incomplete tasks for the current user.
-    Completed tasks are excluded -- they are historical records.
-    Pass ?include_completed=true to include them.
-    """
-    tasks = (
-        db.query(Task)
-        .filter(Task.user_id == current_user.id)
-        .order_by(Task.created_at.desc())
-        .all()
-    )
-    return {"tasks": [serialize_task(t) for t in tasks]}
-
+# ── Task writes ───────────────────────────────────────────────────────────────
+# Shared by the single-task routes and POST /tasks/bulk. They raise
+# HTTPException for rule violations and never commit.
 
-@router.get("/{task_id}")
-def get_task(
-    task_id      : int,
-    db           : Session = Depends(get_db),
-    current_user : User    = Depends(get_current_user),
-):
-    """Get a single task by ID."""
-    task = db.query(Task).filter(
-        Task.id      == task_id,
-        Task.user_id == current_user.id,
-    ).first()
-
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found.")
-
-    return serialize_task(task)
-
-
-@router.post("/", status_code=201)
-def create_task(
-    body         : TaskCreate,
-    db           : Session = Depends(get_db),
-    current_user : User    = Depends(get_current_user),
-):
-    """
-    Create a new task.
-
-    Validation rules:
-    - Fixed tasks must have both fixed_start and fixed_end
-    - Semi and fixed tasks should have a deadline
-    - recurrence_days is required when recurrence = "weekly"
-    """
+def new_task(body: TaskCreate, user_id: int) -> Task:
+    """Validate a create body and build the (unsaved) Task."""
     if not body.title.strip():
         raise HTTPException(status_code=422, detail="Task title cannot be empty.")
 
@@ -268,8 +350,8 @@ def create_task(
             detail="Weekly recurrence requires recurrence_days (e.g. '0,2,4' for Mon/Wed/Fri)."
         )
 
-    task = Task(
-        user_id               = current_user.id,
+    return Task(
+        user_id               = user_id,
         title                 = body.title.strip(),
         category              = body.category or "Work",
         task_type             = body.task_type or "flexible",
@@ -286,29 +368,9 @@ def create_task(
         recurrence_days       = body.recurrence_days,
     )
 
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-
-    return {"created": True, "task": serialize_task(task)}
-
-
-@router.put("/{task_id}")
-def update_task(
-    task_id      : int,
-    body         : TaskUpdate,
-    db           : Session = Depends(get_db),
-    current_user : User    = Depends(get_current_user),
-):
-    """Full update -- replace any provided fields on the task."""
-    task = db.query(Task).filter(
-        Task.id      == task_id,
-        Task.user_id == current_user.id,
-    ).first()
-
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found.")
 
+def apply_update(db: Session, task: Task, body: TaskUpdate) -> None:
+    """Full update: set every field given in body (occurrences follow a recurrence change)."""
     if body.title is not None:
         if not body.title.strip():
             raise HTTPException(status_code=422, detail="Task title cannot be empty")
@@ -342,23 +404,357 @@ def update_task(
     if body.recurrence_days is not None:
         task.recurrence_days = body.recurrence_days if body.recurrence_days else None
 
+    if any(v is not None for v in (body.recurrence, body.recurrence_days, body.task_type)):
+        sync_occurrences(db, task)
+
+
+def apply_patch(task: Task, body: TaskPatch) -> None:
+    """Lightweight partial update: set the fields given in body."""
+    if body.completed             is not None: task.completed             = body.completed
+    if body.preferred_time_locked is not None: task.preferred_time_locked = body.preferred_time_locked
+    if body.preferred_time        is not None: task.preferred_time        = body.preferred_time
+    if body.deadline              is not None: task.deadline              = body.deadline
+    if body.importance            is not None: task.importance            = body.importance
+
+
+# ── Routes ───────────────────────────────────────────────────────────────────
+
+@router.get("/")
+def list_tasks(
+    request       : Request,
+    response      : Response,
+    completed     : Optional[bool] = None,
+    category      : Optional[str]  = None,
+    task_type     : Optional[str]  = None,
+    source        : Optional[str]  = None,
+    deadline_from : Optional[str]  = Query(None, description="Earliest deadline, YYYY-MM-DD"),
+    deadline_to   : Optional[str]  = Query(None, description="Latest deadline, YYYY-MM-DD"),
+    limit         : Optional[int]  = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor        : Optional[str]  = Query(None, description="next_cursor from the previous page"),
+    db            : Session = Depends(get_db),
+    current_user  : User    = Depends(get_current_user),
+):
+    """
+    The current user's tasks, newest first (created_at, then id).
+
+    Every filter is optional and they combine: completed, category,
+    task_type, source, and deadline_from / deadline_to (inclusive; tasks
+    without a deadline drop out when either is set).
+
+    Without limit every matching task is returned, as before. With limit
+    the response is one page plus next_cursor (null on the last page);
+    pass it back as ?cursor= for the next one. Pages are keyset-based on
+    ix_tasks_user_created, so a deep page costs the same as the first and
+    tasks added meanwhile never shift a page.
+
+    The ETag is the user's data_version plus when a schedule was last
+    built for them (builds set last_scheduled_date without bumping the
+    version), so a 304 costs one query on schedule_snapshots.
+    """
+    deadline_from = _parse_date(deadline_from, "deadline_from")
+    deadline_to   = _parse_date(deadline_to, "deadline_to")
+    after         = decode_cursor(cursor) if cursor else None
+
+    last_built = db.query(func.max(ScheduleSnapshot.built_at)).filter(
+        ScheduleSnapshot.user_id == current_user.id
+    ).scalar()
+    not_modified = conditional_get(
+        request, response, "tasks", current_user.id, current_user.data_version, last_built, request.url.query,
+    )
+    if not_modified is not None:
+        return not_modified
+
+    query = db.query(Task).filter(Task.user_id == current_user.id)
+    if completed     is not None: query = query.filter(Task.completed == completed)
+    if category      is not None: query = query.filter(Task.category == category)
+    if task_type     is not None: query = query.filter(Task.task_type == task_type)
+    if source        is not None: query = query.filter(Task.source == source)
+    if deadline_from is not None: query = query.filter(Task.deadline >= deadline_from)
+    if deadline_to   is not None: query = query.filter(Task.deadline <= deadline_to)
+    if after is not None:
+        created_at, task_id = after
+        query = query.filter(or_(
+            Task.created_at < created_at,
+            and_(Task.created_at == created_at, Task.id < task_id),
+        ))
+    query = query.order_by(Task.created_at.desc(), Task.id.desc())
+
+    if limit is None:
+        return {"tasks": [serialize_task(t) for t in query.all()]}
+
+    tasks = query.limit(limit + 1).all()
+    more  = len(tasks) > limit
+    tasks = tasks[:limit]
+    return {
+        "tasks"      : [serialize_task(t) for t in tasks],
+        "next_cursor": encode_cursor(tasks[-1]) if more else None,
+    }
+
+
+@router.get("/changes")
+def task_changes(
+    request      : Request,
+    response     : Response,
+    since        : Optional[str] = Query(None, description="cursor from the previous response; omit for a full copy"),
+    db           : Session       = Depends(get_db),
+    current_user : User          = Depends(get_current_user),
+):
+    """
+    Delta sync for clients that keep a local copy of the task list.
+
+    Without since, every task comes back in "changed". With the cursor of
+    the previous response, only tasks created or updated after it are in
+    "changed" and the ids of tasks deleted after it are in "deleted", so a
+    client stays current in O(changes):
+
+        {"changed": [task, ...], "deleted": [id, ...], "cursor": "..."}
+
+    Apply deletes, upsert the changed tasks by id, and send the new cursor
+    next time. Changes the scheduler makes itself (last_scheduled_date) do
+    not count.
+
+    The cursor is the user's data_version, not a time: every change is
+    stamped with the version its commit bumped to (models._track_changes),
+    and versions become visible in order, so nothing at or below the
+    cursor can still turn up later. A change committed while this ran may
+    come back again next time; upserting it twice is harmless.
+    """
+    not_modified = conditional_get(
+        request, response, "task-changes", current_user.id, current_user.data_version, since
+    )
+    if not_modified is not None:
+        return not_modified
+
+    cursor = current_user.data_version  # read before the rows, see above
+    tasks  = db.query(Task).filter(Task.user_id == current_user.id)
+    if since is None:
+        changed = tasks.all()
+        removed = set()
+    else:
+        after   = decode_sync_cursor(since)
+        changed = tasks.filter(Task.change_seq > after).all()
+        removed = {task_id for task_id, in db.query(TaskTombstone.task_id).filter(
+            TaskTombstone.user_id    == current_user.id,
+            TaskTombstone.change_seq > after,
+        )}
+
+    # An id SQLite handed out again belongs to the task that exists now.
+    deleted = removed - {t.id for t in changed}
+
+    return {
+        "changed" : [serialize_task(t) for t in changed],
+        "deleted" : sorted(deleted),
+        "cursor"  : encode_sync_cursor(cursor),
+    }
+
+
+@router.post("/bulk")
+def bulk_tasks(
+    body         : BulkRequest,
+    db           : Session = Depends(get_db),
+    current_user : User    = Depends(get_current_user),
+):
+    """
+    Apply a batch of task operations in one transaction:
+
+        {"operations": [
+            {"op": "create",   "data": {...TaskCreate}},
+            {"op": "update",   "id": 7, "data": {...TaskUpdate}},
+            {"op": "patch",    "id": 7, "data": {...TaskPatch}},
+            {"op": "complete", "id": 9, "date": "2026-03-02"},
+            {"op": "delete",   "id": 4}
+        ]}
+
+    Operations run in order, with the same rules as the single-task
+    routes. All or nothing: if any operation fails, none is applied and
+    the 422 detail lists the result of every operation. On success the
+    results come back in request order, each with the task it produced
+    (or the id it deleted).
+
+    The referenced tasks are loaded with one query, new and changed rows
+    are written by a single flush, deletes are one statement per table,
+    and everything is committed once.
+    """
+    ids   = {op.id for op in body.operations if op.id is not None}
+    tasks = {
+        t.id: t for t in db.query(Task).filter(Task.user_id == current_user.id, Task.id.in_(ids))
+    } if ids else {}
+
+    results : list[dict] = []
+    created : list[Task] = []
+    deleted : set[int]   = set()
+    failed  = False
+    for index, op in enumerate(body.operations):
+        result = {"index": index, "op": op.op}
+        try:
+            if op.op == "create":
+                task = new_task(TaskCreate.model_validate(op.data or {}), current_user.id)
+                db.add(task)
+                created.append(task)
+                result["task"] = task
+            else:
+                task = tasks.get(op.id) if op.id not in deleted else None
+                if task is None:
+                    raise HTTPException(status_code=404, detail="Task not found.")
+                if op.op == "update":
+                    apply_update(db, task, TaskUpdate.model_validate(op.data or {}))
+                elif op.op == "patch":
+                    apply_patch(task, TaskPatch.model_validate(op.data or {}))
+                elif op.op == "complete":
+                    occurrence_date = complete(db, task, op.date)
+                    if occurrence_date:
+                        result["occurrence_date"] = occurrence_date
+                if op.op == "delete":
+                    deleted.add(task.id)
+                    result["id"] = task.id
+                else:
+                    result["task"] = task
+            result["ok"] = True
+        except HTTPException as exc:
+            failed = True
+            result.update(ok=False, status=exc.status_code, detail=exc.detail)
+        except ValidationError as exc:
+            failed = True
+            result.update(ok=False, status=422, detail=exc.errors(include_url=False, include_context=False))
+        results.append(result)
+
+    def report(result: dict) -> dict:
+        task = result.pop("task", None)
+        if task is not None and task.id not in deleted:
+            result["task"] = serialize_task(task)
+        return result
+
+    if failed:
+        db.rollback()
+        for result in results:
+            result.pop("task", None)
+        raise HTTPException(
+            status_code=422,
+            detail={"message": "No operations were applied.", "results": results},
+        )
+
+    try:
+        db.flush()
+        for task in created:
+            if recurs(task) and task.id not in deleted:
+                sync_occurrences(db, task)
+        if deleted:
+            db.execute(delete(TaskFeedback).where(TaskFeedback.task_id.in_(deleted)))
+            db.execute(delete(TaskOccurrence).where(TaskOccurrence.task_id.in_(deleted)))
+            db.execute(delete(Task).where(Task.id.in_(deleted)).execution_options(synchronize_session=False))
+            version = bump_data_versions(db, {current_user.id})[current_user.id]
+            db.execute(insert(TaskTombstone), [
+                {"user_id": current_user.id, "task_id": task_id, "deleted_at": utcnow(), "change_seq": version}
+                for task_id in deleted
+            ])
+            for task_id in deleted:
+                db.expunge(tasks[task_id])
+        response = [report(r) for r in results]
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Operations conflict with each other; none were applied.")
+
+    changed_ids = {r["task"]["id"] for r in response if "task" in r}
+    changed     = db.query(Task).filter(Task.id.in_(changed_ids)).all() if changed_ids else []
+    apply_task_changes(db, current_user.id, changed=changed, removed_ids=deleted, done=completed_for(db, changed))
+
+    created_ids = {t.id for t in created}
+    for task_id in changed_ids:
+        publish(current_user.id, "task.created" if task_id in created_ids else "task.updated", id=task_id)
+    for task_id in deleted:
+        publish(current_user.id, "task.deleted", id=task_id)
+
+    return {"results": response}
+
+
+@router.get("/{task_id}")
+def get_task(
+    task_id      : int,
+    db           : Session = Depends(get_db),
+    current_user : User    = Depends(get_current_user),
+):
+    """Get a single task by ID."""
+    task = db.query(Task).filter(
+        Task.id      == task_id,
+        Task.user_id == current_user.id,
+    ).first()
+
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found.")
+
+    return serialize_task(task)
+
+
+@router.post("/", status_code=201)
+def create_task(
+    body         : TaskCreate,
+    db           : Session = Depends(get_db),
+    current_user : User    = Depends(get_current_user),
+):
+    """
+    Create a new task.
+
+    Validation rules:
+    - Fixed tasks must have both fixed_start and fixed_end
+    - Semi and fixed tasks should have a deadline
+    - recurrence_days is required when recurrence = "weekly"
+    """
+    task = new_task(body, current_user.id)
+
+    db.add(task)
+    if recurs(task):
+        db.flush()
+        sync_occurrences(db, task)
     db.commit()
     db.refresh(task)
+    apply_task_changes(db, current_user.id, changed=[task])
+    publish(current_user.id, "task.created", id=task.id)
+
+    return {"created": True, "task": serialize_task(task)}
+
+
+@router.put("/{task_id}")
+def update_task(
+    task_id      : int,
+    body         : TaskUpdate,
+    db           : Session = Depends(get_db),
+    current_user : User    = Depends(get_current_user),
+):
+    """Full update -- replace any provided fields on the task."""
+    task = db.query(Task).filter(
+        Task.id      == task_id,
+        Task.user_id == current_user.id,
+    ).first()
+
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found.")
+
+    apply_update(db, task, body)
+
+    db.commit()
+    db.refresh(task)
+    apply_task_changes(db, current_user.id, changed=[task], done=completed_for(db, [task]))
+    publish(current_user.id, "task.updated", id=task.id)
 
     return {"updated": True, "task": serialize_task(task)}
 
 @router.patch("/{task_id}/complete")
 def complete_task(
     task_id:      int,
+    date:         Optional[str] = Query(None, description="Day of a recurring task to complete (default today)"),
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
     task = db.query(Task).filter(Task.id == task_id, Task.user_id == current_user.id).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found.")
-    task.completed = True
-    task.completed_at = datetime.now(timezone.utc)
+    occurrence_date = complete(db, task, date)
     db.commit()
+    apply_task_changes(db, current_user.id, changed=[task], done=completed_for(db, [task]))
+    publish(current_user.id, "task.updated", id=task.id)
+    if occurrence_date:
+        return {**serialize_task(task), "occurrence_date": occurrence_date}
     return serialize_task(task)
 
 @router.patch("/{task_id}")
@@ -381,14 +777,12 @@ def patch_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found.")
 
-    if body.completed             is not None: task.completed             = body.completed
-    if body.preferred_time_locked is not None: task.preferred_time_locked = body.preferred_time_locked
-    if body.preferred_time        is not None: task.preferred_time        = body.preferred_time
-    if body.deadline              is not None: task.deadline              = body.deadline
-    if body.importance            is not None: task.importance            = body.importance
+    apply_patch(task, body)
 
     db.commit()
     db.refresh(task)
+    apply_task_changes(db, current_user.id, changed=[task], done=completed_for(db, [task]))
+    publish(current_user.id, "task.updated", id=task.id)
 
     return {"updated": True, "task": serialize_task(task)}
 
@@ -396,6 +790,7 @@ def patch_task(
 @router.post("/{task_id}/complete")
 def quick_complete_task(
     task_id      : int,
+    date         : Optional[str] = Query(None, description="Day of a recurring task to complete (default today)"),
     db           : Session = Depends(get_db),
     current_user : User    = Depends(get_current_user),
 ):
@@ -413,12 +808,15 @@ def quick_complete_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found.")
 
-    task.completed    = True
-    task.completed_at = utcnow()
+    occurrence_date = complete(db, task, date)
 
     db.commit()
     db.refresh(task)
+    apply_task_changes(db, current_user.id, changed=[task], done=completed_for(db, [task]))
+    publish(current_user.id, "task.updated", id=task.id)
 
+    if occurrence_date:
+        return {"completed": True, "occurrence_date": occurrence_date, "task": serialize_task(task)}
     return {"completed": True, "task": serialize_task(task)}
 
 
@@ -443,5 +841,7 @@ def delete_task(
 
     db.delete(task)
     db.commit()
+    apply_task_changes(db, current_user.id, removed_ids=[task_id])
+    publish(current_user.id, "task.deleted", id=task_id)
 
     return {"deleted": True}
\ No newline at end of file
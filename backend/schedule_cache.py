@@ -0,0 +1,170 @@
+"""
+schedule_cache.py
+-----------------
+In-process LRU cache of build_schedule() output.
+
+A schedule only changes when the user's tasks or preferences change (or,
+for today, when the clock moves past already-free slots). Entries are keyed by
+
+    (user_id, date, data_version, now_bucket)
+
+User.data_version is bumped in the database by every flush that changes a
+user's tasks or preferences (backend/models.py), whichever worker or job
+makes it, and the routes have it from loading the user. A bump makes every
+older key for that user unreachable; stale entries are never served and
+simply age out of the LRU.
+
+now_bucket only applies to today's date: build_schedule() won't place
+tasks in slots that have already passed, so today's entry is rebuilt every
+NOW_BUCKET_MINUTES. Other dates get one bucket per calendar day, because
+the semi-task plan they were built from starts over every day.
+
+Each entry also keeps the task dicts and preferences the schedule was built
+from, so a single-task edit can be patched into the cached schedule
+(scheduler/incremental.py) and re-keyed under the new data_version instead
+of being rebuilt from the database.
+
+plan_cache holds each user's semi-task horizon plan (scheduler/horizon.py)
+under the same version, keyed (user_id, start_date, data_version), so every
+single-day read after the first is a lookup.
+
+Entries are per process, but the version is not: a write handled by one
+worker makes the others' entries for that user unreachable as well.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from backend.config import SCHEDULE_CACHE_SIZE
+from backend.scheduler.horizon import HorizonPlan
+
+# Width of the "current time" bucket for today's schedule.
+NOW_BUCKET_MINUTES = 15
+
+
+def now_bucket(date_str: str, now: datetime | None = None) -> int:
+    """Time bucket for today's date; for any other date, minus today's ordinal."""
+    now = now or datetime.now()
+    if date_str != now.date().isoformat():
+        return -now.toordinal()
+    return (now.hour * 60 + now.minute) // NOW_BUCKET_MINUTES
+
+
+def cache_key(user_id: int, date_str: str, data_version: int) -> tuple:
+    """The cache key for a user's schedule on a date at data_version, as of right now."""
+    return (user_id, date_str, data_version, now_bucket(date_str))
+
+
+def plan_key(user_id: int, start_str: str, data_version: int) -> tuple:
+    """Key for a user's horizon plan starting on start_str at data_version."""
+    return (user_id, start_str, data_version)
+
+
+def inputs_hash(tasks: list[dict], prefs: dict | None, settings: dict | None = None) -> str:
+    """
+    Stable fingerprint of everything a schedule is built from: the day's
+    task dicts, the preferences dict and any scheduler settings (mode,
+    step). Unlike data_version it only changes when the day's own inputs
+    do, so a persisted schedule can outlive edits to other days.
+    """
+    payload = json.dumps(
+        {"tasks": tasks, "prefs": prefs, "settings": settings},
+        sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CachedSchedule(NamedTuple):
+    """A cached build_schedule() result plus the inputs it was built from."""
+    result : dict
+    tasks  : list[dict]
+    prefs  : dict | None
+
+
+class CachedPlan(NamedTuple):
+    """A cached plan_horizon() result plus the inputs it was planned from."""
+    plan  : HorizonPlan
+    tasks : list[dict]
+    pins  : dict[int, str]
+    prefs : dict | None
+
+
+# ── LRU cache ─────────────────────────────────────────────────────────────────
+
+class ScheduleCache:
+    """
+    Thread-safe LRU of CachedSchedule (or CachedPlan) entries. Entries are shared between
+    requests -- callers must not mutate what get() returns.
+    max_entries = 0 disables caching.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, CachedSchedule] = OrderedDict()
+        self._lock      = threading.Lock()
+        self.hits       = 0
+        self.misses     = 0
+        self.evictions  = 0
+
+    def get(self, key: tuple) -> CachedSchedule | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value: CachedSchedule) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def entries_for(self, user_id: int, data_version: int) -> list[tuple[tuple, CachedSchedule]]:
+        """
+        Every (key, entry) cached for user_id at data_version. Does not
+        count as a lookup.
+        """
+        with self._lock:
+            return [
+                (key, value) for key, value in self._entries.items()
+                if key[0] == user_id and key[2] == data_version
+            ]
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size"       : len(self._entries),
+                "max_entries": self.max_entries,
+                "hits"       : self.hits,
+                "misses"     : self.misses,
+                "evictions"  : self.evictions,
+                "hit_ratio"  : round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+schedule_cache = ScheduleCache(SCHEDULE_CACHE_SIZE)
+plan_cache     = ScheduleCache(SCHEDULE_CACHE_SIZE)
+
+
+def reset() -> None:
+    """Clear cached schedules and plans (used by tests)."""
+    schedule_cache.clear()
+    plan_cache.clear()
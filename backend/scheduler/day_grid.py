@@ -0,0 +1,232 @@
+"""
+day_grid.py
+-----------
+Bitset placement engine for build_schedule(engine="bitset").
+
+The day is a 1440-bit Python int, one bit per minute. A set bit means the
+minute is free. Everything the interval engine does with loops becomes
+integer mask arithmetic:
+
+  - fixed tasks + buffer   -> OR each buffered span into one mask, then
+                              clear it from the wake/sleep window
+  - "is [start, end) free" -> (free & span) == span
+  - placing a task         -> clear its buffered span from the free mask
+  - final constraint pass  -> AND each flexible task against the mask of
+                              everything already accepted
+
+DayGrid exposes the same methods as occupancy.DayOccupancy, so
+find_best_slot() does not care which engine it is handed. Candidate starts
+are anchored to the start of each initial free run, which is where the
+interval engine's free slots start, so both engines try the same positions
+and produce the same schedule.
+
+A zero-length fixed task (with no buffer) blocks no minute, but a task may
+not run across it. The grid keeps those minutes as "cuts" and splits its
+free runs there, the way find_free_slots() returns two touching slots.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator
+
+from .constraints import ScheduledTask, as_scheduled_tasks
+
+MINUTES_PER_DAY = 1440
+FULL_DAY        = (1 << MINUTES_PER_DAY) - 1
+
+
+# ── Bit helpers ───────────────────────────────────────────────────────────────
+
+def span_mask(start: int, end: int) -> int:
+    """Bits [start, end) set, clipped to the day. Empty if end <= start."""
+    start = max(0, start)
+    end   = min(MINUTES_PER_DAY, end)
+    if end <= start:
+        return 0
+    return ((1 << (end - start)) - 1) << start
+
+
+def iter_runs(mask: int) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) for each run of set bits, in ascending order."""
+    while mask:
+        start  = (mask & -mask).bit_length() - 1
+        shifted = mask >> start
+        length = (shifted ^ (shifted + 1)).bit_length() - 1
+        yield start, start + length
+        mask &= ~span_mask(start, start + length)
+
+
+# ── Day grid ──────────────────────────────────────────────────────────────────
+
+class DayGrid:
+    """
+    Minute-resolution free-time bitmap for a single day. cuts are the
+    minutes no task may run across (see the module docstring).
+    """
+
+    def __init__(self, free_mask: int, buffer_minutes: int = 10, cuts: Iterable[int] = ()):
+        self.buffer_minutes = buffer_minutes
+        self.free_mask      = free_mask & FULL_DAY
+        self.cuts           = sorted(set(cuts))
+        # Initial free runs: candidate grids are anchored to their starts.
+        self._runs = list(self._split(iter_runs(self.free_mask)))
+
+    def _split(self, runs: Iterator[tuple[int, int]]) -> Iterator[tuple[int, int]]:
+        """runs, each split at the cuts strictly inside it."""
+        for start, end in runs:
+            for cut in self.cuts[bisect_right(self.cuts, start):bisect_left(self.cuts, end)]:
+                yield start, cut
+                start = cut
+            yield start, end
+
+    @classmethod
+    def from_fixed(
+        cls,
+        fixed_tasks    : list[ScheduledTask],
+        day_start_min  : int,
+        day_end_min    : int,
+        buffer_minutes : int = 10,
+    ) -> "DayGrid":
+        """
+        Bitset equivalent of constraints.find_free_slots(), clipped to
+        [day_start_min, day_end_min).
+
+        Each fixed task blocks [start - buffer, end + buffer) exactly as
+        find_free_slots() does; a span that comes out inverted (an end time
+        before the start) blocks nothing, and a zero-length one is a cut.
+        """
+        blocked = 0
+        cuts    = []
+        for ft in fixed_tasks:
+            start, end = ft.start_min - buffer_minutes, ft.end_min + buffer_minutes
+            blocked |= span_mask(start, end)
+            if start == end:
+                cuts.append(start)
+        window = span_mask(day_start_min, day_end_min)
+        return cls(window & ~blocked, buffer_minutes, cuts)
+
+    def copy(self) -> "DayGrid":
+        """Independent copy, for trying out a placement without committing it."""
+        clone = DayGrid.__new__(DayGrid)
+        clone.buffer_minutes = self.buffer_minutes
+        clone.free_mask      = self.free_mask
+        clone.cuts           = self.cuts
+        clone._runs          = self._runs
+        return clone
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def gaps(self) -> list[tuple[int, int]]:
+        """Return the current free runs as (start, end) tuples."""
+        return list(self._split(iter_runs(self.free_mask)))
+
+    def is_free(self, start: int, end: int) -> bool:
+        """True if every minute in [start, end) is free and no cut is inside it."""
+        mask = span_mask(start, end)
+        return (
+            mask != 0 and self.free_mask & mask == mask
+            and bisect_right(self.cuts, start) == bisect_left(self.cuts, end)
+        )
+
+    def next_gap(self, duration: int, from_min: int = 0) -> tuple[int, int] | None:
+        """First free run (clipped to start at from_min) that fits `duration`."""
+        for start, end in self._split(iter_runs(self.free_mask & ~span_mask(0, from_min))):
+            if end - start >= duration:
+                return start, end
+        return None
+
+    def candidate_starts(self, duration: int, step: int = 15) -> Iterator[int]:
+        """Yield every grid-aligned start where `duration` minutes are free."""
+        if duration <= 0:
+            return
+        task_mask = (1 << duration) - 1
+        free      = self.free_mask
+        for run_start, run_end in self._runs:
+            cursor = run_start
+            while cursor + duration <= run_end:
+                if (free >> cursor) & task_mask == task_mask:
+                    yield cursor
+                cursor += step
+
+    def fitting_gaps(self, duration: int) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield (start, end, anchor) for every free run that can hold
+        `duration` minutes; anchor is the start of the initial run it lies in.
+        """
+        if duration <= 0:
+            return
+        anchors = [run_start for run_start, _ in self._runs]
+        for start, end in self._split(iter_runs(self.free_mask)):
+            if end - start >= duration:
+                yield start, end, anchors[bisect_right(anchors, start) - 1]
+
+    # ── Updates ───────────────────────────────────────────────────────────────
+
+    def reserve(self, start: int, end: int) -> None:
+        """Mark [start, end) plus buffer on both sides as taken."""
+        buffer = self.buffer_minutes
+        self.free_mask &= ~span_mask(start - buffer, end + buffer)
+
+
+# ── Constraint pass ───────────────────────────────────────────────────────────
+
+def grid_apply_constraints(
+    schedule       : list[ScheduledTask],
+    day_start_min  : int,
+    day_end_min    : int,
+    buffer_minutes : int = 10,
+) -> tuple[list[ScheduledTask], list[ScheduledTask]]:
+    """
+    Bitset version of constraints.apply_constraints() with the same rules
+    and the same (valid, overflow) result.
+
+    Accepted tasks are kept as one "blocked" mask (each dilated by the
+    buffer), so checking a flexible task is a single AND instead of a loop
+    over everything accepted so far.
+
+    Only spans with a positive length have a mask. Zero-length and inverted
+    spans (bad data) are checked pairwise, as apply_constraints() checks
+    everything: a span with end <= start still conflicts with a task that
+    starts before its end and ends after its start.
+    """
+    schedule = as_scheduled_tasks(schedule)
+    fixed    = [t for t in schedule if t.task_type == "fixed"]
+    flexible = [t for t in schedule if t.task_type != "fixed"]
+
+    valid    : list[ScheduledTask] = []
+    overflow : list[ScheduledTask] = []
+    blocked  = 0
+    spans    : list[tuple[int, int]] = []   # every blocked span
+    empty    : list[tuple[int, int]] = []   # the ones with end <= start
+
+    def block(start: int, end: int) -> None:
+        nonlocal blocked
+        blocked |= span_mask(start, end)
+        spans.append((start, end))
+        if end <= start:
+            empty.append((start, end))
+
+    def hits(start: int, end: int) -> bool:
+        if end <= start:
+            return any(start < b and a < end for a, b in spans)
+        return bool(blocked & span_mask(start, end)) or any(start < b and a < end for a, b in empty)
+
+    for ft in fixed:
+        if ft.start_min >= day_start_min and ft.end_min <= day_end_min:
+            valid.append(ft)
+        else:
+            valid.append(ft.flag_out_of_bounds())
+        block(ft.start_min - buffer_minutes, ft.end_min + buffer_minutes)
+
+    for task in flexible:
+        start, end = task.start_min, task.end_min
+        if start < day_start_min or end > day_end_min:
+            overflow.append(task)
+        elif hits(start, end):
+            overflow.append(task)
+        else:
+            valid.append(task)
+            block(start - buffer_minutes, end + buffer_minutes)
+
+    valid.sort(key=lambda t: t.start_min)
+
+    return valid, overflow
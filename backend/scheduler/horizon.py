@@ -0,0 +1,170 @@
+"""
+horizon.py
+----------
+Plans semi-flexible tasks across the days up to their deadlines in one
+pass, instead of offering every one of them to every day.
+
+A semi task with a deadline a week out used to be eligible on each of
+those days, so each day's independent build_schedule() let it compete
+for that day's best slots again. plan_horizon() instead gives each such
+task exactly one day:
+
+  1. Work out every day's free time: find_free_slots() between that
+     day's fixed tasks, inside the wake/sleep window (from "now" today).
+  2. Take out the time the day already owes -- tasks due that day and
+     recurring tasks that fall on it.
+  3. Keep pinned tasks (the day they were last materialized on) where
+     they are while that day is still in their window and has room, so
+     a plan does not reshuffle on every edit.
+  4. Place the rest earliest deadline first (then most important), each
+     on the day in [start, deadline] with the most free time left that
+     still has a gap long enough for it. Ties go to the earlier day.
+  5. A task that fits nowhere is planned on its deadline, where it shows
+     up in the day's overflow ("didn't fit").
+
+Capacity is counted in whole free gaps, not scored slots, so a planned
+task is not guaranteed a place on its day -- it is guaranteed a gap of
+its length after the day's own obligations. The day's build_schedule()
+still decides where exactly it goes.
+"""
+
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from .constraints import find_free_slots, weekday_mask
+from .rule_based import DEFAULT_PREFS, day_window, fixed_and_flexible
+
+# How far ahead plan_horizon() looks. Semi tasks due later are still
+# planned, inside this window.
+MAX_HORIZON_DAYS = 31
+
+
+class HorizonPlan(NamedTuple):
+    """Which day each semi task is planned on, for the dates start..end."""
+    start : str                 # YYYY-MM-DD, first planned day
+    end   : str                 # YYYY-MM-DD, last planned day
+    days  : dict[int, str]      # task id -> planned date
+
+    def covers(self, date_str: str) -> bool:
+        """True if date_str is inside the planned window."""
+        return self.start <= date_str <= self.end
+
+
+def _recurs(task: dict) -> bool:
+    """Daily, or weekly on set days -- recurring tasks are on their days whatever the plan says."""
+    return task.get("recurrence") == "daily" or (
+        task.get("recurrence") == "weekly" and bool(task.get("recurrence_days"))
+    )
+
+
+def plannable(task: dict, start_str: str) -> bool:
+    """Non-recurring semi tasks due after start_str -- the ones plan_horizon() places."""
+    return (
+        task.get("task_type") == "semi"
+        and not task.get("completed")
+        and not _recurs(task)
+        and bool(task.get("deadline"))
+        and task["deadline"] > start_str
+    )
+
+
+def _owed_on(task: dict, date_str: str, weekday: int) -> bool:
+    """Non-fixed tasks that will be on date_str regardless of the plan."""
+    if task.get("task_type") == "fixed" or task.get("completed"):
+        return False
+    if task.get("deadline") == date_str or task.get("recurrence") == "daily":
+        return True
+    return task.get("recurrence") == "weekly" and bool(weekday_mask(task.get("recurrence_days")) >> weekday & 1)
+
+
+def _take(slots: list[tuple[int, int]], duration: int, buffer: int) -> bool:
+    """Carve duration (+ buffer) out of the first gap long enough. False if none is."""
+    for i, (start, end) in enumerate(slots):
+        if end - start >= duration:
+            rest = start + duration + buffer
+            if rest < end:
+                slots[i] = (rest, end)
+            else:
+                del slots[i]
+            return True
+    return False
+
+
+def _fits(slots: list[tuple[int, int]], duration: int) -> bool:
+    return any(end - start >= duration for start, end in slots)
+
+
+def plan_horizon(
+    tasks     : list[dict],
+    prefs     : dict | None,
+    start_str : str,
+    pins      : dict[int, str] | None = None,
+    max_days  : int = MAX_HORIZON_DAYS,
+) -> HorizonPlan:
+    """
+    Plan every semi task due after start_str onto one day.
+
+    Args:
+        tasks     : all of the user's incomplete task dicts (fixed ones
+                    give each day its free time)
+        prefs     : user preferences dict; None uses DEFAULT_PREFS
+        start_str : first day of the plan (YYYY-MM-DD), normally today
+        pins      : task id -> date a task is already materialized on
+        max_days  : length of the planned window
+
+    Returns a HorizonPlan. Its window ends at the latest deadline, or
+    after max_days; a task due later is planned inside the window.
+    """
+    prefs = prefs or DEFAULT_PREFS
+    pins  = pins or {}
+    semi  = [t for t in tasks if plannable(t, start_str)]
+    *_, buffer = day_window(prefs, start_str)  # the same on every day
+
+    start = date.fromisoformat(start_str)
+    last  = max((t["deadline"] for t in semi), default=start_str)
+    n     = min(max_days, (date.fromisoformat(last) - start).days + 1)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(n)]
+
+    fixed_by_date: dict[str, list[dict]] = {}
+    for t in tasks:
+        if t.get("task_type") == "fixed" and t.get("deadline"):
+            fixed_by_date.setdefault(t["deadline"], []).append(t)
+
+    planned_ids = {t["id"] for t in semi}
+    free: dict[str, list[tuple[int, int]]] = {}
+    for i, date_str in enumerate(dates):
+        _, day_end, effective_start, _ = day_window(prefs, date_str)
+        fixed, _ = fixed_and_flexible(fixed_by_date.get(date_str, []))
+        slots    = find_free_slots(fixed, effective_start, day_end, buffer)
+        weekday  = (start + timedelta(days=i)).weekday()
+        for t in tasks:
+            if t["id"] not in planned_ids and _owed_on(t, date_str, weekday):
+                _take(slots, t.get("duration_minutes", 30), buffer)
+        free[date_str] = slots
+
+    days: dict[int, str] = {}
+    for t in semi:
+        pinned = pins.get(t["id"])
+        if pinned in free and pinned <= t["deadline"] and _take(free[pinned], t.get("duration_minutes", 30), buffer):
+            days[t["id"]] = pinned
+
+    semi.sort(key=lambda t: (t["deadline"], -(t.get("importance") or 3), t["id"]))
+    for t in semi:
+        if t["id"] in days:
+            continue
+        duration = t.get("duration_minutes", 30)
+        best, best_free = None, -1
+        for date_str in dates:
+            if date_str > t["deadline"]:
+                break
+            slots = free[date_str]
+            total = sum(end - s for s, end in slots)
+            if total > best_free and _fits(slots, duration):
+                best, best_free = date_str, total
+        if best is None:
+            days[t["id"]] = t["deadline"]
+        else:
+            _take(free[best], duration, buffer)
+            days[t["id"]] = best
+
+    return HorizonPlan(start_str, dates[-1], days)
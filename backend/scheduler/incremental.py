@@ -0,0 +1,151 @@
+"""
+incremental.py
+--------------
+Repairs an already-built schedule after a few tasks change, instead of
+rebuilding the whole day.
+
+Typical edits from the dashboard touch one task: it gets completed,
+deleted, rescheduled, created, or a calendar sync brings in a new fixed
+event. patch_schedule() takes the previous build_schedule() result plus
+the day's task list *after* the edit and:
+
+  1. keeps every flexible task that did not change exactly where it was,
+     as long as its slot is still free (a new fixed event can evict it)
+  2. rebuilds the free-time index from the fixed tasks and the kept ones
+  3. places the changed tasks, the evicted ones and anything that had
+     not fitted before -- the freed time may now hold it -- best-scoring
+     slot first, the same way build_schedule() does
+
+Untouched tasks never move, so the result is not necessarily what a full
+rebuild would produce; it is what the user expects to see after a small
+edit. Rebuild from scratch when the preferences (day window, buffer,
+energy weights) change.
+"""
+
+from datetime import date
+
+import numpy as np
+
+from .constraints import ScheduledTask, apply_constraints, find_free_slots
+from .occupancy import DayOccupancy
+from .priority_engine import expand_period_scores, period_score_matrix, rank_order, static_scores
+from .rule_based import (
+    DEFAULT_PREFS,
+    day_window,
+    find_best_slot,
+    fixed_and_flexible,
+    format_schedule,
+    make_overflow_task,
+    make_scheduled_task,
+)
+from .slot_search import DEFAULT_STEP
+
+
+def patch_schedule(
+    schedule    : dict,
+    tasks       : list[dict],
+    changed_ids : set[int],
+    prefs       : dict | None = None,
+    today_str   : str | None  = None,
+    step        : int         = DEFAULT_STEP,
+) -> dict:
+    """
+    Apply a task edit to a previous build_schedule() result.
+
+    Args:
+        schedule    : the previous build_schedule() result for the day
+        tasks       : the day's eligible task dicts after the edit (the
+                      same list build_schedule() would be given now)
+        changed_ids : ids of tasks that were added, updated or removed
+        prefs       : user preferences dict; None uses DEFAULT_PREFS
+        today_str   : date string YYYY-MM-DD, defaults to schedule["date"]
+        step        : slot resolution in minutes (use the one the schedule
+                      was built with)
+
+    Returns a new dict in the build_schedule() shape. `schedule` itself is
+    not modified.
+    """
+    if prefs is None:
+        prefs = DEFAULT_PREFS
+
+    if today_str is None:
+        today_str = schedule.get("date") or date.today().isoformat()
+
+    day_start_min, day_end_min, effective_start, buffer_minutes = day_window(prefs, today_str)
+
+    # Fixed tasks come straight from the task list -- they cost nothing to place.
+    fixed_scheduled, flexible_raw = fixed_and_flexible(tasks)
+    free_slots = find_free_slots(fixed_scheduled, effective_start, day_end_min, buffer_minutes)
+    occupancy  = DayOccupancy(free_slots, buffer_minutes, (effective_start, day_end_min))
+
+    # Candidate starts for the whole day, taken before anything is reserved:
+    # every start find_best_slot can return later is on this grid.
+    slot_grid = np.fromiter(occupancy.candidate_starts(1, step), dtype=np.int64)
+
+    # ── Keep unchanged flexible tasks where they were ─────────────────────────
+    by_id = {t["id"]: t for t in flexible_raw}
+    placed : list[ScheduledTask] = []
+
+    previous = sorted(
+        (item for item in schedule.get("scheduled", []) if item.get("task_type") != "fixed"),
+        key=lambda item: item["start_min"],
+    )
+    for item in previous:
+        task_id = item["task_id"]
+        task    = by_id.get(task_id)
+        if task is None or task_id in changed_ids:
+            continue
+        start, end = item["start_min"], item["start_min"] + task.get("duration_minutes", 30)
+        if occupancy.is_free(start, end):
+            placed.append(make_scheduled_task(task, start))
+            occupancy.reserve(start, end)
+
+    # ── Place everything else into the remaining gaps ─────────────────────────
+    kept    = {st.task_id for st in placed}
+    pending = [t for t in flexible_raw if t["id"] not in kept]
+    overflow: list[ScheduledTask] = []
+
+    if pending:
+        statics       = static_scores(pending, today_str)
+        period_scores = period_score_matrix(pending, today_str, prefs, statics)
+        order         = rank_order(period_scores)
+        scores        = expand_period_scores(period_scores[order], slot_grid)
+
+        # Most pending tasks are usually last build's overflow; anything
+        # longer than the biggest gap left is skipped without a slot search.
+        longest = max((end - start for start, end in occupancy.gaps()), default=0)
+
+        for i, idx in enumerate(order):
+            task = pending[idx]
+            if task.get("duration_minutes", 30) > longest:
+                overflow.append(make_overflow_task(task))
+                continue
+            best_start, _ = find_best_slot(
+                task         = task,
+                free_slots   = free_slots,
+                fixed_tasks  = fixed_scheduled,
+                placed_tasks = placed,
+                today_str    = today_str,
+                prefs        = prefs,
+                buffer_min   = buffer_minutes,
+                occupancy    = occupancy,
+                slot_grid    = slot_grid,
+                slot_scores  = scores[i],
+                step         = step,
+            )
+            if best_start is not None:
+                st = make_scheduled_task(task, best_start)
+                placed.append(st)
+                occupancy.reserve(st.start_min, st.end_min)
+            else:
+                overflow.append(make_overflow_task(task))
+
+    valid, extra_overflow = apply_constraints(
+        schedule       = fixed_scheduled + placed,
+        day_start_min  = day_start_min,
+        day_end_min    = day_end_min,
+        buffer_minutes = buffer_minutes,
+    )
+    overflow.extend(extra_overflow)
+
+    return format_schedule(today_str, valid, overflow, len(tasks))
@@ -0,0 +1,158 @@
+"""
+occupancy.py
+------------
+Day-occupancy index used by the slot finder in rule_based.py.
+
+Instead of re-checking every candidate start against every fixed and
+already-placed task, the index keeps the day's remaining free time as a
+sorted list of disjoint gaps. Placing a task carves its buffered interval
+out of the gap list, so:
+
+  - "is [start, end) free (buffer included)" is one bisect   -> O(log n)
+  - "next free gap >= duration" walks gaps, not 15-min cursors
+  - candidate starts are only generated inside gaps that can hold the task
+
+Each gap remembers the start of the original free slot it came from
+(its "anchor"). Candidate starts stay on the anchor's step grid so the
+slot finder tries exactly the same positions it always has -- the index
+only skips the ones that were going to conflict anyway.
+
+Time is integer minutes-since-midnight, same as constraints.py.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterator
+
+
+class DayOccupancy:
+    """
+    Sorted, disjoint free gaps for a single day.
+
+    Built from the output of constraints.find_free_slots() (which already
+    keeps fixed tasks plus their buffer out of the gaps). reserve() is then
+    called for every flexible task as it gets placed.
+
+    window is the (effective_start, day_end_min) placement may use. Pass it:
+    find_free_slots() clamps a fixed task that runs past sleep_time into an
+    inverted block and then reports free time after day_end_min, so every
+    gap is clipped to the window here.
+    """
+
+    def __init__(
+        self,
+        free_slots     : list[tuple[int, int]],
+        buffer_minutes : int = 10,
+        window         : tuple[int, int] | None = None,
+    ):
+        self.buffer_minutes = buffer_minutes
+        self._starts  : list[int] = []
+        self._ends    : list[int] = []
+        self._anchors : list[int] = []
+
+        for start, end in sorted(free_slots):
+            if window is not None:
+                start, end = max(start, window[0]), min(end, window[1])
+            if end <= start:
+                continue
+            # Fixed tasks that wrap past midnight make find_free_slots emit
+            # overlapping slots; fold them into the earlier one. Slots that
+            # only touch stay apart: a zero-length fixed task sits between
+            # them, and apply_constraints() rejects a task spanning it.
+            if self._ends and start < self._ends[-1]:
+                self._ends[-1] = max(self._ends[-1], end)
+                continue
+            self._starts.append(start)
+            self._ends.append(end)
+            self._anchors.append(start)
+
+    def copy(self) -> "DayOccupancy":
+        """Independent copy, for trying out a placement without committing it."""
+        clone = DayOccupancy([], self.buffer_minutes)
+        clone._starts  = self._starts.copy()
+        clone._ends    = self._ends.copy()
+        clone._anchors = self._anchors.copy()
+        return clone
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def gaps(self) -> list[tuple[int, int]]:
+        """Return the current free gaps as (start, end) tuples."""
+        return list(zip(self._starts, self._ends))
+
+    def is_free(self, start: int, end: int) -> bool:
+        """True if [start, end) lies entirely inside one free gap."""
+        i = bisect_right(self._starts, start) - 1
+        return i >= 0 and end <= self._ends[i]
+
+    def next_gap(self, duration: int, from_min: int = 0) -> tuple[int, int] | None:
+        """
+        Return the first free gap (clipped to start at from_min) that can hold
+        `duration` minutes, or None if nothing later in the day is big enough.
+        """
+        i = max(0, bisect_right(self._starts, from_min) - 1)
+        for j in range(i, len(self._starts)):
+            start = max(self._starts[j], from_min)
+            if self._ends[j] - start >= duration:
+                return start, self._ends[j]
+        return None
+
+    def candidate_starts(self, duration: int, step: int = 15) -> Iterator[int]:
+        """
+        Yield every start time, in ascending order, where a task of
+        `duration` minutes fits without conflict.
+
+        Starts are aligned to `step` relative to the gap's anchor (the start
+        of the free slot it was cut from), matching the cursor walk the slot
+        finder has always used.
+        """
+        for start, end, anchor in zip(self._starts, self._ends, self._anchors):
+            if end - start < duration:
+                continue
+            offset = start - anchor
+            cursor = anchor + -(-offset // step) * step  # round up onto the grid
+            yield from range(cursor, end - duration + 1, step)
+
+    def fitting_gaps(self, duration: int) -> Iterator[tuple[int, int, int]]:
+        """Yield (start, end, anchor) for every gap that can hold `duration` minutes."""
+        for start, end, anchor in zip(self._starts, self._ends, self._anchors):
+            if end - start >= duration:
+                yield start, end, anchor
+
+    # ── Updates ───────────────────────────────────────────────────────────────
+
+    def reserve(self, start: int, end: int) -> None:
+        """
+        Mark [start, end) as taken. The buffer is applied on both sides, so
+        the next task has to start at least buffer_minutes after `end`.
+        """
+        block_start = start - self.buffer_minutes
+        block_end   = end   + self.buffer_minutes
+
+        # Gaps that intersect [block_start, block_end)
+        lo = max(0, bisect_right(self._ends, block_start))
+        hi = bisect_left(self._starts, block_end)
+        if lo >= hi:
+            return
+
+        new_starts  : list[int] = []
+        new_ends    : list[int] = []
+        new_anchors : list[int] = []
+
+        first_start, first_anchor = self._starts[lo], self._anchors[lo]
+        if first_start < block_start:
+            new_starts.append(first_start)
+            new_ends.append(block_start)
+            new_anchors.append(first_anchor)
+
+        last_end, last_anchor = self._ends[hi - 1], self._anchors[hi - 1]
+        if block_end < last_end:
+            new_starts.append(block_end)
+            new_ends.append(last_end)
+            new_anchors.append(last_anchor)
+
+        self._starts[lo:hi]  = new_starts
+        self._ends[lo:hi]    = new_ends
+        self._anchors[lo:hi] = new_anchors
@@ -0,0 +1,154 @@
+"""
+optimizer.py
+------------
+Optimizing placement for build_schedule(mode="optimize").
+
+The greedy fill places tasks one at a time in rank order and gives each
+the best slot still free. A long task ranked low often finds no gap big
+enough left, even though moving one earlier task by a slot or two would
+have made room for both.
+
+The optimizer searches over placement *orders*. An order is turned into
+a schedule by the same greedy decode the normal build uses: each task
+takes its best-scoring free start, in order. So every candidate obeys
+the constraints.py rules by construction. The objective is the total
+score_task_for_slot() of all placed tasks.
+
+Search is anytime local search:
+  1. The incumbent is the plain rank order, i.e. the greedy schedule,
+     so optimize mode is never worse than greedy.
+  2. Each step perturbs the current order -- usually by pulling a task
+     that did not fit in front of an earlier one, otherwise by swapping
+     two tasks -- decodes it, and keeps it if the total did not drop.
+  3. When the wall-clock budget (or max_iterations) runs out, the best
+     schedule seen so far is returned.
+
+Decoding restarts from a saved occupancy snapshot at the first position
+the move touched, so a step costs only the tail of the order.
+"""
+
+import random
+import time
+
+import numpy as np
+
+from .day_grid import DayGrid
+from .occupancy import DayOccupancy
+from .slot_search import DEFAULT_STEP, best_start
+
+# Default wall-clock budget for one optimize run.
+DEFAULT_TIME_BUDGET_MS = 50
+
+
+def _decode(
+    order     : list[int],
+    durations : list[int],
+    scores    : np.ndarray,
+    slot_grid : np.ndarray,
+    snapshots : list[DayOccupancy | DayGrid],
+    starts    : list[int | None],
+    totals    : list[float],
+    from_pos  : int,
+    step      : int,
+) -> None:
+    """
+    Greedy-place order[from_pos:] on top of snapshots[from_pos].
+
+    snapshots[k] is the occupancy before the task at position k is placed,
+    totals[k] the score collected by positions < k, and starts[k] the
+    start given to position k (None = did not fit). All three are updated
+    in place from from_pos onward.
+    """
+    occupancy = snapshots[from_pos].copy()
+    total     = totals[from_pos]
+
+    for pos in range(from_pos, len(order)):
+        idx          = order[pos]
+        start, score = best_start(occupancy, durations[idx], slot_grid, scores[idx], step)
+        if start is not None:
+            occupancy.reserve(start, start + durations[idx])
+            total += score
+        starts[pos] = start
+        snapshots[pos + 1] = occupancy.copy()
+        totals[pos + 1]    = total
+
+
+def optimize_starts(
+    occupancy      : DayOccupancy | DayGrid,
+    durations      : list[int],
+    scores         : np.ndarray,
+    slot_grid      : np.ndarray,
+    time_budget_ms : float | None = None,
+    max_iterations : int | None   = None,
+    seed           : int          = 0,
+    step           : int          = DEFAULT_STEP,
+) -> list[int | None]:
+    """
+    Choose start times for ranked tasks to maximize their total score.
+
+    Args:
+        occupancy      : free-time index with only the fixed tasks placed
+                         (not modified)
+        durations      : duration in minutes of each ranked task
+        scores         : score matrix, row i = ranked task i over slot_grid
+        slot_grid      : sorted start minutes the score columns stand for
+        time_budget_ms : wall-clock budget, DEFAULT_TIME_BUDGET_MS if None
+        max_iterations : optional cap on search steps (for reproducible runs)
+        seed           : seed for the move generator
+        step           : slot resolution in minutes (slot_grid's spacing)
+
+    Returns the start minute for each ranked task (None = overflow).
+    """
+    n = len(durations)
+    if n == 0:
+        return []
+
+    budget   = DEFAULT_TIME_BUDGET_MS if time_budget_ms is None else time_budget_ms
+    deadline = time.perf_counter() + budget / 1000
+    rng      = random.Random(seed)
+
+    # Incumbent: rank order, which is exactly the greedy schedule.
+    order     = list(range(n))
+    snapshots : list = [None] * (n + 1)
+    snapshots[0] = occupancy.copy()
+    totals    = [0.0] * (n + 1)
+    starts    : list[int | None] = [None] * n
+    _decode(order, durations, scores, slot_grid, snapshots, starts, totals, 0, step)
+
+    best_total  = totals[n]
+    best_starts = {order[pos]: starts[pos] for pos in range(n)}
+
+    iteration = 0
+    while n > 1 and time.perf_counter() < deadline:
+        if max_iterations is not None and iteration >= max_iterations:
+            break
+        iteration += 1
+
+        unplaced = [pos for pos in range(n) if starts[pos] is None]
+        if unplaced and rng.random() < 0.7:
+            # Pull a task that did not fit in front of an earlier one.
+            src = rng.choice(unplaced)
+            if src == 0:
+                continue
+            dst = rng.randrange(src)
+            candidate = order[:dst] + [order[src]] + order[dst:src] + order[src + 1:]
+            first = dst
+        else:
+            a, b = sorted(rng.sample(range(n), 2))
+            candidate = order.copy()
+            candidate[a], candidate[b] = candidate[b], candidate[a]
+            first = a
+
+        current_total = totals[n]
+        saved = (starts.copy(), totals.copy(), snapshots.copy())
+        _decode(candidate, durations, scores, slot_grid, snapshots, starts, totals, first, step)
+
+        if totals[n] >= current_total:
+            order = candidate
+            if totals[n] > best_total:
+                best_total  = totals[n]
+                best_starts = {order[pos]: starts[pos] for pos in range(n)}
+        else:
+            starts, totals, snapshots = saved
+
+    return [best_starts[i] for i in range(n)]
@@ -21,10 +21,20 @@ start at 0.5 and get updated by the learning engine as feedback comes in.
 
 This file does NOT place tasks -- it only scores and ranks them.
 rule_based.py uses these scores to decide placement order.
+
+score_task_for_slot() scores one (task, time of day) pair. For a whole
+schedule build, score_matrix() scores every task against every candidate
+start minute with NumPy in one pass; the results are identical.
+
+Importance, deadline urgency and procrastination depend only on the task
+and the date, so a build computes them once per task (static_scores) and
+slot scoring only adds the energy and preferred-time terms.
 """
 
 from datetime import date
-from typing import Optional
+from typing import NamedTuple, Optional
+
+import numpy as np
 
 
 # ── Scoring weights ───────────────────────────────────────────────────────────
@@ -38,6 +48,22 @@ W_ENERGY       = 0.20
 W_PREFERRED    = 0.15
 W_PROCRASTINATE = 0.10
 
+# Time-of-day periods in column order for the batched scoring functions.
+# Period boundaries match constraints.time_of_day().
+PERIODS        = ("morning", "afternoon", "evening")
+PERIOD_BOUNDS  = (720, 1080)
+ENERGY_LEVELS  = ("high", "medium", "low")
+
+
+# ── Static (slot-independent) score components ────────────────────────────────
+
+class StaticScore(NamedTuple):
+    """Per-task score terms that do not depend on where the task is placed."""
+    deadline        : Optional[date]   # parsed deadline, None if unset/invalid
+    importance      : float            # importance_score()
+    urgency         : float            # deadline_urgency()
+    procrastination : float            # procrastination_score()
+
 
 # ── Deadline urgency ──────────────────────────────────────────────────────────
 
@@ -58,10 +84,14 @@ def deadline_urgency(deadline_str: Optional[str], today_str: str) -> float:
     try:
         deadline = date.fromisoformat(deadline_str)
         today    = date.fromisoformat(today_str)
-        days_left = (deadline - today).days
     except ValueError:
         return 0.0
 
+    return urgency_for_days((deadline - today).days)
+
+
+def urgency_for_days(days_left: int) -> float:
+    """Map days until the deadline onto the urgency steps of deadline_urgency()."""
     if days_left <= 0:
         return 1.0
     if days_left <= 3:
@@ -127,6 +157,42 @@ def importance_score(importance: int) -> float:
     return (max(1, min(5, importance)) - 1) / 4.0
 
 
+# ── Static components for a whole build ───────────────────────────────────────
+
+def static_scores(tasks: list[dict], today_str: str) -> list[StaticScore]:
+    """
+    Compute the slot-independent score terms for every task once.
+
+    today_str is parsed a single time and each deadline once per task,
+    instead of once per candidate slot.
+    """
+    try:
+        today = date.fromisoformat(today_str)
+    except ValueError:
+        today = None
+
+    statics = []
+    for task in tasks:
+        deadline_str = task.get("deadline")
+        deadline     = None
+        urgency      = 0.0
+        if deadline_str:
+            try:
+                deadline = date.fromisoformat(deadline_str)
+            except ValueError:
+                deadline = None
+            if deadline is not None and today is not None:
+                urgency = urgency_for_days((deadline - today).days)
+
+        statics.append(StaticScore(
+            deadline        = deadline,
+            importance      = importance_score(task.get("importance", 3)),
+            urgency         = urgency,
+            procrastination = procrastination_score(task.get("times_rescheduled", 0)),
+        ))
+    return statics
+
+
 # ── Main scoring function ─────────────────────────────────────────────────────
 
 def score_task_for_slot(
@@ -134,6 +200,7 @@ def score_task_for_slot(
     candidate_time_of_day : str,
     today_str        : str,
     prefs            : dict,
+    static           : StaticScore | None = None,
 ) -> float:
     """
     Compute a composite score for placing a specific task in a specific
@@ -144,10 +211,16 @@ def score_task_for_slot(
 
     prefs dict must have energy_* keys from UserPreferences.
 
+    Pass the task's StaticScore (from static_scores) to skip re-deriving
+    importance, urgency and procrastination on every call.
+
     Returns a float in roughly 0.0-1.0 range.
     """
-    s_importance    = importance_score(task.get("importance", 3))
-    s_deadline      = deadline_urgency(task.get("deadline"), today_str)
+    if static is None:
+        static = static_scores([task], today_str)[0]
+
+    s_importance    = static.importance
+    s_deadline      = static.urgency
     s_energy        = energy_match_score(
                           task.get("energy_level", "medium"),
                           candidate_time_of_day,
@@ -157,7 +230,7 @@ def score_task_for_slot(
                           task.get("preferred_time", "none"),
                           candidate_time_of_day,
                       )
-    s_procrastinate = procrastination_score(task.get("times_rescheduled", 0))
+    s_procrastinate = static.procrastination
 
     return (
         W_IMPORTANCE    * s_importance    +
@@ -168,6 +241,103 @@ def score_task_for_slot(
     )
 
 
+# ── Batched scoring ───────────────────────────────────────────────────────────
+
+def period_score_matrix(
+    tasks     : list[dict],
+    today_str : str,
+    prefs     : dict,
+    statics   : list[StaticScore] | None = None,
+) -> np.ndarray:
+    """
+    Score every task against every time-of-day period at once.
+
+    Returns an array of shape (len(tasks), 3) whose columns follow PERIODS.
+    Cell [i, p] equals score_task_for_slot(tasks[i], PERIODS[p], ...) exactly:
+    the terms are summed in the same order, so ties break the same way.
+
+    statics, if given, must line up with tasks (see static_scores).
+    """
+    n = len(tasks)
+    if n == 0:
+        return np.zeros((0, len(PERIODS)))
+
+    if statics is None:
+        statics = static_scores(tasks, today_str)
+
+    # Task-only terms: one value per task
+    s_importance    = np.array([st.importance      for st in statics])
+    s_deadline      = np.array([st.urgency         for st in statics])
+    s_procrastinate = np.array([st.procrastination for st in statics])
+
+    # Energy curve lookup: row per energy level, column per period
+    energy_table = np.array([
+        [float(prefs.get(f"energy_{period}_{level}", 0.5)) for period in PERIODS]
+        for level in ENERGY_LEVELS
+    ])
+    energy_idx = [
+        ENERGY_LEVELS.index(level) if level in ENERGY_LEVELS else -1
+        for level in (task.get("energy_level", "medium") for task in tasks)
+    ]
+    s_energy = np.where(
+        np.array(energy_idx)[:, None] >= 0,
+        energy_table[energy_idx],
+        0.5,
+    )
+
+    # Preferred time: 1.0 on the matching period, 0.5 everywhere for "none"
+    preferred   = np.array([task.get("preferred_time", "none") for task in tasks], dtype=object)
+    s_preferred = np.where(
+        (preferred == "none")[:, None],
+        0.5,
+        (preferred[:, None] == np.array(PERIODS, dtype=object)[None, :]).astype(float),
+    )
+
+    return (
+        W_IMPORTANCE    * s_importance[:, None]    +
+        W_DEADLINE      * s_deadline[:, None]      +
+        W_ENERGY        * s_energy                 +
+        W_PREFERRED     * s_preferred              +
+        W_PROCRASTINATE * s_procrastinate[:, None]
+    )
+
+
+def score_matrix(
+    tasks      : list[dict],
+    start_mins : "np.ndarray | list[int]",
+    today_str  : str,
+    prefs      : dict,
+) -> np.ndarray:
+    """
+    Score every task against every candidate start minute.
+
+    Returns an array of shape (len(tasks), len(start_mins)) where cell [i, j]
+    is the score of tasks[i] starting at start_mins[j]. Only the period
+    scores are computed per task; each start minute is then mapped to its
+    period and the matrix is filled by indexing.
+    """
+    return expand_period_scores(period_score_matrix(tasks, today_str, prefs), start_mins)
+
+
+def expand_period_scores(
+    period_scores : np.ndarray,
+    start_mins    : "np.ndarray | list[int]",
+) -> np.ndarray:
+    """Turn a (tasks x periods) matrix into a (tasks x start minutes) one."""
+    starts     = np.asarray(start_mins, dtype=np.int64)
+    period_idx = np.searchsorted(PERIOD_BOUNDS, starts, side="right")
+    return period_scores[:, period_idx]
+
+
+def rank_order(period_scores: np.ndarray) -> list[int]:
+    """
+    Row indices of a period_score_matrix() sorted by each task's best period
+    score, highest first. Ties keep their input order.
+    """
+    best_score = period_scores.max(axis=1).tolist() if len(period_scores) else []
+    return sorted(range(len(best_score)), key=best_score.__getitem__, reverse=True)
+
+
 # ── Rank tasks for the day ────────────────────────────────────────────────────
 
 def rank_tasks(
@@ -184,11 +354,5 @@ def rank_tasks(
     Returns tasks sorted highest-score first.
     """
     flexible = [t for t in tasks if t.get("task_type") != "fixed"]
-
-    def best_score(task: dict) -> float:
-        return max(
-            score_task_for_slot(task, period, today_str, prefs)
-            for period in ("morning", "afternoon", "evening")
-        )
-
-    return sorted(flexible, key=best_score, reverse=True)
+    order    = rank_order(period_score_matrix(flexible, today_str, prefs))
+    return [flexible[i] for i in order]
@@ -0,0 +1,64 @@
+"""
+profiling.py
+------------
+Opt-in per-phase timing for a schedule build.
+
+A Profile is passed down through the route and build_schedule(); each
+stage wraps itself in `with profile.phase("name"):` and bumps counters
+with profile.count(). Phases with the same name add up, so a phase can
+be entered more than once (e.g. DB time spread over several queries).
+
+When nobody asked for a profile the code uses NO_PROFILE, whose phase()
+and count() do nothing, so the hot path carries no timing logic of its own.
+"""
+
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import ContextManager, Iterator
+
+
+class Profile:
+    """Wall time per phase (ms) and named counters for one request."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.started  = perf_counter()
+        self.phases   : dict[str, float] = {}
+        self.counters : dict[str, int]   = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (perf_counter() - start) * 1000
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def as_dict(self) -> dict:
+        """The `_profile` block returned to the client (times in ms)."""
+        return {
+            "total_ms" : round((perf_counter() - self.started) * 1000, 3),
+            "phases_ms": {name: round(ms, 3) for name, ms in self.phases.items()},
+            "counters" : dict(self.counters),
+        }
+
+
+class _NoProfile:
+    """Stand-in used when profiling is off: every call is a no-op."""
+
+    enabled = False
+
+    _null = nullcontext()
+
+    def phase(self, name: str) -> ContextManager[None]:
+        return self._null
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+
+NO_PROFILE = _NoProfile()
@@ -8,8 +8,12 @@ Algorithm overview:
   1. Separate fixed tasks (anchors) from flexible/semi tasks
   2. Place fixed tasks into the schedule first -- they cannot move
   3. Find the free time windows between fixed tasks
-  4. Rank remaining tasks using priority_engine.score_task_for_slot
+  4. Compute each task's static score terms once, rank the tasks, and
+     score them against every candidate start in one vectorized pass
   5. Fill free windows with ranked tasks, best-scoring slot first
+     (a DayOccupancy index tracks what is still free as tasks are placed)
+     (mode="optimize" instead searches placement orders for a higher
+     total score within a time budget -- see optimizer.py)
   6. Any tasks that don't fit go into the overflow list
   7. Apply final constraint check to catch any edge cases
 
@@ -17,11 +21,14 @@ The output is two lists:
   scheduled -- tasks with assigned start/end times, sorted by start time
   overflow  -- tasks that could not fit into the day
 
-Both lists use the ScheduledTask TypedDict from constraints.py so the
-API route can serialize them consistently.
+Internally both lists hold constraints.ScheduledTask objects; they are
+turned into plain dicts once, in format_schedule(), so the API route can
+serialize them consistently.
 """
 
-from datetime import date
+from datetime import date, datetime
+
+import numpy as np
 
 from .constraints import (
     ScheduledTask,
@@ -32,7 +39,19 @@ from .constraints import (
     apply_constraints,
     has_conflict_with_fixed,
 )
-from .priority_engine import score_task_for_slot, rank_tasks
+from .day_grid import DayGrid, grid_apply_constraints
+from .occupancy import DayOccupancy
+from .optimizer import optimize_starts
+from .profiling import NO_PROFILE, Profile
+from .slot_search import DEFAULT_STEP, STEP_CHOICES, best_start as search_best_start
+from .priority_engine import (
+    StaticScore,
+    score_task_for_slot,
+    static_scores,
+    period_score_matrix,
+    expand_period_scores,
+    rank_order,
+)
 
 
 # ── Default preferences (used when no UserPreferences row exists yet) ─────────
@@ -55,10 +74,22 @@ DEFAULT_PREFS = {
 }
 
 
+# Placement engines accepted by build_schedule(engine=...).
+#   "interval" -- sorted free-gap index (occupancy.DayOccupancy)
+#   "bitset"   -- 1440-bit minute bitmap (day_grid.DayGrid)
+ENGINES = ("interval", "bitset")
+
+# Placement strategies accepted by build_schedule(mode=...).
+#   "greedy"   -- rank order, each task takes its best free slot
+#   "optimize" -- anytime search over placement orders (optimizer.py),
+#                 starting from the greedy schedule, within a time budget
+MODES = ("greedy", "optimize")
+
+
 # ── Task -> ScheduledTask builder ─────────────────────────────────────────────
 
 def make_scheduled_task(task: dict, start_min: int) -> ScheduledTask:
-    """Build a ScheduledTask dict from a raw task dict and a chosen start time."""
+    """Build a ScheduledTask from a raw task dict and a chosen start time."""
     duration = task.get("duration_minutes", 30)
     end_min  = start_min + duration
     return ScheduledTask(
@@ -72,6 +103,92 @@ def make_scheduled_task(task: dict, start_min: int) -> ScheduledTask:
     )
 
 
+def fixed_and_flexible(tasks: list[dict]) -> tuple[list[ScheduledTask], list[dict]]:
+    """
+    Split tasks into fixed ScheduledTasks (sorted by start) and the raw
+    flexible/semi task dicts left for the slot finder. A fixed task with no
+    time set is treated as semi-flexible.
+    """
+    fixed_scheduled: list[ScheduledTask] = []
+    flexible_raw = [t for t in tasks if t.get("task_type") != "fixed"]
+
+    for task in tasks:
+        if task.get("task_type") != "fixed":
+            continue
+
+        # Tasks from the DB carry pre-parsed minutes; plain dicts may only
+        # have the HH:MM strings.
+        start_min = task.get("fixed_start_min")
+        end_min   = task.get("fixed_end_min")
+        if start_min is None or end_min is None:
+            if not task.get("fixed_start") or not task.get("fixed_end"):
+                # Fixed task with no time set -- treat as semi-flexible
+                flexible_raw.append({**task, "task_type": "semi"})
+                continue
+            start_min = hhmm_to_min(task["fixed_start"])
+            end_min   = hhmm_to_min(task["fixed_end"])
+
+        st = ScheduledTask(
+            task_id           = task["id"],
+            title             = task["title"],
+            start_min         = start_min,
+            end_min           = end_min,
+            energy_level      = task.get("energy_level", "medium"),
+            task_type         = "fixed",
+            times_rescheduled = task.get("times_rescheduled", 0),
+        )
+        fixed_scheduled.append(st)
+
+    # Sort fixed tasks by start time
+    fixed_scheduled.sort(key=lambda t: t.start_min)
+    return fixed_scheduled, flexible_raw
+
+
+def make_overflow_task(task: dict) -> ScheduledTask:
+    """ScheduledTask for a task that could not be placed (start/end = -1)."""
+    return ScheduledTask(
+        task_id           = task["id"],
+        title             = task["title"],
+        start_min         = -1,   # sentinel: not scheduled
+        end_min           = -1,
+        energy_level      = task.get("energy_level", "medium"),
+        task_type         = task.get("task_type", "flexible"),
+        times_rescheduled = task.get("times_rescheduled", 0),
+    )
+
+
+# ── Day window ────────────────────────────────────────────────────────────────
+
+def earliest_start(today_str: str) -> int:
+    """
+    Earliest minute a task may be placed at on today_str, ignoring wake
+    time: 30 minutes from now for today, 00:30 for any other date.
+    """
+    # If scheduling for today, don't place tasks in time slots that have already passed.
+    # For future dates, any time in the day is valid.
+    now = datetime.now()
+    is_today = (today_str == now.date().isoformat())
+    if is_today:
+        now_min = now.hour * 60 + now.minute
+    else:
+        now_min = 0
+    return now_min + 30
+
+
+def day_window(prefs: dict, today_str: str) -> tuple[int, int, int, int]:
+    """
+    Return (day_start_min, day_end_min, effective_start, buffer_minutes).
+
+    effective_start is where placement may begin: wake time for future
+    dates, and no earlier than 30 minutes from now for today.
+    """
+    day_start_min  = hhmm_to_min(prefs.get("wake_time",  "07:00"))
+    day_end_min    = hhmm_to_min(prefs.get("sleep_time", "23:00"))
+    buffer_minutes = int(prefs.get("preferred_buffer_minutes", 10))
+    effective_start = max(day_start_min, earliest_start(today_str))
+    return day_start_min, day_end_min, effective_start, buffer_minutes
+
+
 # ── Slot finder for a single task ─────────────────────────────────────────────
 
 def find_best_slot(
@@ -82,6 +199,11 @@ def find_best_slot(
     today_str    : str,
     prefs        : dict,
     buffer_min   : int,
+    occupancy    : DayOccupancy | DayGrid | None = None,
+    slot_grid    : np.ndarray | None = None,
+    slot_scores  : np.ndarray | None = None,
+    static       : StaticScore | None = None,
+    step         : int = DEFAULT_STEP,
 ) -> tuple[int, float] | tuple[None, None]:
     """
     Find the best available start time for a task across all free slots.
@@ -90,7 +212,22 @@ def find_best_slot(
       - What time of day that position falls in
       - How well that matches the task's energy level and preference
 
-    We try positions at 15-minute increments within each free slot.
+    We try positions at `step`-minute increments (15 by default) within
+    each free slot.
+
+    If an occupancy index is passed (build_schedule always does), only
+    positions inside its remaining gaps are scored and free_slots /
+    fixed_tasks / placed_tasks are not scanned. Without one, every cursor
+    is checked against the placed and fixed task lists.
+
+    slot_grid / slot_scores are this task's row of a precomputed
+    score_matrix() and the sorted start minutes its columns stand for.
+    When given (with an occupancy index), the best start is picked with one
+    array lookup instead of calling score_task_for_slot per position, and
+    steps finer than 15 minutes are searched coarse-to-fine
+    (slot_search.py).
+    Otherwise pass the task's StaticScore so per-position scoring only adds
+    the time-of-day terms.
 
     Returns (best_start_min, best_score) or (None, None) if no slot fits.
     """
@@ -98,8 +235,23 @@ def find_best_slot(
     best_start  = None
     best_score  = -1.0
 
+    if occupancy is not None and slot_scores is not None:
+        return search_best_start(occupancy, duration, slot_grid, slot_scores, step)
+
+    if occupancy is not None:
+        for cursor in occupancy.candidate_starts(duration, step):
+            tod   = time_of_day(cursor)
+            score = score_task_for_slot(task, tod, today_str, prefs, static)
+            if score > best_score:
+                best_score = score
+                best_start = cursor
+
+        if best_start is None:
+            return None, None
+        return best_start, best_score
+
     for slot_start, slot_end in free_slots:
-        # Step through the slot in 15-minute increments
+        # Step through the slot in `step`-minute increments
         cursor = slot_start
         while cursor + duration <= slot_end:
             candidate_end = cursor + duration
@@ -107,18 +259,18 @@ def find_best_slot(
             # Make sure we're not overlapping any already-placed task (with buffer)
             conflict = False
             for placed in placed_tasks:
-                if cursor < placed["end_min"] + buffer_min and placed["start_min"] - buffer_min < candidate_end:
+                if cursor < placed.end_min + buffer_min and placed.start_min - buffer_min < candidate_end:
                     conflict = True
                     break
 
             if not conflict and not has_conflict_with_fixed(cursor, candidate_end, fixed_tasks):
                 tod   = time_of_day(cursor)
-                score = score_task_for_slot(task, tod, today_str, prefs)
+                score = score_task_for_slot(task, tod, today_str, prefs, static)
                 if score > best_score:
                     best_score = score
                     best_start = cursor
 
-            cursor += 15  # 15-minute resolution
+            cursor += step
 
     if best_start is None:
         return None, None
@@ -128,24 +280,42 @@ def find_best_slot(
 # ── Main build function ───────────────────────────────────────────────────────
 
 def build_schedule(
-    tasks     : list[dict],
-    prefs     : dict | None = None,
-    today_str : str | None  = None,
+    tasks          : list[dict],
+    prefs          : dict | None  = None,
+    today_str      : str | None   = None,
+    engine         : str          = "interval",
+    mode           : str          = "greedy",
+    time_budget_ms : float | None = None,
+    step_minutes   : int          = DEFAULT_STEP,
+    profile        : Profile | None = None,
 ) -> dict:
     """
     Build a full day schedule from a list of tasks and user preferences.
 
     Args:
-        tasks     : list of task dicts (from DB, serialized)
-        prefs     : user preferences dict (from UserPreferences model)
-                    Pass None to use DEFAULT_PREFS (for new users)
-        today_str : date string YYYY-MM-DD, defaults to today
-
-    Returns a dict:
+        tasks          : list of task dicts (from DB, serialized)
+        prefs          : user preferences dict (from UserPreferences model)
+                         Pass None to use DEFAULT_PREFS (for new users)
+        today_str      : date string YYYY-MM-DD, defaults to today
+        engine         : placement engine, one of ENGINES. "interval"
+                         (default) or "bitset"; both produce the same schedule
+        mode           : one of MODES. "greedy" (default) or "optimize",
+                         which keeps searching for a higher total score than
+                         the greedy fill until time_budget_ms runs out
+        time_budget_ms : wall-clock budget for mode="optimize"
+                         (optimizer.DEFAULT_TIME_BUDGET_MS if None)
+        step_minutes   : slot resolution, one of STEP_CHOICES (default 15)
+        profile        : optional profiling.Profile; gets wall time for the
+                         free_slots, ranking, slot_search, constraints and
+                         serialization phases plus slot search counters
+
+    Returns the dict built by format_schedule():
         {
           "date"      : "YYYY-MM-DD",
-          "scheduled" : [ ScheduledTask, ... ],   # sorted by start time
-          "overflow"  : [ ScheduledTask, ... ],   # tasks that did not fit
+          "scheduled" : [ {...}, ... ],   # ScheduledTask.to_dict() plus
+                                          # "start_time"/"end_time" ("HH:MM")
+                                          # and "time_of_day"; sorted by start
+          "overflow"  : [ {...}, ... ],   # same keys, times None; did not fit
           "summary"   : {
               "total_tasks"     : int,
               "scheduled_count" : int,
@@ -154,136 +324,155 @@ def build_schedule(
           }
         }
     """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of: {ENGINES}")
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of: {MODES}")
+    if step_minutes not in STEP_CHOICES:
+        raise ValueError(f"step_minutes must be one of: {STEP_CHOICES}")
+
     if prefs is None:
         prefs = DEFAULT_PREFS
 
     if today_str is None:
         today_str = date.today().isoformat()
 
-    # If scheduling for today, don't place tasks in time slots that have already passed.
-    # For future dates, any time in the day is valid.
-    from datetime import datetime
-    now = datetime.now()
-    is_today = (today_str == now.date().isoformat())
-    if is_today:
-        now_min = now.hour * 60 + now.minute
-    else:
-        now_min = 0
+    prof = profile or NO_PROFILE
 
-    # ── Day boundaries ────────────────────────────────────────────────────────
-    day_start_min  = hhmm_to_min(prefs.get("wake_time",  "07:00"))
-    day_end_min    = hhmm_to_min(prefs.get("sleep_time", "23:00"))
-    buffer_minutes = int(prefs.get("preferred_buffer_minutes", 10))
-
-    # ── Step 1: Separate fixed and flexible tasks ──────────────────────────────
-    fixed_raw    = [t for t in tasks if t.get("task_type") == "fixed"]
-    flexible_raw = [t for t in tasks if t.get("task_type") != "fixed"]
+    with prof.phase("free_slots"):
+        # ── Day boundaries ────────────────────────────────────────────────────
+        day_start_min, day_end_min, effective_start, buffer_minutes = day_window(prefs, today_str)
 
-    # ── Step 2: Place fixed tasks ──────────────────────────────────────────────
-    fixed_scheduled: list[ScheduledTask] = []
-    fixed_overflow:  list[ScheduledTask] = []
-
-    for task in fixed_raw:
-        if not task.get("fixed_start") or not task.get("fixed_end"):
-            # Fixed task with no time set -- treat as semi-flexible
-            flexible_raw.append({**task, "task_type": "semi"})
-            continue
+        # ── Steps 1-2: Separate fixed and flexible tasks, place fixed tasks ───
+        fixed_scheduled, flexible_raw = fixed_and_flexible(tasks)
 
-        start_min = hhmm_to_min(task["fixed_start"])
-        end_min   = hhmm_to_min(task["fixed_end"])
-
-        st = ScheduledTask(
-            task_id           = task["id"],
-            title             = task["title"],
-            start_min         = start_min,
-            end_min           = end_min,
-            energy_level      = task.get("energy_level", "medium"),
-            task_type         = "fixed",
-            times_rescheduled = task.get("times_rescheduled", 0),
-        )
-        fixed_scheduled.append(st)
-
-    # Sort fixed tasks by start time
-    fixed_scheduled.sort(key=lambda t: t["start_min"])
-
-    # ── Step 3: Find free time windows ────────────────────────────────────────
-    effective_start = max(day_start_min, now_min + 30)
-    free_slots = find_free_slots(fixed_scheduled, effective_start, day_end_min, buffer_minutes)
-
-    # ── Step 4: Rank flexible/semi tasks ──────────────────────────────────────
-    ranked_tasks = rank_tasks(flexible_raw, today_str, prefs)
+        # ── Step 3: Find free time windows ────────────────────────────────────
+        if engine == "bitset":
+            occupancy  = DayGrid.from_fixed(fixed_scheduled, effective_start, day_end_min, buffer_minutes)
+            free_slots = occupancy.gaps()
+        else:
+            free_slots = find_free_slots(fixed_scheduled, effective_start, day_end_min, buffer_minutes)
+            occupancy  = DayOccupancy(free_slots, buffer_minutes, (effective_start, day_end_min))
+            free_slots = occupancy.gaps()
+
+    with prof.phase("ranking"):
+        # ── Step 4: Rank flexible/semi tasks ──────────────────────────────────
+        # Deadline parsing, urgency, importance and procrastination are computed
+        # once per task here; everything after only adds time-of-day terms.
+        statics       = static_scores(flexible_raw, today_str)
+        period_scores = period_score_matrix(flexible_raw, today_str, prefs, statics)
+        order         = rank_order(period_scores)
+        ranked_tasks  = [flexible_raw[i] for i in order]
+
+        # Every start a task could take today (a 1-minute task fits at any of
+        # them), scored for every task in one matrix: row i is ranked_tasks[i].
+        slot_grid = np.fromiter(occupancy.candidate_starts(1, step_minutes), dtype=np.int64)
+        scores    = expand_period_scores(period_scores[order], slot_grid)
+
+    prof.count("fixed_tasks", len(fixed_scheduled))
+    prof.count("ranked_tasks", len(ranked_tasks))
+    prof.count("candidate_starts", len(slot_grid))
 
     # ── Step 5: Fill free slots ───────────────────────────────────────────────
     placed   : list[ScheduledTask] = []
     overflow : list[ScheduledTask] = []
 
-    for task in ranked_tasks:
-        best_start, best_score = find_best_slot(
-            task         = task,
-            free_slots   = free_slots,
-            fixed_tasks  = fixed_scheduled,
-            placed_tasks = placed,
-            today_str    = today_str,
-            prefs        = prefs,
-            buffer_min   = buffer_minutes,
-        )
-
-        if best_start is not None:
-            st = make_scheduled_task(task, best_start)
-            placed.append(st)
+    with prof.phase("slot_search"):
+        if mode == "optimize":
+            starts = optimize_starts(
+                occupancy      = occupancy,
+                durations      = [t.get("duration_minutes", 30) for t in ranked_tasks],
+                scores         = scores,
+                slot_grid      = slot_grid,
+                time_budget_ms = time_budget_ms,
+                step           = step_minutes,
+            )
+            for task, start in zip(ranked_tasks, starts):
+                if start is not None:
+                    placed.append(make_scheduled_task(task, start))
+                else:
+                    overflow.append(make_overflow_task(task))
         else:
-            # No slot found -- goes to overflow
-            overflow.append(ScheduledTask(
-                task_id           = task["id"],
-                title             = task["title"],
-                start_min         = -1,   # sentinel: not scheduled
-                end_min           = -1,
-                energy_level      = task.get("energy_level", "medium"),
-                task_type         = task.get("task_type", "flexible"),
-                times_rescheduled = task.get("times_rescheduled", 0),
-            ))
+            for i, task in enumerate(ranked_tasks):
+                best_start, best_score = find_best_slot(
+                    task         = task,
+                    free_slots   = free_slots,
+                    fixed_tasks  = fixed_scheduled,
+                    placed_tasks = placed,
+                    today_str    = today_str,
+                    prefs        = prefs,
+                    buffer_min   = buffer_minutes,
+                    occupancy    = occupancy,
+                    slot_grid    = slot_grid,
+                    slot_scores  = scores[i],
+                    step         = step_minutes,
+                )
+
+                if best_start is not None:
+                    st = make_scheduled_task(task, best_start)
+                    placed.append(st)
+                    occupancy.reserve(st.start_min, st.end_min)
+                else:
+                    # No slot found -- goes to overflow
+                    overflow.append(make_overflow_task(task))
 
     # ── Step 6: Combine and apply final constraint check ──────────────────────
-    full_schedule  = fixed_scheduled + placed
-    valid, extra_overflow = apply_constraints(
-        schedule      = full_schedule,
-        day_start_min = day_start_min,
-        day_end_min   = day_end_min,
-        buffer_minutes= buffer_minutes,
-    )
-    overflow.extend(extra_overflow)
+    with prof.phase("constraints"):
+        full_schedule  = fixed_scheduled + placed
+        check = grid_apply_constraints if engine == "bitset" else apply_constraints
+        valid, extra_overflow = check(
+            schedule      = full_schedule,
+            day_start_min = day_start_min,
+            day_end_min   = day_end_min,
+            buffer_minutes= buffer_minutes,
+        )
+        overflow.extend(extra_overflow)
 
+    prof.count("placed", len(placed))
+    prof.count("overflow", len(overflow))
+
+    with prof.phase("serialization"):
+        return format_schedule(today_str, valid, overflow, len(tasks))
+
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+def format_schedule(
+    today_str   : str,
+    valid       : list[ScheduledTask],
+    overflow    : list[ScheduledTask],
+    total_tasks : int,
+) -> dict:
+    """Turn placed/overflow ScheduledTasks into the build_schedule() result dict."""
     # Sort final schedule by start time
-    valid.sort(key=lambda t: t["start_min"])
+    valid.sort(key=lambda t: t.start_min)
 
-    # ── Step 7: Add human-readable time strings ───────────────────────────────
+    # ── Step 7: Convert to dicts, adding human-readable time strings ──────────
     scheduled_out = []
     for st in valid:
-        item = dict(st)
-        item["start_time"] = min_to_hhmm(st["start_min"])
-        item["end_time"]   = min_to_hhmm(st["end_min"])
-        item["time_of_day"] = time_of_day(st["start_min"])
+        item = st.to_dict()
+        item["start_time"]  = min_to_hhmm(st.start_min)
+        item["end_time"]    = min_to_hhmm(st.end_min)
+        item["time_of_day"] = time_of_day(st.start_min)
         scheduled_out.append(item)
 
     overflow_out = []
     for st in overflow:
-        item = dict(st)
+        item = st.to_dict()
         item["start_time"]  = None
         item["end_time"]    = None
         item["time_of_day"] = None
         overflow_out.append(item)
 
     # ── Summary ───────────────────────────────────────────────────────────────
-    total_scheduled_minutes = sum(
-        t["end_min"] - t["start_min"] for t in valid
-    )
+    total_scheduled_minutes = sum(t.end_min - t.start_min for t in valid)
 
     return {
         "date"      : today_str,
         "scheduled" : scheduled_out,
         "overflow"  : overflow_out,
         "summary"   : {
-            "total_tasks"     : len(tasks),
+            "total_tasks"     : total_tasks,
             "scheduled_count" : len(scheduled_out),
             "overflow_count"  : len(overflow_out),
             "total_hours"     : round(total_scheduled_minutes / 60, 1),
@@ -0,0 +1,120 @@
+"""
+slot_search.py
+--------------
+Picks the best start for one task from a precomputed score row.
+
+Candidate starts sit on a grid of `step` minutes anchored at the start of
+each original free slot (see occupancy.py). At the default 15-minute step
+every feasible start is scored -- with one array lookup, so that is cheap.
+
+Finer steps (5 or 10 minutes) multiply the number of candidates, so they
+are searched coarse-to-fine instead:
+
+  1. score every k-th fine start, k chosen so the coarse spacing is at
+     least COARSE_STEP (15 min for a 5-min step, 20 for a 10-min one),
+     plus, in each gap, the first and last fine start and the first fine
+     start at or after each time-of-day boundary (PERIOD_BOUNDS)
+  2. take the best coarse start (earliest on ties)
+  3. score the fine starts within one coarse step either side of it
+
+Scores only change at time-of-day boundaries, so the earliest best start
+of a gap is its first start or its first start past a boundary; both are
+always among the coarse candidates, and the search never does worse
+than scoring every fine start of the day.
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+from .day_grid import DayGrid
+from .occupancy import DayOccupancy
+from .priority_engine import PERIOD_BOUNDS
+
+# Slot resolutions the scheduler accepts, in minutes.
+STEP_CHOICES = (5, 10, 15, 30)
+DEFAULT_STEP = 15
+
+# Steps finer than this are searched coarse-to-fine, at a coarse spacing of
+# at least COARSE_STEP minutes.
+COARSE_STEP = 15
+
+
+def best_start(
+    occupancy   : DayOccupancy | DayGrid,
+    duration    : int,
+    slot_grid   : np.ndarray,
+    slot_scores : np.ndarray,
+    step        : int = DEFAULT_STEP,
+) -> tuple[int, float] | tuple[None, None]:
+    """
+    Best feasible start for a task of `duration` minutes.
+
+    slot_grid is the sorted array of every start on the `step` grid
+    (occupancy.candidate_starts(1, step) before any task was placed) and
+    slot_scores the task's score for each of them. Ties go to the earliest
+    start. Returns (start, score) or (None, None) if nothing fits.
+    """
+    if step < COARSE_STEP:
+        return _coarse_to_fine(occupancy, duration, slot_grid, slot_scores, step)
+
+    feasible = np.fromiter(occupancy.candidate_starts(duration, step), dtype=np.int64)
+    return _pick(feasible, slot_grid, slot_scores)
+
+
+def _pick(
+    starts      : np.ndarray,
+    slot_grid   : np.ndarray,
+    slot_scores : np.ndarray,
+) -> tuple[int, float] | tuple[None, None]:
+    """Highest-scoring of `starts` (sorted), earliest on ties."""
+    if starts.size == 0:
+        return None, None
+    scores = slot_scores[np.searchsorted(slot_grid, starts)]
+    best   = int(np.argmax(scores))  # first maximum = earliest start
+    return int(starts[best]), float(scores[best])
+
+
+def _coarse_to_fine(
+    occupancy   : DayOccupancy | DayGrid,
+    duration    : int,
+    slot_grid   : np.ndarray,
+    slot_scores : np.ndarray,
+    step        : int,
+) -> tuple[int, float] | tuple[None, None]:
+    """Score the coarse grid, then the fine starts around its best start."""
+    coarse_step = step * -(-COARSE_STEP // step)  # smallest multiple of step >= COARSE_STEP
+
+    coarse : list[int] = []
+    bounds : list[tuple[int, int]] = []   # (first, last) fine start in each fitting gap
+    counts : list[int] = []               # len(coarse) after each gap
+
+    for start, end, anchor in occupancy.fitting_gaps(duration):
+        first = anchor + -(-(start - anchor) // step) * step  # round up onto the fine grid
+        last  = end - duration
+        if first > last:
+            continue
+        # Scores change only at PERIOD_BOUNDS: add the first start past each
+        # one, and the gap's last start.
+        edges = {first + -(-(bound - first) // step) * step for bound in PERIOD_BOUNDS if first < bound}
+        edges = {e for e in edges if e <= last} | {first + (last - first) // step * step}
+        coarse.extend(sorted(edges.union(range(first, last + 1, coarse_step))))
+        bounds.append((first, last))
+        counts.append(len(coarse))
+
+    if not coarse:
+        return None, None
+
+    coarse_scores = slot_scores[np.searchsorted(slot_grid, np.asarray(coarse, dtype=np.int64))]
+    i             = int(np.argmax(coarse_scores))
+    first, last   = bounds[bisect_right(counts, i)]
+    centre        = coarse[i]
+
+    # Fine starts up to one coarse step either side (the centre included).
+    fine = np.arange(
+        max(first, centre - coarse_step + step),
+        min(last,  centre + coarse_step - step) + 1,
+        step,
+        dtype=np.int64,
+    )
+    return _pick(fine, slot_grid, slot_scores)
@@ -17,6 +17,9 @@ from backend.config import (
 # Short-lived token used after password login when 2FA is required (5 min)
 TOTP_PENDING_EXPIRE_MINUTES = 5
 
+# Ticket a browser EventSource puts in the URL to open GET /events/stream
+EVENT_TICKET_EXPIRE_SECONDS = 60
+
 __all__ = [
     "JWTError", "hash_password", "verify_password", "create_access_token",
     "decode_access_token", "generate_refresh_token", "hash_refresh_token",
@@ -24,6 +27,7 @@ __all__ = [
     "generate_totp_secret", "verify_totp", "get_totp_uri",
     "create_2fa_pending_token", "decode_2fa_pending_token",
     "create_oauth_state_token", "decode_oauth_state_token",
+    "create_event_ticket", "decode_event_ticket",
 ]
 
 
@@ -48,6 +52,9 @@ def create_access_token(user_id: int, email: str) -> str:
 
 def decode_access_token(token: str) -> dict[str, Any]:
     result: dict[str, Any] = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    # Single-purpose tokens (2FA pending, OAuth state, event tickets) are not access tokens
+    if "purpose" in result:
+        raise JWTError("Not an access token")
     return result
 
 
@@ -127,4 +134,29 @@ def decode_oauth_state_token(token: str) -> dict[str, Any]:
         raise ValueError("Invalid token purpose")
     if not payload.get("provider") or not payload.get("sub"):
         raise ValueError("Invalid state token")
-    return payload
\ No newline at end of file
+    return payload
+
+
+# ── Event stream tickets ──────────────────────────────────────────────────────
+
+def create_event_ticket(user_id: int) -> str:
+    """
+    Token that only opens the user's event stream, for clients that must
+    put it in the URL. Expires after EVENT_TICKET_EXPIRE_SECONDS, so one
+    that ends up in an access log is of little use.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(seconds=EVENT_TICKET_EXPIRE_SECONDS)
+    payload: dict[str, Any] = {
+        "sub": str(user_id),
+        "purpose": "event_stream",
+        "exp": expire,
+        "iat": datetime.now(timezone.utc),
+    }
+    return str(jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM))
+
+
+def decode_event_ticket(token: str) -> dict[str, Any]:
+    payload: dict[str, Any] = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    if payload.get("purpose") != "event_stream":
+        raise ValueError("Invalid token purpose")
+    return payload
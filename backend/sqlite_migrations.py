@@ -9,7 +9,9 @@ from __future__ import annotations
 
 import logging
 from sqlalchemy import text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
+
+from backend.scheduler.constraints import parse_hhmm, weekday_mask
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +36,68 @@ _TASKS_COLUMNS: list[tuple[str, str]] = [
     ("times_rescheduled", "INTEGER NOT NULL DEFAULT 0"),
     ("last_scheduled_date", "TEXT"),
     ("category", "TEXT NOT NULL DEFAULT 'Work'"),
+    ("fixed_start_min", "INTEGER"),
+    ("fixed_end_min", "INTEGER"),
+    ("recurrence_mask", "INTEGER NOT NULL DEFAULT 0"),
+    ("occurrences_through", "TEXT"),
+    ("updated_at", "DATETIME"),
+    ("change_seq", "INTEGER NOT NULL DEFAULT 0"),
+]
+
+# Columns added to other tables after they first shipped.
+_OTHER_COLUMNS: dict[str, list[tuple[str, str]]] = {
+    "users": [("data_version", "INTEGER NOT NULL DEFAULT 0")],
+    "schedule_snapshots": [("inputs_version", "TEXT")],
+    "task_tombstones": [("change_seq", "INTEGER NOT NULL DEFAULT 0")],
+}
+
+# Indexes added to tables that already existed (create_all() only indexes new tables).
+_INDEXES: list[tuple[str, str, list[str]]] = [
+    ("ix_tasks_user_completed_deadline", "tasks", ["user_id", "completed", "deadline"]),
+    ("ix_tasks_user_created", "tasks", ["user_id", "created_at", "id"]),
+    ("ix_tasks_user_change_seq", "tasks", ["user_id", "change_seq"]),
+    ("ix_task_tombstones_user_change_seq", "task_tombstones", ["user_id", "change_seq"]),
 ]
 
 
+
+def _backfill_task_derived_columns(conn: Connection) -> None:
+    """Fill fixed_*_min / recurrence_mask for rows written before those columns existed."""
+    rows = conn.execute(
+        text(
+            "SELECT id, fixed_start, fixed_end, recurrence_days FROM tasks "
+            "WHERE (fixed_start IS NOT NULL AND fixed_start_min IS NULL) "
+            "OR (fixed_end IS NOT NULL AND fixed_end_min IS NULL) "
+            "OR (recurrence_days IS NOT NULL AND recurrence_mask = 0)"
+        )
+    ).fetchall()
+    for task_id, fixed_start, fixed_end, recurrence_days in rows:
+        conn.execute(
+            text(
+                "UPDATE tasks SET fixed_start_min = :start, fixed_end_min = :end, "
+                "recurrence_mask = :mask WHERE id = :id"
+            ),
+            {
+                "start": parse_hhmm(fixed_start),
+                "end": parse_hhmm(fixed_end),
+                "mask": weekday_mask(recurrence_days),
+                "id": task_id,
+            },
+        )
+    if rows:
+        logger.info("SQLite migration: backfilled derived columns on %d tasks", len(rows))
+
+
+def _backfill_updated_at(conn: Connection) -> None:
+    """Rows written before updated_at existed get their created_at."""
+    have = {r[1] for r in conn.execute(text("PRAGMA table_info(tasks)")).fetchall()}
+    if "created_at" not in have:
+        return
+    result = conn.execute(text("UPDATE tasks SET updated_at = created_at WHERE updated_at IS NULL"))
+    if result.rowcount:
+        logger.info("SQLite migration: backfilled updated_at on %d tasks", result.rowcount)
+
+
 def apply_sqlite_migrations(engine: Engine) -> None:
     if not str(engine.url).startswith("sqlite"):
         return
@@ -57,4 +118,23 @@ def apply_sqlite_migrations(engine: Engine) -> None:
             if col in have:
                 continue
             conn.execute(text(f"ALTER TABLE tasks ADD COLUMN {col} {ddl}"))
-            logger.info("SQLite migration: added column tasks.%s", col)
\ No newline at end of file
+            logger.info("SQLite migration: added column tasks.%s", col)
+
+        _backfill_task_derived_columns(conn)
+        _backfill_updated_at(conn)
+
+        for table, columns in _OTHER_COLUMNS.items():
+            rows = conn.execute(text(f"PRAGMA table_info({table})")).fetchall()
+            if not rows:  # table not created yet -- create_all() will make it whole
+                continue
+            have = {r[1] for r in rows}
+            for col, ddl in columns:
+                if col not in have:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {col} {ddl}"))
+                    logger.info("SQLite migration: added column %s.%s", table, col)
+
+        for name, table, columns in _INDEXES:
+            have = {r[1] for r in conn.execute(text(f"PRAGMA table_info({table})")).fetchall()}
+            if not set(columns) <= have:  # an older core column is missing; leave it alone
+                continue
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
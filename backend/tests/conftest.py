@@ -23,6 +23,17 @@ from backend.models import Base
 from backend.dependencies import get_db
 
 
+@pytest.fixture(autouse=True)
+def _reset_schedule_cache():
+    """User ids restart at 1 in every test DB, so cached schedules must not leak between tests."""
+    from backend import recurrence, schedule_cache
+    schedule_cache.reset()
+    recurrence.reset_extension_marks()
+    yield
+    schedule_cache.reset()
+    recurrence.reset_extension_marks()
+
+
 @pytest.fixture
 def db_engine():
     engine = create_engine(
@@ -236,6 +236,31 @@ class TestSQLiteMigrations:
         apply_sqlite_migrations(eng)
         apply_sqlite_migrations(eng)  # second run must not raise
 
+    def test_derived_columns_backfilled(self):
+        """Rows from before fixed_*_min / recurrence_mask get them filled in."""
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.pool import StaticPool
+        eng = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        with eng.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY, user_id INTEGER, title TEXT, "
+                "fixed_start TEXT, fixed_end TEXT, recurrence_days TEXT)"
+            ))
+            conn.execute(text(
+                "INSERT INTO tasks VALUES (1, 1, 'Gym', '09:30', '10:15', NULL), "
+                "(2, 1, 'Walk', NULL, NULL, '0,2,4')"
+            ))
+        apply_sqlite_migrations(eng)
+        with eng.begin() as conn:
+            rows = conn.execute(text(
+                "SELECT fixed_start_min, fixed_end_min, recurrence_mask FROM tasks ORDER BY id"
+            )).fetchall()
+        assert [tuple(r) for r in rows] == [(570, 615, 0), (None, None, 0b10101)]
+
 
 # ── email_utils.py ────────────────────────────────────────────────────────────
 
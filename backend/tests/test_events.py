@@ -0,0 +1,186 @@
+"""
+Change events (backend/event_hub.py, GET /events/stream):
+  - the hub fans one user's events out to all of their subscribers only
+  - a subscriber that falls behind gets a single resync event
+  - task and preference routes publish after they commit
+  - the SSE body: retry hint, events, heartbeats, stop on disconnect
+  - the stream endpoint rejects missing and bad tokens
+  - stream tickets (POST /events/ticket): short-lived, only open the stream
+"""
+
+from __future__ import annotations
+
+import bootstrap_sys_path  # noqa: F401
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from backend.config import ALGORITHM, SECRET_KEY
+from backend.event_hub import EventHub, hub
+from backend.models import User
+from backend.routes.events import event_stream, user_for_ticket
+from backend.tests.helpers import auth_headers, login_form, register_verified_user
+
+
+@pytest.fixture
+def token(client):
+    register_verified_user(client, email="events@example.com", password="Events123", name="Events")
+    r = login_form(client, "events@example.com", "Events123")
+    assert r.status_code == 200
+    return r.json()["access_token"]
+
+
+@pytest.fixture
+def loop():
+    """An event loop running in a background thread, like the server's."""
+    loop   = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def _run(loop, coro):
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=5)
+
+
+def _subscribe(loop, events_hub, user_id):
+    async def subscribe():
+        return events_hub.subscribe(user_id)
+    return _run(loop, subscribe())
+
+
+def _drain(loop, queue):
+    async def drain():
+        await asyncio.sleep(0.05)  # let call_soon_threadsafe deliveries run
+        items = []
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        return items
+    return _run(loop, drain())
+
+
+class TestEventHub:
+    def test_fans_out_to_every_subscriber_of_the_user(self, loop):
+        events_hub = EventHub()
+        first, second = _subscribe(loop, events_hub, 1), _subscribe(loop, events_hub, 1)
+        other = _subscribe(loop, events_hub, 2)
+
+        events_hub.publish(1, "task.updated", id=7)
+
+        assert _drain(loop, first) == [{"type": "task.updated", "id": 7}]
+        assert _drain(loop, second) == [{"type": "task.updated", "id": 7}]
+        assert _drain(loop, other) == []
+
+    def test_unsubscribe_stops_delivery(self, loop):
+        events_hub = EventHub()
+        queue = _subscribe(loop, events_hub, 1)
+        events_hub.unsubscribe(1, queue)
+        events_hub.publish(1, "schedule.invalidated")
+        assert _drain(loop, queue) == []
+        assert events_hub.subscriber_count() == 0
+
+    def test_full_queue_is_replaced_by_resync(self, loop):
+        events_hub = EventHub(queue_size=3)
+        queue = _subscribe(loop, events_hub, 1)
+        for i in range(4):
+            events_hub.publish(1, "task.updated", id=i)
+        assert _drain(loop, queue) == [{"type": "resync"}]
+
+
+class TestRoutesPublish:
+    def test_task_writes_publish_events(self, client, token, loop):
+        queue = _subscribe(loop, hub, 1)
+        try:
+            task_id = client.post("/tasks/", headers=auth_headers(token), json={"title": "Walk"}).json()["task"]["id"]
+            client.post(f"/tasks/{task_id}/complete", headers=auth_headers(token))
+            client.delete(f"/tasks/{task_id}", headers=auth_headers(token))
+            events = _drain(loop, queue)
+        finally:
+            hub.unsubscribe(1, queue)
+
+        assert [e for e in events if e["type"].startswith("task.")] == [
+            {"type": "task.created", "id": task_id},
+            {"type": "task.updated", "id": task_id},
+            {"type": "task.deleted", "id": task_id},
+        ]
+        assert {"type": "schedule.invalidated"} in events
+
+    def test_preferences_update_publishes(self, client, token, loop):
+        queue = _subscribe(loop, hub, 1)
+        try:
+            client.put("/preferences", headers=auth_headers(token), json={"wake_time": "06:00"})
+            events = _drain(loop, queue)
+        finally:
+            hub.unsubscribe(1, queue)
+        assert {"type": "preferences.updated"} in events
+
+
+class TestEventStream:
+    def test_stream_body(self):
+        async def scenario():
+            queue = asyncio.Queue()
+            gone  = False
+
+            async def is_disconnected():
+                return gone
+
+            stream = event_stream(queue, is_disconnected, heartbeat=0.01)
+            chunks = [await stream.__anext__()]
+            await queue.put({"type": "task.created", "id": 3})
+            chunks.append(await stream.__anext__())
+            chunks.append(await stream.__anext__())  # nothing queued: heartbeat
+            gone = True
+            with pytest.raises(StopAsyncIteration):
+                await stream.__anext__()
+            return chunks
+
+        retry, event, ping = asyncio.run(scenario())
+        assert retry.startswith("retry:")
+        name, data = event.strip().split("\n")
+        assert name == "event: task.created"
+        assert json.loads(data.removeprefix("data: ")) == {"type": "task.created", "id": 3}
+        assert ping == ": ping\n\n"
+
+    def test_stream_requires_a_valid_token(self, client):
+        assert client.get("/events/stream").status_code == 401
+        assert client.get("/events/stream", params={"ticket": "nope"}).status_code == 401
+
+    def test_access_token_is_not_accepted_in_the_url(self, client, token):
+        assert client.get("/events/stream", params={"token": token}).status_code == 401
+        assert client.get("/events/stream", params={"ticket": token}).status_code == 401
+
+
+class TestEventTicket:
+    def test_ticket_requires_auth(self, client):
+        assert client.post("/events/ticket").status_code == 401
+
+    def test_ticket_names_the_user(self, client, token, db_session):
+        r = client.post("/events/ticket", headers=auth_headers(token))
+        assert r.status_code == 200
+        assert r.json()["expires_in"] == 60
+        user = user_for_ticket(r.json()["ticket"], db_session)
+        assert user.email == "events@example.com"
+
+    def test_ticket_is_not_an_access_token(self, client, token):
+        ticket = client.post("/events/ticket", headers=auth_headers(token)).json()["ticket"]
+        assert client.get("/tasks/", headers=auth_headers(ticket)).status_code == 401
+        assert client.post("/events/ticket", headers=auth_headers(ticket)).status_code == 401
+
+    def test_expired_ticket_is_rejected(self, token, db_session):
+        user_id = db_session.query(User).filter(User.email == "events@example.com").one().id
+        stale   = jwt.encode(
+            {"sub": str(user_id), "purpose": "event_stream", "exp": datetime.now(timezone.utc) - timedelta(seconds=1)},
+            SECRET_KEY, algorithm=ALGORITHM,
+        )
+        with pytest.raises(HTTPException) as exc:
+            user_for_ticket(stale, db_session)
+        assert exc.value.status_code == 401
@@ -465,7 +465,20 @@ class TestSyncGoogleCalendar:
         with patch("backend.routes.calendar.requests.get", return_value=_fake_ok_response({"items": []})):
             r = client.post("/calendar/google/sync", headers=auth_headers(token))
         assert r.status_code == 200
-        assert r.json() == {"imported": 0, "updated": 0, "skipped": 0}
+        assert r.json() == {"imported": 0, "updated": 0, "skipped": 0, "out_of_hours": 0}
+
+    def test_events_outside_wake_sleep_counted(self, client, token, db_session):
+        uid = _get_user_id(token)
+        _seed_google_creds(db_session, uid)
+        event_page = {"items": [
+            _google_event(event_id="early", start="2030-06-01T05:00:00Z", end="2030-06-01T06:00:00Z"),
+            _google_event(event_id="day",   start="2030-06-01T09:00:00Z", end="2030-06-01T10:00:00Z"),
+            _google_event(event_id="late",  start="2030-06-02T22:30:00Z", end="2030-06-02T23:30:00Z"),
+        ]}
+        with patch("backend.routes.calendar.requests.get", return_value=_fake_ok_response(event_page)):
+            r = client.post("/calendar/google/sync", headers=auth_headers(token))
+        assert r.json()["imported"] == 3
+        assert r.json()["out_of_hours"] == 2
 
     def test_pagination_fetches_all_pages(self, client, token, db_session):
         uid = _get_user_id(token)
@@ -0,0 +1,90 @@
+"""
+Nightly schedule precompute (backend/precompute.py):
+  - every active user gets a snapshot row for the date
+  - GET /schedules/date/{date} serves the snapshot while inputs are unchanged
+  - any task edit after the batch makes the read build normally again
+"""
+
+from __future__ import annotations
+
+import bootstrap_sys_path  # noqa: F401
+
+import json
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import ScheduleSnapshot
+from backend.precompute import main, precompute_schedules
+from backend.tests.helpers import auth_headers, login_form, register_verified_user
+
+
+@pytest.fixture
+def token(client):
+    register_verified_user(client, email="nightly@example.com", password="Nightly12", name="Nightly")
+    r = login_form(client, "nightly@example.com", "Nightly12")
+    assert r.status_code == 200
+    return r.json()["access_token"]
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    return sessionmaker(autoflush=False, autocommit=False, bind=db_engine)
+
+
+def _tomorrow() -> str:
+    return (date.today() + timedelta(days=1)).isoformat()
+
+
+def _mark_snapshot(session_factory, marker: float) -> None:
+    """Tamper with the stored result (not its hash) so a served snapshot is recognisable."""
+    db = session_factory()
+    row = db.query(ScheduleSnapshot).one()
+    result = json.loads(row.result)
+    result["summary"]["total_hours"] = marker
+    row.result = json.dumps(result)
+    db.commit()
+    db.close()
+
+
+class TestPrecompute:
+    def test_snapshot_written_per_active_user(self, client, token, session_factory):
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Plan", "deadline": _tomorrow()})
+        stats = precompute_schedules(_tomorrow(), workers=0, chunk_size=1, session_factory=session_factory)
+        assert stats == {"date": _tomorrow(), "users": 1, "chunks": 1}
+
+        db = session_factory()
+        row = db.query(ScheduleSnapshot).one()
+        assert row.date == _tomorrow()
+        assert [t["title"] for t in json.loads(row.result)["scheduled"]] == ["Plan"]
+        db.close()
+
+    def test_rerun_replaces_snapshot(self, client, token, session_factory):
+        precompute_schedules(_tomorrow(), workers=0, session_factory=session_factory)
+        precompute_schedules(_tomorrow(), workers=0, session_factory=session_factory)
+        db = session_factory()
+        assert db.query(ScheduleSnapshot).count() == 1
+        db.close()
+
+    def test_unchanged_inputs_serve_snapshot(self, client, token, session_factory):
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Plan", "deadline": _tomorrow()})
+        precompute_schedules(_tomorrow(), workers=0, session_factory=session_factory)
+        _mark_snapshot(session_factory, 42.0)
+
+        r = client.get(f"/schedules/date/{_tomorrow()}", headers=auth_headers(token))
+        assert r.json()["summary"]["total_hours"] == 42.0
+
+    def test_edited_inputs_skip_snapshot(self, client, token, session_factory):
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Plan", "deadline": _tomorrow()})
+        precompute_schedules(_tomorrow(), workers=0, session_factory=session_factory)
+        _mark_snapshot(session_factory, 42.0)
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Later", "deadline": _tomorrow()})
+
+        r = client.get(f"/schedules/date/{_tomorrow()}", headers=auth_headers(token))
+        assert r.json()["summary"]["total_hours"] != 42.0
+        assert {t["title"] for t in r.json()["scheduled"]} == {"Plan", "Later"}
+
+    def test_cli_rejects_bad_date(self):
+        with pytest.raises(SystemExit):
+            main(["--date", "tomorrow"])
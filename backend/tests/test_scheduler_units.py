@@ -12,6 +12,7 @@ import bootstrap_sys_path  # noqa: F401
 
 from datetime import date, timedelta
 
+import numpy as np
 import pytest
 
 from backend.scheduler.constraints import (
@@ -22,13 +23,19 @@ from backend.scheduler.constraints import (
     apply_constraints,
     has_conflict_with_fixed,
     ScheduledTask,
+    validate_schedule,
 )
+from backend.scheduler.day_grid import DayGrid, grid_apply_constraints, span_mask
+from backend.scheduler.occupancy import DayOccupancy
 from backend.scheduler.priority_engine import (
     deadline_urgency,
     importance_score,
     procrastination_score,
     preferred_time_score,
     score_task_for_slot,
+    score_matrix,
+    period_score_matrix,
+    static_scores,
     rank_tasks,
 )
 
@@ -96,6 +103,521 @@ class TestApplyConstraints:
         assert len(valid) == 1
         assert len(overflow) == 1
 
+    def test_earlier_task_in_input_wins_conflict(self):
+        # t2 starts first but is listed second, so t1 keeps its slot
+        t1 = ScheduledTask(task_id=1, title="T1", start_min=540, end_min=600,
+                           energy_level="low", task_type="flexible", times_rescheduled=0)
+        t2 = ScheduledTask(task_id=2, title="T2", start_min=500, end_min=545,
+                           energy_level="low", task_type="flexible", times_rescheduled=0)
+        t3 = ScheduledTask(task_id=3, title="T3", start_min=430, end_min=490,
+                           energy_level="low", task_type="flexible", times_rescheduled=0)
+        valid, overflow = apply_constraints([t1, t2, t3], 420, 1380, buffer_minutes=10)
+        assert [t.task_id for t in valid] == [3, 1]
+        assert overflow == [t2]
+
+    def test_inverted_task_checked_against_each_span_not_their_union(self):
+        # Together the fixed tasks cover 500-700, but neither one alone
+        # overlaps a task running backwards from 600 to 540.
+        f1 = ScheduledTask(task_id=1, title="F1", start_min=500, end_min=560,
+                           energy_level="low", task_type="fixed", times_rescheduled=0)
+        f2 = ScheduledTask(task_id=2, title="F2", start_min=550, end_min=700,
+                           energy_level="low", task_type="fixed", times_rescheduled=0)
+        bad = ScheduledTask(task_id=3, title="Bad", start_min=600, end_min=540,
+                            energy_level="low", task_type="flexible", times_rescheduled=0)
+        valid, overflow = apply_constraints([f1, f2, bad], 420, 1380, buffer_minutes=0)
+        assert [t.task_id for t in valid] == [1, 2, 3] and overflow == []
+
+    def test_matches_pairwise_check(self):
+        import random
+
+        def pairwise(schedule, day_start, day_end, buffer):
+            valid    = [t for t in schedule if t.task_type == "fixed"]
+            overflow = []
+            for t in (t for t in schedule if t.task_type != "fixed"):
+                if (t.start_min < day_start or t.end_min > day_end or any(
+                    t.start_min < p.end_min + buffer and p.start_min - buffer < t.end_min for p in valid
+                )):
+                    overflow.append(t)
+                else:
+                    valid.append(t)
+            return sorted(t.task_id for t in valid), [t.task_id for t in overflow]
+
+        rng = random.Random(5)
+        for _ in range(2000):
+            schedule = []
+            for i in range(rng.randint(1, 12)):
+                start = rng.randint(400, 1000)
+                # zero-length, forwards, backwards (a negative duration) or anywhere
+                end = rng.choice([start, start + rng.randint(1, 120), start - rng.randint(1, 120),
+                                  rng.randint(400, 1000)])
+                schedule.append(ScheduledTask(
+                    task_id=i, title="T", start_min=start, end_min=end, energy_level="low",
+                    task_type=rng.choice(["fixed", "flexible", "flexible"]), times_rescheduled=0,
+                ))
+            buffer = rng.choice([0, 5, 30])
+            valid, overflow = apply_constraints(schedule, 420, 980, buffer_minutes=buffer)
+            expected = pairwise(schedule, 420, 980, buffer)
+            assert (sorted(t.task_id for t in valid), [t.task_id for t in overflow]) == expected
+            assert grid_apply_constraints(schedule, 420, 980, buffer_minutes=buffer) == (valid, overflow)
+
+    def test_validate_reports_without_changing(self):
+        fixed = ScheduledTask(task_id=1, title="Early", start_min=300, end_min=360,
+                              energy_level="low", task_type="fixed", times_rescheduled=0)
+        t1 = ScheduledTask(task_id=2, title="T1", start_min=480, end_min=540,
+                           energy_level="low", task_type="flexible", times_rescheduled=0)
+        t2 = ScheduledTask(task_id=3, title="T2", start_min=545, end_min=600,
+                           energy_level="low", task_type="flexible", times_rescheduled=0)
+        late = ScheduledTask(task_id=4, title="Late", start_min=1400, end_min=1430,
+                             energy_level="low", task_type="flexible", times_rescheduled=0)
+        schedule   = [fixed, t1, t2, late]
+        violations = validate_schedule(schedule, 420, 1380, buffer_minutes=10)
+        assert [(v.task.task_id, v.kind) for v in violations] == [
+            (1, "out_of_bounds"), (3, "overlap"), (4, "outside_day"),
+        ]
+        assert fixed.out_of_bounds is False
+        assert validate_schedule([t1], 420, 1380) == []
+
+
+class TestScheduledTask:
+    def _task(self, **overrides):
+        fields = dict(task_id=1, title="T", start_min=480, end_min=540,
+                      energy_level="low", task_type="fixed", times_rescheduled=0)
+        return ScheduledTask(**{**fields, **overrides})
+
+    def test_reads_like_the_old_dict(self):
+        st = self._task()
+        assert st["start_min"] == st.start_min == 480
+        assert st.get("out_of_bounds") is None
+        assert "out_of_bounds" not in st
+        with pytest.raises(KeyError):
+            st["out_of_bounds"]
+        assert dict(st) == st.to_dict() == {
+            "task_id": 1, "title": "T", "start_min": 480, "end_min": 540,
+            "energy_level": "low", "task_type": "fixed", "times_rescheduled": 0,
+        }
+
+    def test_out_of_bounds_flag_is_a_copy(self):
+        st      = self._task(start_min=300, end_min=360)
+        flagged = st.flag_out_of_bounds()
+        assert flagged.to_dict()["out_of_bounds"] is True
+        assert st.out_of_bounds is False
+        assert ScheduledTask.from_dict(flagged.to_dict()) == flagged
+
+    def test_constraints_accept_result_dicts(self):
+        st = self._task(task_type="flexible")
+        valid, overflow = apply_constraints([st.to_dict()], 420, 1380)
+        assert valid == [st] and overflow == []
+
+
+class TestDayOccupancy:
+    def test_reserve_splits_gap_with_buffer(self):
+        occ = DayOccupancy([(420, 1380)], buffer_minutes=10)
+        occ.reserve(600, 660)
+        assert occ.gaps() == [(420, 590), (670, 1380)]
+        assert occ.is_free(420, 590) is True
+        assert occ.is_free(580, 600) is False
+
+    def test_next_gap_skips_gaps_that_are_too_short(self):
+        occ = DayOccupancy([(420, 450), (500, 520), (600, 900)], buffer_minutes=0)
+        assert occ.next_gap(60) == (600, 900)
+        assert occ.next_gap(20, from_min=505) == (600, 900)
+        assert occ.next_gap(400) is None
+
+    def test_candidate_starts_stay_on_original_slot_grid(self):
+        occ = DayOccupancy([(425, 600)], buffer_minutes=10)
+        occ.reserve(425, 455)   # gap now starts at 465
+        starts = list(occ.candidate_starts(30, step=15))
+        assert starts[0] == 470              # 425 + 3*15, first grid point >= 465
+        assert all((s - 425) % 15 == 0 for s in starts)
+        assert starts[-1] + 30 <= 600
+
+    def test_gaps_are_clipped_to_the_window(self):
+        # find_free_slots() reports (1370, 1390) when a fixed task sits after a 23:00 sleep time
+        occ = DayOccupancy([(420, 540), (1370, 1390)], buffer_minutes=0, window=(420, 1380))
+        assert occ.gaps() == [(420, 540), (1370, 1380)]
+        assert list(occ.fitting_gaps(30)) == [(420, 540, 420)]
+
+    def test_touching_slots_stay_apart(self):
+        # A zero-length fixed task at 600 with no buffer splits the day there
+        occ = DayOccupancy([(420, 600), (600, 900)], buffer_minutes=0)
+        assert occ.gaps() == [(420, 600), (600, 900)]
+        assert occ.is_free(570, 630) is False
+
+    def test_reserve_spanning_several_gaps(self):
+        occ = DayOccupancy([(420, 500), (510, 600), (610, 700)], buffer_minutes=5)
+        occ.reserve(490, 620)
+        assert occ.gaps() == [(420, 485), (625, 700)]
+
+
+class TestDayGrid:
+    def test_from_fixed_matches_find_free_slots(self):
+        meeting = ScheduledTask(
+            task_id=1, title="M",
+            start_min=600, end_min=660,
+            energy_level="medium", task_type="fixed", times_rescheduled=0
+        )
+        grid = DayGrid.from_fixed([meeting], 420, 1380, buffer_minutes=10)
+        assert grid.gaps() == find_free_slots([meeting], 420, 1380, buffer_minutes=10)
+
+    def test_reserve_and_is_free(self):
+        grid = DayGrid(span_mask(420, 1380), buffer_minutes=10)
+        grid.reserve(600, 660)
+        assert grid.is_free(420, 590) is True
+        assert grid.is_free(585, 600) is False
+        assert grid.next_gap(60, from_min=600) == (670, 1380)
+
+    def test_grid_constraints_match_list_constraints(self):
+        t1 = ScheduledTask(task_id=1, title="T1", start_min=480, end_min=540,
+                           energy_level="low", task_type="flexible", times_rescheduled=0)
+        t2 = ScheduledTask(task_id=2, title="T2", start_min=500, end_min=560,
+                           energy_level="low", task_type="flexible", times_rescheduled=0)
+        late = ScheduledTask(task_id=3, title="Late", start_min=1400, end_min=1430,
+                             energy_level="low", task_type="flexible", times_rescheduled=0)
+        for buffer in (0, 10):
+            expected = apply_constraints([t1, t2, late], 420, 1380, buffer_minutes=buffer)
+            assert grid_apply_constraints([t1, t2, late], 420, 1380, buffer_minutes=buffer) == expected
+
+    def test_zero_length_fixed_task_splits_the_grid(self):
+        point = ScheduledTask(task_id=1, title="P", start_min=600, end_min=600,
+                              energy_level="low", task_type="fixed", times_rescheduled=0)
+        grid  = DayGrid.from_fixed([point], 420, 900, buffer_minutes=0)
+        assert grid.gaps() == find_free_slots([point], 420, 900, buffer_minutes=0) == [(420, 600), (600, 900)]
+        assert grid.is_free(570, 630) is False
+        assert list(grid.candidate_starts(60, step=30)) == [420, 450, 480, 510, 540, 600, 630, 660, 690, 720, 750, 780, 810, 840]
+
+    def test_grid_constraints_match_for_zero_length_and_touching_tasks(self):
+        import random
+        rng = random.Random(11)
+        for _ in range(500):
+            schedule = []
+            for i in range(rng.randint(1, 8)):
+                start  = rng.randrange(420, 900, 15)
+                length = rng.choice([0, 0, 15, 30, 60])
+                schedule.append(ScheduledTask(
+                    task_id=i, title="T", start_min=start, end_min=start + length, energy_level="low",
+                    task_type=rng.choice(["fixed", "flexible", "flexible"]), times_rescheduled=0,
+                ))
+            buffer = rng.choice([0, 0, 15])
+            assert (grid_apply_constraints(schedule, 420, 900, buffer_minutes=buffer)
+                    == apply_constraints(schedule, 420, 900, buffer_minutes=buffer))
+
+    def test_grid_constraints_match_for_fixed_task_ending_before_it_starts(self):
+        backwards = ScheduledTask(task_id=1, title="Bad", start_min=1127, end_min=1085,
+                                  energy_level="low", task_type="fixed", times_rescheduled=0)
+        across = ScheduledTask(task_id=2, title="T", start_min=1081, end_min=1126,
+                               energy_level="low", task_type="flexible", times_rescheduled=0)
+        expected = apply_constraints([backwards, across], 480, 1430, buffer_minutes=5)
+        assert grid_apply_constraints([backwards, across], 480, 1430, buffer_minutes=5) == expected
+
+
+class TestBuildScheduleEngines:
+    def _tasks(self):
+        today = "2030-01-07"
+        tasks = [
+            {"id": 1, "title": "Standup", "task_type": "fixed", "fixed_start": "09:00",
+             "fixed_end": "09:15", "deadline": today, "energy_level": "medium"},
+            {"id": 2, "title": "Lunch", "task_type": "fixed", "fixed_start": "12:00",
+             "fixed_end": "13:00", "deadline": today, "energy_level": "low"},
+        ]
+        for i in range(3, 15):
+            tasks.append({
+                "id": i, "title": f"T{i}", "task_type": "flexible" if i % 2 else "semi",
+                "duration_minutes": 30 + 15 * (i % 4), "importance": 1 + i % 5,
+                "deadline": today if i % 3 == 0 else None,
+                "energy_level": ("high", "medium", "low")[i % 3],
+                "preferred_time": ("none", "morning", "afternoon", "evening")[i % 4],
+                "times_rescheduled": i % 6,
+            })
+        return tasks, today
+
+    def test_bitset_engine_matches_interval_engine(self):
+        from backend.scheduler.rule_based import build_schedule
+        tasks, today = self._tasks()
+        assert (build_schedule(tasks, None, today, engine="bitset")
+                == build_schedule(tasks, None, today, engine="interval"))
+
+    def test_engines_agree_with_fixed_tasks_outside_the_window(self):
+        import random
+        from backend.scheduler.constraints import min_to_hhmm
+        from backend.scheduler.rule_based import build_schedule
+        rng, day = random.Random(7), "2030-01-07"
+        for _ in range(300):
+            wake, sleep = rng.choice([360, 420, 480]), rng.choice([1200, 1320, 1380])
+            prefs = {"wake_time": min_to_hhmm(wake), "sleep_time": min_to_hhmm(sleep),
+                     "preferred_buffer_minutes": rng.choice([0, 5, 15, 30])}
+            tasks = []
+            for k in range(rng.randint(1, 5)):
+                # before wake, across wake, inside, across sleep, after sleep -- or ending before it starts
+                start = rng.choice([rng.randint(0, wake), rng.randint(wake, sleep), rng.randint(sleep - 60, 1400)])
+                end   = rng.randint(0, 1439) if rng.random() < 0.2 else min(1439, start + rng.randint(5, 240))
+                tasks.append({"id": 100 + k, "title": "F", "task_type": "fixed",
+                              "fixed_start": min_to_hhmm(start), "fixed_end": min_to_hhmm(end)})
+            for i in range(rng.randint(1, 10)):
+                tasks.append({"id": i, "title": f"T{i}", "task_type": "flexible",
+                              "duration_minutes": rng.choice([5, 20, 30, 60, 90]),
+                              "importance": rng.randint(1, 5),
+                              "preferred_time": rng.choice(["none", "morning", "afternoon", "evening"])})
+            step = rng.choice([5, 10, 15])
+            assert (build_schedule(tasks, prefs, day, engine="bitset", step_minutes=step)
+                    == build_schedule(tasks, prefs, day, engine="interval", step_minutes=step))
+
+    def test_engines_agree_with_zero_length_and_touching_fixed_tasks(self):
+        import random
+        from backend.scheduler.constraints import min_to_hhmm
+        from backend.scheduler.rule_based import build_schedule
+        rng, day = random.Random(3), "2030-01-07"
+        for _ in range(300):
+            prefs = {"wake_time": "07:00", "sleep_time": "22:00",
+                     "preferred_buffer_minutes": rng.choice([0, 0, 10])}
+            tasks, end = [], rng.randint(420, 1320)
+            for k in range(rng.randint(1, 5)):
+                # a zero-length task, or one starting where the previous one ended
+                start = end if rng.random() < 0.5 else rng.randint(420, 1320)
+                end   = start if rng.random() < 0.5 else min(1439, start + rng.randint(1, 120))
+                tasks.append({"id": 100 + k, "title": "F", "task_type": "fixed",
+                              "fixed_start": min_to_hhmm(start), "fixed_end": min_to_hhmm(end)})
+            for i in range(rng.randint(1, 10)):
+                tasks.append({"id": i, "title": f"T{i}", "task_type": "flexible",
+                              "duration_minutes": rng.choice([5, 20, 30, 60, 90]),
+                              "importance": rng.randint(1, 5),
+                              "preferred_time": rng.choice(["none", "morning", "afternoon", "evening"])})
+            step = rng.choice([5, 10, 15])
+            assert (build_schedule(tasks, prefs, day, engine="bitset", step_minutes=step)
+                    == build_schedule(tasks, prefs, day, engine="interval", step_minutes=step))
+
+    def test_no_task_placed_across_a_zero_length_fixed_task(self):
+        from backend.scheduler.rule_based import build_schedule
+        day   = "2030-01-08"
+        prefs = {"wake_time": "08:27", "sleep_time": "21:09", "preferred_buffer_minutes": 0}
+        tasks = [
+            {"id": 1, "title": "Ping", "task_type": "fixed", "fixed_start": "12:57", "fixed_end": "12:57"},
+            {"id": 2, "title": "Focus", "task_type": "flexible", "duration_minutes": 60,
+             "preferred_time": "afternoon"},
+        ]
+        for engine in ("interval", "bitset"):
+            result = build_schedule(tasks, prefs, day, engine=engine)
+            assert result["overflow"] == [], engine
+            assert [t["start_time"] for t in result["scheduled"] if t["task_id"] == 2] == ["12:57"], engine
+
+    def test_fixed_task_after_sleep_opens_no_free_time(self):
+        from backend.scheduler.rule_based import build_schedule
+        day   = "2030-01-07"
+        prefs = {"wake_time": "07:00", "sleep_time": "23:00", "preferred_buffer_minutes": 0}
+        tasks = [
+            {"id": 1, "title": "Shift", "task_type": "fixed", "fixed_start": "09:00", "fixed_end": "22:50"},
+            {"id": 2, "title": "Late call", "task_type": "fixed", "fixed_start": "23:30", "fixed_end": "23:50"},
+            {"id": 3, "title": "Read", "task_type": "flexible", "duration_minutes": 30,
+             "preferred_time": "evening", "energy_level": "low"},
+        ]
+        for engine in ("interval", "bitset"):
+            result = build_schedule(tasks, prefs, day, engine=engine)
+            placed = [t for t in result["scheduled"] if t["task_id"] == 3]
+            assert [t["start_time"] for t in placed] == ["07:00"], engine
+
+    def test_unknown_engine_rejected(self):
+        from backend.scheduler.rule_based import build_schedule
+        with pytest.raises(ValueError):
+            build_schedule([], None, "2030-01-07", engine="quantum")
+
+
+class TestOptimizeMode:
+    def _crowded_day(self):
+        day = "2030-01-07"
+        tasks = [
+            {"id": 100 + k, "title": "Meeting", "task_type": "fixed", "deadline": day,
+             "fixed_start": f"{8 + 2 * k:02d}:30", "fixed_end": f"{9 + 2 * k:02d}:10"}
+            for k in range(6)
+        ]
+        for i in range(40):
+            tasks.append({
+                "id": i, "title": f"T{i}", "task_type": "flexible",
+                "duration_minutes": (15, 30, 60, 90, 120)[i % 5], "importance": 1 + i % 5,
+                "energy_level": ("high", "medium", "low")[i % 3],
+                "preferred_time": ("none", "morning", "evening")[i % 3],
+            })
+        return tasks, day
+
+    def test_optimize_never_scores_below_greedy(self):
+        from backend.scheduler.optimizer import optimize_starts
+        from backend.scheduler.priority_engine import expand_period_scores, period_score_matrix, rank_order
+        from backend.scheduler.rule_based import DEFAULT_PREFS, fixed_and_flexible
+        tasks, day = self._crowded_day()
+        fixed, flexible = fixed_and_flexible(tasks)
+        occupancy = DayOccupancy(find_free_slots(fixed, 420, 1380, 10), 10)
+        period    = period_score_matrix(flexible, day, DEFAULT_PREFS)
+        order     = rank_order(period)
+        slot_grid = np.fromiter(occupancy.candidate_starts(1, 15), dtype=np.int64)
+        scores    = expand_period_scores(period[order], slot_grid)
+        durations = [flexible[i]["duration_minutes"] for i in order]
+
+        def total(starts):
+            return sum(scores[i][np.searchsorted(slot_grid, s)] for i, s in enumerate(starts) if s is not None)
+
+        greedy    = optimize_starts(occupancy, durations, scores, slot_grid, max_iterations=0)
+        optimized = optimize_starts(occupancy, durations, scores, slot_grid,
+                                    time_budget_ms=10_000, max_iterations=300)
+        assert total(optimized) > total(greedy)
+
+    def test_optimized_schedule_obeys_constraints(self):
+        from backend.scheduler.rule_based import build_schedule
+        tasks, day = self._crowded_day()
+        result = build_schedule(tasks, None, day, mode="optimize", time_budget_ms=20)
+        _, overflow = apply_constraints(result["scheduled"], 420, 1380, buffer_minutes=10)
+        assert overflow == []
+        assert result["summary"]["scheduled_count"] + result["summary"]["overflow_count"] == len(tasks)
+
+    def test_unknown_mode_rejected(self):
+        from backend.scheduler.rule_based import build_schedule
+        with pytest.raises(ValueError):
+            build_schedule([], None, "2030-01-07", mode="perfect")
+
+
+class TestSlotResolution:
+    def test_five_minute_step_fits_task_a_fifteen_minute_grid_misses(self):
+        from backend.scheduler.rule_based import build_schedule
+        day   = "2030-01-07"
+        prefs = {"wake_time": "09:00", "sleep_time": "10:20", "preferred_buffer_minutes": 0}
+        tasks = [{"id": 1, "title": "Email", "task_type": "flexible", "duration_minutes": 20,
+                  "importance": 5},
+                 {"id": 2, "title": "Report", "task_type": "flexible", "duration_minutes": 60,
+                  "importance": 1}]
+        coarse = build_schedule(tasks, prefs, day)
+        fine   = build_schedule(tasks, prefs, day, step_minutes=5)
+        assert [t["task_id"] for t in coarse["overflow"]] == [2]
+        assert [t["start_time"] for t in fine["scheduled"]] == ["09:00", "09:20"]
+
+    def test_coarse_to_fine_finds_earliest_best_start(self):
+        from backend.scheduler.slot_search import best_start
+        occupancy = DayOccupancy([(425, 1380)], 10)
+        grid   = np.fromiter(occupancy.candidate_starts(1, 5), dtype=np.int64)
+        scores = np.where(grid >= 720, 1.0, 0.5)
+        assert best_start(occupancy, 30, grid, scores, step=5) == (720, 1.0)
+        occupancy.reserve(700, 728)
+        assert best_start(occupancy, 30, grid, scores, step=5) == (740, 1.0)
+
+    def test_finer_step_never_picks_a_worse_start(self):
+        # Two gaps: 11:40-12:25 and 22:00-23:00. The afternoon starts at 12:00
+        # in the first one, between the coarse 5-minute samples.
+        from backend.scheduler.rule_based import build_schedule
+        day   = "2030-01-07"
+        prefs = {"wake_time": "07:00", "sleep_time": "23:00", "preferred_buffer_minutes": 0}
+        tasks = [
+            {"id": 1, "title": "Morning", "task_type": "fixed", "fixed_start": "07:00", "fixed_end": "11:40"},
+            {"id": 2, "title": "Shift", "task_type": "fixed", "fixed_start": "12:25", "fixed_end": "22:00"},
+            {"id": 3, "title": "Call", "task_type": "flexible", "duration_minutes": 20,
+             "preferred_time": "afternoon"},
+        ]
+        for step in (5, 10):
+            result = build_schedule(tasks, prefs, day, step_minutes=step)
+            assert [t["start_time"] for t in result["scheduled"] if t["task_id"] == 3] == ["12:00"], step
+
+    def test_unsupported_step_rejected(self):
+        from backend.scheduler.rule_based import build_schedule
+        with pytest.raises(ValueError):
+            build_schedule([], None, "2030-01-07", step_minutes=7)
+
+
+class TestPatchSchedule:
+    def _tasks(self):
+        return TestBuildScheduleEngines()._tasks()
+
+    def test_no_change_keeps_full_build(self):
+        from backend.scheduler.incremental import patch_schedule
+        from backend.scheduler.rule_based import build_schedule
+        tasks, today = self._tasks()
+        built = build_schedule(tasks, None, today)
+        assert patch_schedule(built, tasks, set(), None, today) == built
+
+    def test_removed_task_frees_its_slot_and_others_stay_put(self):
+        from backend.scheduler.incremental import patch_schedule
+        from backend.scheduler.rule_based import build_schedule
+        tasks, today = self._tasks()
+        built  = build_schedule(tasks, None, today)
+        gone   = next(t["task_id"] for t in built["scheduled"] if t["task_type"] != "fixed")
+        before = {t["task_id"]: t["start_min"] for t in built["scheduled"]}
+
+        patched = patch_schedule(built, [t for t in tasks if t["id"] != gone], {gone}, None, today)
+        after   = {t["task_id"]: t["start_min"] for t in patched["scheduled"]}
+        assert gone not in after
+        assert all(after[i] == before[i] for i in after if i in before)
+        assert patched["summary"]["total_tasks"] == len(tasks) - 1
+
+    def test_new_fixed_task_evicts_only_what_it_overlaps(self):
+        from backend.scheduler.incremental import patch_schedule
+        from backend.scheduler.rule_based import build_schedule
+        tasks, today = self._tasks()
+        built  = build_schedule(tasks, None, today)
+        victim = next(t for t in built["scheduled"] if t["task_type"] != "fixed")
+        event  = {"id": 99, "title": "Imported", "task_type": "fixed", "deadline": today,
+                  "fixed_start": victim["start_time"], "fixed_end": victim["end_time"]}
+
+        patched = patch_schedule(built, tasks + [event], {99}, None, today)
+        placed  = {t["task_id"]: t for t in patched["scheduled"]}
+        assert placed[99]["start_min"] == victim["start_min"]
+        assert placed.get(victim["task_id"], {}).get("start_min") != victim["start_min"]
+        for t in built["scheduled"]:
+            near = (t["start_min"] < victim["end_min"] + 10
+                    and victim["start_min"] - 10 < t["end_min"])
+            if t["task_type"] != "fixed" and not near:
+                assert placed[t["task_id"]]["start_min"] == t["start_min"]
+        _, overflow = apply_constraints(patched["scheduled"], 420, 1380, buffer_minutes=10)
+        assert overflow == []
+
+    def test_new_task_fills_free_time(self):
+        from backend.scheduler.incremental import patch_schedule
+        from backend.scheduler.rule_based import build_schedule
+        tasks, today = self._tasks()
+        built   = build_schedule(tasks[:4], None, today)
+        new     = {"id": 50, "title": "Added", "task_type": "flexible", "duration_minutes": 30}
+        patched = patch_schedule(built, tasks[:4] + [new], {50}, None, today)
+        assert 50 in {t["task_id"] for t in patched["scheduled"]}
+
+
+class TestHorizonPlan:
+    START = "2030-01-07"
+    PREFS = {"wake_time": "09:00", "sleep_time": "13:00", "preferred_buffer_minutes": 0}  # 4h days
+
+    def _semi(self, tid, deadline, minutes, importance=3):
+        return {"id": tid, "title": f"semi {tid}", "task_type": "semi", "deadline": deadline,
+                "duration_minutes": minutes, "importance": importance}
+
+    def _plan(self, tasks, pins=None):
+        from backend.scheduler.horizon import plan_horizon
+        return plan_horizon(tasks, self.PREFS, self.START, pins)
+
+    def test_spreads_tasks_that_would_crowd_one_day(self):
+        plan = self._plan([self._semi(i, "2030-01-09", 180) for i in (1, 2, 3)])
+        assert sorted(plan.days.values()) == ["2030-01-07", "2030-01-08", "2030-01-09"]
+        assert (plan.start, plan.end) == ("2030-01-07", "2030-01-09")
+
+    def test_fixed_tasks_and_due_tasks_take_capacity_first(self):
+        busy = {"id": 9, "title": "Offsite", "task_type": "fixed", "deadline": "2030-01-07",
+                "fixed_start": "09:00", "fixed_end": "12:00"}
+        due  = {"id": 8, "title": "Due", "task_type": "flexible", "deadline": "2030-01-08", "duration_minutes": 200}
+        plan = self._plan([busy, due, self._semi(1, "2030-01-09", 120)])
+        assert plan.days == {1: "2030-01-09"}
+
+    def test_earlier_deadline_is_placed_first(self):
+        busy = {"id": 9, "title": "Offsite", "task_type": "fixed", "deadline": "2030-01-09",
+                "fixed_start": "09:00", "fixed_end": "13:00"}
+        plan = self._plan([self._semi(1, "2030-01-09", 240, importance=5), self._semi(2, "2030-01-08", 240), busy])
+        assert plan.days == {2: "2030-01-07", 1: "2030-01-08"}
+
+    def test_pin_is_kept_while_it_has_room(self):
+        tasks = [self._semi(1, "2030-01-10", 60)]
+        assert self._plan(tasks).days == {1: "2030-01-07"}
+        assert self._plan(tasks, pins={1: "2030-01-09"}).days == {1: "2030-01-09"}
+        assert self._plan(tasks, pins={1: "2030-01-05"}).days == {1: "2030-01-07"}  # pin in the past
+
+    def test_task_that_fits_nowhere_goes_to_its_deadline(self):
+        plan = self._plan([self._semi(1, "2030-01-08", 300)])
+        assert plan.days == {1: "2030-01-08"}
+
+    def test_recurring_and_due_today_tasks_are_not_planned(self):
+        daily = {**self._semi(1, "2030-01-09", 30), "recurrence": "daily"}
+        today = self._semi(2, self.START, 30)
+        assert self._plan([daily, today]).days == {}
+
 
 # ── Priority engine ───────────────────────────────────────────────────────────
 
@@ -187,3 +709,58 @@ class TestRankTasks:
         from backend.scheduler.rule_based import DEFAULT_PREFS
         ranked = rank_tasks(tasks, today, DEFAULT_PREFS)
         assert all(t["task_type"] != "fixed" for t in ranked)
+
+
+class TestScoreMatrix:
+    def _tasks(self):
+        today = date.today()
+        return [
+            {"id": 1, "importance": 5, "deadline": today.isoformat(), "energy_level": "high",
+             "preferred_time": "morning", "times_rescheduled": 2},
+            {"id": 2, "importance": 1, "deadline": None, "energy_level": "low",
+             "preferred_time": "none", "times_rescheduled": 0},
+            {"id": 3, "importance": 3, "deadline": (today + timedelta(days=9)).isoformat(),
+             "energy_level": "medium", "preferred_time": "evening", "times_rescheduled": 7},
+        ]
+
+    def test_matrix_matches_per_slot_scoring(self):
+        from backend.scheduler.rule_based import DEFAULT_PREFS
+        today = date.today().isoformat()
+        tasks = self._tasks()
+        starts = [420, 715, 720, 1075, 1080, 1300]
+        matrix = score_matrix(tasks, starts, today, DEFAULT_PREFS)
+        assert matrix.shape == (3, 6)
+        for i, task in enumerate(tasks):
+            for j, start in enumerate(starts):
+                expected = score_task_for_slot(task, time_of_day(start), today, DEFAULT_PREFS)
+                assert matrix[i, j] == expected
+
+    def test_period_matrix_empty_input(self):
+        assert period_score_matrix([], date.today().isoformat(), {}).shape == (0, 3)
+
+
+class TestStaticScores:
+    def test_static_terms_match_individual_helpers(self):
+        today = date.today()
+        deadline = (today + timedelta(days=5)).isoformat()
+        task = {"importance": 4, "deadline": deadline, "times_rescheduled": 3}
+        (static,) = static_scores([task], today.isoformat())
+        assert static.deadline == today + timedelta(days=5)
+        assert static.urgency == deadline_urgency(deadline, today.isoformat())
+        assert static.importance == importance_score(4)
+        assert static.procrastination == procrastination_score(3)
+
+    def test_invalid_deadline_has_no_urgency(self):
+        (static,) = static_scores([{"deadline": "not-a-date"}], "2030-01-01")
+        assert static.deadline is None
+        assert static.urgency == 0.0
+
+    def test_scoring_with_static_matches_without(self):
+        from backend.scheduler.rule_based import DEFAULT_PREFS
+        today = date.today().isoformat()
+        task = {"importance": 2, "deadline": today, "energy_level": "low",
+                "preferred_time": "evening", "times_rescheduled": 1}
+        (static,) = static_scores([task], today)
+        for period in ("morning", "afternoon", "evening"):
+            assert (score_task_for_slot(task, period, today, DEFAULT_PREFS, static)
+                    == score_task_for_slot(task, period, today, DEFAULT_PREFS))
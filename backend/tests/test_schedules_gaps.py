@@ -298,3 +298,508 @@ class TestScheduleAPIWithPreferences:
 
         r = client.get("/schedules/today", headers=auth_headers(token))
         assert r.status_code == 200
+
+
+class TestScheduleRange:
+    """GET /schedules/range builds several days from one load of the user's data."""
+
+    def test_range_returns_one_schedule_per_day(self, client, token):
+        start = date.today() + timedelta(days=1)
+        end   = start + timedelta(days=6)
+        r = client.get("/schedules/range", headers=auth_headers(token),
+                       params={"start": start.isoformat(), "end": end.isoformat()})
+        assert r.status_code == 200
+        days = r.json()["days"]
+        assert [d["date"] for d in days] == [
+            (start + timedelta(days=i)).isoformat() for i in range(7)
+        ]
+
+    def test_range_days_match_single_date_endpoint(self, client, token):
+        start = date.today() + timedelta(days=1)
+        target = (start + timedelta(days=2)).isoformat()
+        client.post("/tasks/", headers=auth_headers(token),
+                    json={"title": "Due mid-week", "deadline": target})
+        client.post("/tasks/", headers=auth_headers(token),
+                    json={"title": "Gym", "task_type": "fixed", "deadline": target,
+                          "fixed_start": "18:00", "fixed_end": "19:00"})
+        client.post("/tasks/", headers=auth_headers(token),
+                    json={"title": "Daily", "recurrence": "daily"})
+
+        r = client.get("/schedules/range", headers=auth_headers(token),
+                       params={"start": start.isoformat(),
+                               "end": (start + timedelta(days=4)).isoformat()})
+        assert r.status_code == 200
+        for day in r.json()["days"]:
+            single = client.get(f"/schedules/date/{day['date']}",
+                                headers=auth_headers(token)).json()
+            assert day == single
+
+    def test_range_rejects_bad_input(self, client, token):
+        today = date.today()
+        bad = [
+            {"start": "nope", "end": today.isoformat()},
+            {"start": today.isoformat(), "end": (today - timedelta(days=1)).isoformat()},
+            {"start": today.isoformat(), "end": (today + timedelta(days=40)).isoformat()},
+        ]
+        for params in bad:
+            r = client.get("/schedules/range", headers=auth_headers(token), params=params)
+            assert r.status_code == 400
+
+
+class TestScheduleCache:
+    """Schedules are served from the in-process cache until tasks or preferences change."""
+
+    def _stats(self, client, token):
+        return client.get("/schedules/cache/stats", headers=auth_headers(token)).json()
+
+    def test_repeat_read_is_a_cache_hit(self, client, token):
+        day = (date.today() + timedelta(days=2)).isoformat()
+        first = client.get(f"/schedules/date/{day}", headers=auth_headers(token)).json()
+        second = client.get(f"/schedules/date/{day}", headers=auth_headers(token)).json()
+        assert first == second
+        stats = self._stats(client, token)
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_task_write_invalidates_cached_schedule(self, client, token):
+        day = (date.today() + timedelta(days=2)).isoformat()
+        client.get(f"/schedules/date/{day}", headers=auth_headers(token))
+        client.post("/tasks/", headers=auth_headers(token),
+                    json={"title": "New work", "deadline": day})
+        titles = [t["title"] for t in client.get(
+            f"/schedules/date/{day}", headers=auth_headers(token)).json()["scheduled"]]
+        assert "New work" in titles
+
+    def test_preferences_write_invalidates_cached_schedule(self, client, token):
+        day = (date.today() + timedelta(days=2)).isoformat()
+        client.post("/tasks/", headers=auth_headers(token),
+                    json={"title": "Early bird", "deadline": day})
+        client.get(f"/schedules/date/{day}", headers=auth_headers(token))
+        client.put("/preferences", headers=auth_headers(token),
+                   json={"wake_time": "09:00", "sleep_time": "22:00"})
+        scheduled = client.get(f"/schedules/date/{day}",
+                               headers=auth_headers(token)).json()["scheduled"]
+        assert all(t["start_time"] >= "09:00" for t in scheduled)
+
+    def test_write_from_another_worker_invalidates_cached_schedule(self, client, token, db_session):
+        from backend.models import Task
+        day  = (date.today() + timedelta(days=2)).isoformat()
+        task = client.post("/tasks/", headers=auth_headers(token),
+                           json={"title": "Draft", "deadline": day}).json()["task"]
+        client.get(f"/schedules/date/{day}", headers=auth_headers(token))
+
+        # Not through this process's routes: its counters would never hear of it.
+        db_session.get(Task, task["id"]).title = "Final draft"
+        db_session.commit()
+
+        titles = [t["title"] for t in client.get(
+            f"/schedules/date/{day}", headers=auth_headers(token)).json()["scheduled"]]
+        assert titles == ["Final draft"]
+
+    def test_lru_evicts_oldest_entry(self):
+        from backend.schedule_cache import CachedSchedule, ScheduleCache
+        cache = ScheduleCache(max_entries=2)
+        cache.put(("a",), CachedSchedule({"n": 1}, [], None))
+        cache.put(("b",), CachedSchedule({"n": 2}, [], None))
+        cache.get(("a",))
+        cache.put(("c",), CachedSchedule({"n": 3}, [], None))
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)).result == {"n": 1}
+        assert cache.stats()["evictions"] == 1
+
+
+class TestIncrementalTaskChanges:
+    """Task writes patch cached schedules instead of forcing a rebuild."""
+
+    def test_complete_patches_cached_day_without_rebuild(self, client, token):
+        day = (date.today() + timedelta(days=2)).isoformat()
+        keep = _create(client, token, title="Keep", deadline=day, duration_minutes=60)
+        done = _create(client, token, title="Done", deadline=day, duration_minutes=60)
+        before = {t["task_id"]: t["start_time"] for t in _day(client, token, day)["scheduled"]}
+
+        client.post(f"/tasks/{done['id']}/complete", headers=auth_headers(token))
+        after = _day(client, token, day)
+
+        ids = {t["task_id"]: t["start_time"] for t in after["scheduled"]}
+        assert done["id"] not in ids
+        assert ids[keep["id"]] == before[keep["id"]]
+        stats = client.get("/schedules/cache/stats", headers=auth_headers(token)).json()
+        assert stats["misses"] == 1  # only the first read built the day
+
+    def test_delete_patches_cached_day(self, client, token):
+        day = (date.today() + timedelta(days=2)).isoformat()
+        task = _create(client, token, title="Gone", deadline=day)
+        _day(client, token, day)
+        client.delete(f"/tasks/{task['id']}", headers=auth_headers(token))
+        assert task["id"] not in {t["task_id"] for t in _day(client, token, day)["scheduled"]}
+
+    def test_new_fixed_task_is_added_to_cached_day(self, client, token):
+        day = (date.today() + timedelta(days=2)).isoformat()
+        _create(client, token, title="Flexible", deadline=day)
+        _day(client, token, day)
+        event = _create(client, token, title="Meeting", task_type="fixed", deadline=day,
+                             fixed_start="10:00", fixed_end="11:00")
+        scheduled = _day(client, token, day)["scheduled"]
+        assert any(t["task_id"] == event["id"] and t["start_time"] == "10:00" for t in scheduled)
+        assert len(scheduled) == 2
+
+
+class TestScheduleProfiling:
+    """?profile=true / X-Schedule-Profile: 1 add a _profile block to schedule responses."""
+
+    def _seed(self, client, token, day):
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Write", "deadline": day})
+        client.post("/tasks/", headers=auth_headers(token), json={
+            "title": "Call", "task_type": "fixed", "deadline": day,
+            "fixed_start": "10:00", "fixed_end": "10:30",
+        })
+
+    def test_profile_flag_reports_phases(self, client, token, caplog):
+        day = (date.today() + timedelta(days=3)).isoformat()
+        self._seed(client, token, day)
+
+        with caplog.at_level("INFO", logger="backend.routes.schedules"):
+            r = client.get(f"/schedules/date/{day}", params={"profile": "true"}, headers=auth_headers(token))
+        profile = r.json()["_profile"]
+        assert {"db", "eligibility", "free_slots", "ranking", "slot_search",
+                "constraints", "serialization"} <= set(profile["phases_ms"])
+        assert profile["counters"]["tasks_eligible"] == 2
+        assert profile["counters"]["placed"] == 1
+        assert profile["total_ms"] >= profile["phases_ms"]["slot_search"]
+        assert any("schedule_profile" in rec.getMessage() for rec in caplog.records)
+
+    def test_header_enables_profile_and_cache_stays_clean(self, client, token):
+        day = (date.today() + timedelta(days=3)).isoformat()
+        self._seed(client, token, day)
+
+        first = client.get(f"/schedules/date/{day}", headers=auth_headers(token))
+        assert "_profile" not in first.json()
+
+        headers = {**auth_headers(token), "X-Schedule-Profile": "1"}
+        cached  = client.get(f"/schedules/date/{day}", headers=headers).json()
+        assert cached["_profile"]["counters"] == {"cache_hits": 1}
+
+        again = client.get(f"/schedules/date/{day}", headers=auth_headers(token))
+        assert "_profile" not in again.json()
+
+    def test_range_profile(self, client, token):
+        start = date.today() + timedelta(days=3)
+        r = client.get("/schedules/range", params={
+            "start": start.isoformat(), "end": (start + timedelta(days=2)).isoformat(), "profile": "1",
+        }, headers=auth_headers(token))
+        assert r.json()["_profile"]["counters"]["days_built"] == 3
+
+
+class TestMaterializedSchedules:
+    """Built days are written to schedule_snapshots/scheduled_blocks and read back from there."""
+
+    def test_build_writes_blocks_and_last_scheduled_date(self, client, token, db_session):
+        from backend.models import ScheduledBlock, Task
+        day  = (date.today() + timedelta(days=2)).isoformat()
+        task = _create(client, token, title="Draft", deadline=day)
+        scheduled = _day(client, token, day)["scheduled"]
+
+        blocks = db_session.query(ScheduledBlock).filter_by(date=day).all()
+        assert {(b.task_id, b.start_min, b.end_min) for b in blocks} == {
+            (t["task_id"], t["start_min"], t["end_min"]) for t in scheduled
+        }
+        assert db_session.get(Task, task["id"]).last_scheduled_date == day
+
+    def test_unchanged_day_is_read_with_one_query(self, client, token, db_engine):
+        from backend import schedule_cache
+        day = (date.today() + timedelta(days=2)).isoformat()
+        _create(client, token, title="Plan", deadline=day)
+        first = _day(client, token, day)
+        schedule_cache.reset()  # a fresh worker: nothing in memory
+
+        statements = _statements(db_engine)
+        assert _day(client, token, day) == first
+        schedule_reads = [s for s in statements if "users" not in s.split("FROM", 1)[-1]]
+        assert len(schedule_reads) == 1
+        assert "schedule_snapshots" in schedule_reads[0]
+
+    def test_semi_task_keeps_its_day_after_rebuild(self, client, token):
+        from backend import schedule_cache
+        semi = _create(client, token, title="Draft", task_type="semi",
+                            deadline=(date.today() + timedelta(days=5)).isoformat())
+        day  = _planned_day(client, token, semi["id"])
+        schedule_cache.reset()
+        _day(client, token, day)  # materialized: pins the task to day
+
+        # A long task due that day would push an unpinned task elsewhere.
+        _create(client, token, title="Other", deadline=day, duration_minutes=600)
+        schedule_cache.reset()
+
+        ids = {t["task_id"] for t in _day(client, token, day)["scheduled"]}
+        assert semi["id"] in ids
+
+    def test_data_version_tracks_input_edits_only(self, client, token, db_session):
+        from backend.models import User
+        user = db_session.query(User).filter_by(email="schedgap@example.com").one()
+        before = user.data_version
+
+        _create(client, token, title="Plan")
+        db_session.refresh(user)
+        assert user.data_version == before + 1
+
+        _day(client, token, (date.today() + timedelta(days=2)).isoformat())  # sets last_scheduled_date
+        db_session.refresh(user)
+        assert user.data_version == before + 1
+
+
+def _create(client, token, **fields):
+    """POST /tasks/ and return the created task."""
+    return client.post("/tasks/", headers=auth_headers(token), json=fields).json()["task"]
+
+
+def _day(client, token, day):
+    """GET /schedules/date/{day} as JSON."""
+    return client.get(f"/schedules/date/{day}", headers=auth_headers(token)).json()
+
+
+def _statements(db_engine):
+    """Start recording the SQL sent on db_engine; returns the (growing) list."""
+    from sqlalchemy import event
+    seen = []
+    event.listen(db_engine, "before_cursor_execute", lambda *args: seen.append(args[2]))
+    return seen
+
+
+def _planned_day(client, token, task_id):
+    """The one day in the next week whose schedule has task_id."""
+    r = client.get("/schedules/range", params={
+        "start": date.today().isoformat(), "end": (date.today() + timedelta(days=6)).isoformat(),
+    }, headers=auth_headers(token))
+    days = [d["date"] for d in r.json()["days"] if any(t["task_id"] == task_id for t in d["scheduled"])]
+    assert len(days) == 1
+    return days[0]
+
+
+class TestHorizonPlanning:
+    """Semi tasks due later are spread over the days up to their deadline, one day each."""
+
+    def test_semi_tasks_land_on_one_day_each(self, client, token):
+        deadline = (date.today() + timedelta(days=4)).isoformat()
+        ids = [
+            _create(client, token, title=f"Essay {i}", task_type="semi",
+                         deadline=deadline, duration_minutes=480)["id"]
+            for i in range(3)
+        ]
+        days = [_planned_day(client, token, tid) for tid in ids]
+        assert len(set(days)) == 3  # a full day of work each, so no two share a day
+
+    def test_plan_is_cached_and_replanned_on_edit(self, client, token):
+        from backend.schedule_cache import plan_cache
+        deadline = (date.today() + timedelta(days=4)).isoformat()
+        first  = _create(client, token, title="One", task_type="semi", deadline=deadline, duration_minutes=480)
+        day    = _planned_day(client, token, first["id"])
+        client.get(f"/schedules/date/{day}", headers=auth_headers(token))
+        assert plan_cache.stats()["misses"] == 1
+
+        second = _create(client, token, title="Two", task_type="semi", deadline=deadline, duration_minutes=480)
+        assert _planned_day(client, token, second["id"]) != day
+        assert _planned_day(client, token, first["id"]) == day
+        assert plan_cache.stats()["misses"] == 1  # the edit re-planned from the cached inputs
+
+
+class TestOverflowStage:
+    """Overflow is filtered from the already-loaded tasks, not re-read per entry."""
+
+    def test_query_count_does_not_grow_with_overflow(self, client, token, db_engine):
+        light = (date.today() + timedelta(days=2)).isoformat()
+        heavy = (date.today() + timedelta(days=3)).isoformat()
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Only", "deadline": light})
+        for i in range(20):
+            client.post("/tasks/", headers=auth_headers(token), json={
+                "title": f"Crunch {i}", "deadline": heavy, "duration_minutes": 120,
+            })
+
+        # The first read of the day also runs the occurrence window job.
+        client.get("/schedules/today", headers=auth_headers(token))
+
+        counts, overflow = [], []
+        for day in (light, heavy):
+            statements = _statements(db_engine)
+            r = client.get(f"/schedules/date/{day}", params={"profile": "1"}, headers=auth_headers(token))
+            counts.append(len(statements))
+            overflow.append(r.json()["_profile"]["counters"]["overflow"])
+
+        assert overflow[0] == 0 and overflow[1] >= 10
+        assert counts[0] == counts[1]
+
+
+class TestEligibilityClause:
+    """The SQL eligibility rules select the same tasks as is_eligible_on()."""
+
+    def _seed(self, db_session):
+        import itertools
+        from backend.models import Task, User
+        user = db_session.query(User).filter_by(email="schedgap@example.com").one()
+        deadlines  = [None, "2030-03-03", "2030-03-04", "2030-03-06", "2030-03-20"]
+        recurrence = [("none", None), ("daily", None), ("weekly", "0,2"), ("weekly", ""), ("weekly", None)]
+        for task_type, deadline, (rec, days) in itertools.product(["fixed", "semi", "flexible"], deadlines, recurrence):
+            db_session.add(Task(
+                user_id=user.id, title=f"{task_type} {deadline} {rec}", task_type=task_type,
+                deadline=deadline, recurrence=rec, recurrence_days=days,
+                fixed_start="09:00" if task_type == "fixed" else None,
+                fixed_end="10:00" if task_type == "fixed" else None,
+            ))
+        db_session.commit()
+        return user.id
+
+    def _sql(self, db_session, user_id, start, end):
+        from backend.models import Task
+        from backend.routes.schedules import eligibility_clause
+        rows = db_session.query(Task.id).filter(
+            Task.user_id == user_id, Task.completed == False, eligibility_clause(start, end),
+        )
+        return {tid for (tid,) in rows}
+
+    def _python(self, db_session, user_id, day):
+        from backend.models import Task
+        from backend.routes.schedules import is_eligible_on
+        tasks = db_session.query(Task).filter(Task.user_id == user_id).all()
+        return {t.id for t in tasks if is_eligible_on(t, day.isoformat(), day.weekday())}
+
+    def test_single_days_match(self, client, token, db_session):
+        user_id = self._seed(db_session)
+        for day in [date(2030, 3, 3) + timedelta(days=i) for i in range(5)]:
+            assert self._sql(db_session, user_id, day.isoformat(), day.isoformat()) \
+                == self._python(db_session, user_id, day)
+
+    def test_range_is_union_of_its_days(self, client, token, db_session):
+        user_id = self._seed(db_session)
+        days    = [date(2030, 3, 3) + timedelta(days=i) for i in range(3)]
+        union   = set().union(*(self._python(db_session, user_id, d) for d in days))
+        assert self._sql(db_session, user_id, days[0].isoformat(), days[-1].isoformat()) == union
+
+
+class TestRecurringOccurrences:
+    """Recurring tasks are materialized per day and completed one day at a time."""
+
+    def _ids(self, client, token, day):
+        r = client.get(f"/schedules/date/{day}", headers=auth_headers(token)).json()
+        return {t["task_id"] for t in r["scheduled"]}
+
+    def test_create_materializes_the_window(self, client, token, db_session):
+        from backend.models import TaskOccurrence
+        from backend.recurrence import OCCURRENCE_WINDOW_DAYS
+        task = _create(client, token, title="Stretch", recurrence="daily")
+        dates = [o.date for o in db_session.query(TaskOccurrence).filter_by(task_id=task["id"])]
+        assert len(dates) == OCCURRENCE_WINDOW_DAYS
+        assert min(dates) == date.today().isoformat()
+
+    def test_completing_checks_off_one_day(self, client, token):
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        after    = (date.today() + timedelta(days=2)).isoformat()
+        task = _create(client, token, title="Stretch", recurrence="daily")
+        assert task["id"] in self._ids(client, token, tomorrow)  # cached, then patched
+
+        r = client.post(f"/tasks/{task['id']}/complete", params={"date": tomorrow}, headers=auth_headers(token))
+        assert r.status_code == 200
+        assert r.json()["occurrence_date"] == tomorrow
+        assert r.json()["task"]["completed"] is False
+
+        assert task["id"] not in self._ids(client, token, tomorrow)
+        assert task["id"] in self._ids(client, token, after)
+
+    def test_complete_on_a_day_it_does_not_recur_returns_422(self, client, token):
+        monday = date.today() + timedelta(days=7 - date.today().weekday())
+        task = _create(client, token, title="Gym", recurrence="weekly", recurrence_days="0")
+        r = client.patch(f"/tasks/{task['id']}/complete",
+                         params={"date": (monday + timedelta(days=1)).isoformat()}, headers=auth_headers(token))
+        assert r.status_code == 422
+
+    def test_recurrence_change_rewrites_open_occurrences(self, client, token, db_session):
+        from backend.models import TaskOccurrence
+        task = _create(client, token, title="Gym", recurrence="daily")
+        client.put(f"/tasks/{task['id']}", headers=auth_headers(token),
+                   json={"recurrence": "weekly", "recurrence_days": "0"})
+        days = {date.fromisoformat(o.date).weekday() for o in db_session.query(TaskOccurrence).filter_by(task_id=task["id"])}
+        assert days == {0}
+
+    def test_extend_window_tops_up_running_out_tasks(self, client, token, db_session):
+        from backend.models import Task, TaskOccurrence, User
+        from backend.recurrence import extend_window, window_end
+        user  = db_session.query(User).filter_by(email="schedgap@example.com").one()
+        task  = _create(client, token, title="Stretch", recurrence="daily")
+        later = (date.today() + timedelta(days=10)).isoformat()
+
+        assert extend_window(db_session, user.id, later) == 10
+        assert db_session.get(Task, task["id"]).occurrences_through == window_end(later)
+        assert extend_window(db_session, user.id, later) == 0
+        assert db_session.query(TaskOccurrence).filter_by(date=window_end(later)).count() == 1
+
+    def test_analytics_reports_occurrence_completion(self, client, token):
+        today = date.today().isoformat()
+        task  = _create(client, token, title="Stretch", recurrence="daily", category="Exercise")
+        client.post(f"/tasks/{task['id']}/complete", headers=auth_headers(token))
+
+        r = client.get("/analytics/daily", params={"date": today}, headers=auth_headers(token)).json()
+        assert [(t["id"], t["completed"]) for t in r["tasks"]] == [(task["id"], True)]
+        r = client.get("/analytics/daily", params={"date": (date.today() + timedelta(days=1)).isoformat()},
+                       headers=auth_headers(token)).json()
+        assert [(t["id"], t["completed"]) for t in r["tasks"]] == [(task["id"], False)]
+
+
+class TestConditionalGet:
+    """Polled read endpoints answer If-None-Match with 304 until the user's data changes."""
+
+    def _get(self, client, token, url, etag=None, **params):
+        headers = auth_headers(token)
+        if etag:
+            headers["If-None-Match"] = etag
+        return client.get(url, params=params, headers=headers)
+
+    def test_tasks_304_until_a_task_changes(self, client, token):
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Plan"})
+        first = self._get(client, token, "/tasks/")
+        etag  = first.headers["ETag"]
+
+        again = self._get(client, token, "/tasks/", etag)
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["ETag"] == etag
+
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Second"})
+        changed = self._get(client, token, "/tasks/", etag)
+        assert changed.status_code == 200
+        assert len(changed.json()["tasks"]) == 2
+
+    def test_tasks_etag_moves_when_a_build_sets_last_scheduled_date(self, client, token):
+        day  = (date.today() + timedelta(days=2)).isoformat()
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Plan", "deadline": day})
+        etag = self._get(client, token, "/tasks/").headers["ETag"]
+        client.get(f"/schedules/date/{day}", headers=auth_headers(token))
+        r = self._get(client, token, "/tasks/", etag)
+        assert r.status_code == 200
+        assert r.json()["tasks"][0]["last_scheduled_date"] == day
+
+    def test_schedule_304_does_not_read_tasks(self, client, token, db_engine):
+        client.post("/tasks/", headers=auth_headers(token), json={"title": "Plan"})
+        etag = self._get(client, token, "/schedules/today").headers["ETag"]
+
+        statements = _statements(db_engine)
+        r = self._get(client, token, "/schedules/today", etag)
+        assert r.status_code == 304
+        assert not [s for s in statements if "FROM tasks" in s]
+
+        other = self._get(client, token, f"/schedules/date/{(date.today() + timedelta(days=1)).isoformat()}", etag)
+        assert other.status_code == 200
+
+    def test_profiled_schedule_has_no_etag(self, client, token):
+        r = self._get(client, token, "/schedules/today", profile="1")
+        assert "ETag" not in r.headers
+
+    def test_preferences_and_analytics(self, client, token):
+        self._get(client, token, "/preferences")  # creates the defaults
+        etag = self._get(client, token, "/preferences").headers["ETag"]
+        assert self._get(client, token, "/preferences", etag).status_code == 304
+        client.put("/preferences", headers=auth_headers(token), json={"wake_time": "06:30"})
+        assert self._get(client, token, "/preferences", etag).status_code == 200
+
+        today = date.today().isoformat()
+        etag  = self._get(client, token, "/analytics/daily", date=today).headers["ETag"]
+        assert self._get(client, token, "/analytics/daily", etag, date=today).status_code == 304
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        assert self._get(client, token, "/analytics/daily", etag, date=tomorrow).status_code == 200
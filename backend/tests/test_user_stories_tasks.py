@@ -4,6 +4,9 @@
 #10 Delete tasks
 #11 Mark tasks complete
 #12 Set and update priority levels (importance 1–5)
+Task list filters and keyset pagination (GET /tasks/?limit=&cursor=)
+Batched task writes (POST /tasks/bulk)
+Delta sync with tombstones (GET /tasks/changes?since=)
 """
 
 from __future__ import annotations
@@ -199,6 +202,25 @@ class TestUserStory9EditTasks:
         assert r.json()["task"]["preferred_time_locked"] is True
         assert r.json()["task"]["preferred_time"] == "evening"
 
+    def test_put_keeps_pre_parsed_columns_in_sync(self, client, token, db_session):
+        from backend.models import Task
+
+        tid = client.post(
+            "/tasks/",
+            headers=auth_headers(token),
+            json={"title": "Class", "task_type": "fixed", "fixed_start": "09:30",
+                  "fixed_end": "10:15", "recurrence": "weekly", "recurrence_days": "0,2"},
+        ).json()["task"]["id"]
+        client.put(
+            f"/tasks/{tid}",
+            headers=auth_headers(token),
+            json={"fixed_start": "13:00", "fixed_end": "14:00", "recurrence_days": "4"},
+        )
+
+        task = db_session.get(Task, tid)
+        assert (task.fixed_start_min, task.fixed_end_min) == (780, 840)
+        assert task.recurrence_mask == 0b10000
+
     def test_edit_nonexistent_task_returns_404(self, client, token):
         r = client.put(
             "/tasks/99999",
@@ -363,3 +385,196 @@ class TestUserStory12PriorityLevels:
             json={"importance": 0},
         )
         assert r.status_code == 422
+
+
+class TestTaskListPagination:
+    def _create(self, client, token, **fields):
+        return client.post("/tasks/", headers=auth_headers(token), json=fields).json()["task"]
+
+    def _list(self, client, token, **params):
+        r = client.get("/tasks/", params=params, headers=auth_headers(token))
+        assert r.status_code == 200
+        return r.json()
+
+    def _list_ids(self, client, token):
+        return [t["id"] for t in self._list(client, token)["tasks"]]
+
+    def test_pages_walk_every_task_once_newest_first(self, client, token):
+        ids = [self._create(client, token, title=f"T{i}")["id"] for i in range(7)]
+        seen, cursor = [], None
+        while True:
+            page = self._list(client, token, limit=3, **({"cursor": cursor} if cursor else {}))
+            seen += [t["id"] for t in page["tasks"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == self._list_ids(client, token)
+        assert sorted(seen) == ids
+
+    def test_new_tasks_do_not_shift_later_pages(self, client, token):
+        for i in range(4):
+            self._create(client, token, title=f"T{i}")
+        first = self._list(client, token, limit=2)
+        self._create(client, token, title="Newer")
+        second = self._list(client, token, limit=2, cursor=first["next_cursor"])
+        assert [t["title"] for t in second["tasks"]] == ["T1", "T0"]
+        assert second["next_cursor"] is None
+
+    def test_filters(self, client, token):
+        self._create(client, token, title="Essay", category="Study", deadline="2030-05-02")
+        self._create(client, token, title="Run", category="Exercise", deadline="2030-05-09")
+        meeting = self._create(client, token, title="Meeting", task_type="fixed", deadline="2030-05-03",
+                               fixed_start="09:00", fixed_end="10:00")
+        client.post(f"/tasks/{meeting['id']}/complete", headers=auth_headers(token))
+
+        titles = lambda **p: {t["title"] for t in self._list(client, token, **p)["tasks"]}
+        assert titles(category="Study") == {"Essay"}
+        assert titles(completed="true") == {"Meeting"}
+        assert titles(completed="false", deadline_from="2030-05-01", deadline_to="2030-05-05") == {"Essay"}
+        assert titles(task_type="fixed", source="manual") == {"Meeting"}
+
+    def test_without_limit_returns_everything_and_no_cursor(self, client, token):
+        for i in range(3):
+            self._create(client, token, title=f"T{i}")
+        body = self._list(client, token)
+        assert len(body["tasks"]) == 3
+        assert "next_cursor" not in body
+
+    def test_bad_cursor_and_dates_return_400(self, client, token):
+        assert client.get("/tasks/", params={"cursor": "nope"}, headers=auth_headers(token)).status_code == 400
+        assert client.get("/tasks/", params={"deadline_from": "May 1"}, headers=auth_headers(token)).status_code == 400
+
+
+class TestBulkTaskOperations:
+    def _bulk(self, client, token, *operations):
+        return client.post("/tasks/bulk", headers=auth_headers(token), json={"operations": list(operations)})
+
+    def _create(self, client, token, **fields):
+        return client.post("/tasks/", headers=auth_headers(token), json=fields).json()["task"]
+
+    def _titles(self, client, token):
+        return {t["title"] for t in client.get("/tasks/", headers=auth_headers(token)).json()["tasks"]}
+
+    def test_mixed_operations_apply_in_order(self, client, token):
+        edit, done, gone = (self._create(client, token, title=t) for t in ("Edit", "Done", "Gone"))
+        r = self._bulk(
+            client, token,
+            {"op": "create", "data": {"title": "New", "duration_minutes": 45}},
+            {"op": "update", "id": edit["id"], "data": {"title": "Edited", "importance": 5}},
+            {"op": "patch", "id": edit["id"], "data": {"preferred_time_locked": True}},
+            {"op": "complete", "id": done["id"]},
+            {"op": "delete", "id": gone["id"]},
+        )
+        assert r.status_code == 200
+        results = r.json()["results"]
+        assert [(x["index"], x["op"], x["ok"]) for x in results] == [
+            (0, "create", True), (1, "update", True), (2, "patch", True), (3, "complete", True), (4, "delete", True),
+        ]
+        assert results[0]["task"]["duration_minutes"] == 45 and results[0]["task"]["id"]
+        assert results[2]["task"]["title"] == "Edited" and results[2]["task"]["preferred_time_locked"] is True
+        assert results[3]["task"]["completed"] is True
+        assert results[4] == {"index": 4, "op": "delete", "ok": True, "id": gone["id"]}
+        assert self._titles(client, token) == {"New", "Edited", "Done"}
+
+    def test_any_failure_applies_nothing(self, client, token):
+        keep = self._create(client, token, title="Keep")
+        r = self._bulk(
+            client, token,
+            {"op": "delete", "id": keep["id"]},
+            {"op": "create", "data": {"title": "Bad", "importance": 9}},
+            {"op": "update", "id": 999999, "data": {"title": "Ghost"}},
+            {"op": "create", "data": {"title": "Fine"}},
+        )
+        assert r.status_code == 422
+        results = r.json()["detail"]["results"]
+        assert [x["ok"] for x in results] == [True, False, False, True]
+        assert results[1]["status"] == 422 and results[2]["status"] == 404
+        assert self._titles(client, token) == {"Keep"}
+
+    def test_operations_on_another_users_task_are_not_found(self, client, token):
+        register_verified_user(client, email="bulk-other@example.com", password="Other123", name="Other")
+        other = login_form(client, "bulk-other@example.com", "Other123").json()["access_token"]
+        theirs = self._create(client, other, title="Theirs")
+        r = self._bulk(client, token, {"op": "delete", "id": theirs["id"]})
+        assert r.status_code == 422
+        assert r.json()["detail"]["results"][0]["status"] == 404
+        assert self._titles(client, other) == {"Theirs"}
+
+    def test_recurring_create_and_per_day_complete(self, client, token):
+        r = self._bulk(client, token, {"op": "create", "data": {"title": "Stretch", "recurrence": "daily"}})
+        task_id = r.json()["results"][0]["task"]["id"]
+        r = self._bulk(client, token, {"op": "complete", "id": task_id, "date": "2030-01-02"})
+        assert r.status_code == 200
+        result = r.json()["results"][0]
+        assert result["occurrence_date"] == "2030-01-02"
+        assert result["task"]["completed"] is False
+
+    def test_rejects_unknown_op_and_empty_batch(self, client, token):
+        assert self._bulk(client, token, {"op": "archive", "id": 1}).status_code == 422
+        assert self._bulk(client, token).status_code == 422
+
+
+class TestTaskChangesSync:
+    def _create(self, client, token, **fields):
+        return client.post("/tasks/", headers=auth_headers(token), json=fields).json()["task"]
+
+    def _changes(self, client, token, since=None):
+        r = client.get("/tasks/changes", params={"since": since} if since else {}, headers=auth_headers(token))
+        assert r.status_code == 200
+        return r.json()
+
+    def test_full_copy_then_only_later_changes(self, client, token):
+        edit = self._create(client, token, title="Edit")
+        gone = self._create(client, token, title="Gone")
+        first = self._changes(client, token)
+        assert {t["title"] for t in first["changed"]} == {"Edit", "Gone"}
+        assert first["deleted"] == [] and first["cursor"]
+
+        client.put(f"/tasks/{edit['id']}", headers=auth_headers(token), json={"title": "Edited"})
+        self._create(client, token, title="New")
+        client.delete(f"/tasks/{gone['id']}", headers=auth_headers(token))
+        delta = self._changes(client, token, first["cursor"])
+        assert {t["title"] for t in delta["changed"]} == {"Edited", "New"}
+        assert delta["deleted"] == [gone["id"]]
+
+        after = self._changes(client, token, delta["cursor"])
+        assert after == {"changed": [], "deleted": [], "cursor": delta["cursor"]}
+
+    def test_change_timestamped_before_the_cursor_is_not_missed(self, client, token, db_session):
+        from datetime import datetime, timedelta, timezone
+        from backend.models import Task, User
+        self._create(client, token, title="Seen")
+        cursor = self._changes(client, token)["cursor"]
+
+        # Another writer's task: stamped before that cursor was handed out, committed after.
+        user = db_session.query(User).filter_by(email="tasks@example.com").one()
+        db_session.add(Task(user_id=user.id, title="Late",
+                            updated_at=datetime.now(timezone.utc) - timedelta(minutes=5)))
+        db_session.commit()
+
+        delta = self._changes(client, token, cursor)
+        assert [t["title"] for t in delta["changed"]] == ["Late"]
+        assert self._changes(client, token, delta["cursor"])["changed"] == []
+
+    def test_bulk_deletes_leave_tombstones(self, client, token):
+        ids = [self._create(client, token, title=f"T{i}")["id"] for i in range(3)]
+        cursor = self._changes(client, token)["cursor"]
+        client.post("/tasks/bulk", headers=auth_headers(token),
+                    json={"operations": [{"op": "delete", "id": i} for i in ids[:2]]})
+        delta = self._changes(client, token, cursor)
+        assert delta["changed"] == [] and delta["deleted"] == sorted(ids[:2])
+
+    def test_scheduler_writes_are_not_changes(self, client, token):
+        self._create(client, token, title="Plan me", duration_minutes=30)
+        cursor = self._changes(client, token)["cursor"]
+        assert client.get("/schedules/today", headers=auth_headers(token)).status_code == 200
+        assert self._changes(client, token, cursor)["changed"] == []
+
+    def test_unchanged_poll_is_304_and_bad_cursor_is_400(self, client, token):
+        self._create(client, token, title="Poll")
+        cursor = self._changes(client, token)["cursor"]
+        r = client.get("/tasks/changes", params={"since": cursor}, headers=auth_headers(token))
+        r2 = client.get("/tasks/changes", params={"since": cursor},
+                        headers={**auth_headers(token), "If-None-Match": r.headers["ETag"]})
+        assert r2.status_code == 304
+        assert client.get("/tasks/changes", params={"since": "nope"}, headers=auth_headers(token)).status_code == 400
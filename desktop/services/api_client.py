@@ -11,3 +11,10 @@ def submit_feedback(payload: dict):
     response = requests.post(f"{API_BASE}/feedback", json=payload)
     response.raise_for_status()
     return response.json()
+
+def get_task_changes(since=None, token=None):
+    params = {"since": since} if since else {}
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    response = requests.get(f"{API_BASE}/tasks/changes", params=params, headers=headers)
+    response.raise_for_status()
+    return response.json()
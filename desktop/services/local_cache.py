@@ -0,0 +1,72 @@
+"""
+Local replica of the user's tasks.
+
+The first sync downloads every task; after that only what changed since
+the saved cursor (GET /tasks/changes), so keeping the list current costs
+O(changes) instead of a full download. The replica and cursor are kept in
+a JSON file so they survive restarts.
+"""
+
+import json
+from pathlib import Path
+
+import requests
+
+from services.api_client import get_task_changes
+
+CACHE_PATH = Path.home() / ".personal-analytics-dashboard" / "tasks.json"
+
+
+class TaskCache:
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self.tasks = {}
+        self.cursor = None
+        self.load()
+
+    def load(self):
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        self.tasks = {task["id"]: task for task in data.get("tasks", [])}
+        self.cursor = data.get("cursor")
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"cursor": self.cursor, "tasks": list(self.tasks.values())}
+        self.path.write_text(json.dumps(data))
+
+    def apply(self, changes):
+        """Fold one GET /tasks/changes response into the replica."""
+        for task_id in changes["deleted"]:
+            self.tasks.pop(task_id, None)
+        for task in changes["changed"]:
+            self.tasks[task["id"]] = task
+        self.cursor = changes["cursor"]
+
+    def sync(self, token=None):
+        """Pull what changed since the last sync and save. Returns the tasks, newest first."""
+        try:
+            changes = get_task_changes(self.cursor, token)
+        except requests.HTTPError as exc:
+            if self.cursor is None or exc.response.status_code != 400:
+                raise
+            # A cursor the server no longer reads (e.g. from an older
+            # version): start over with a full download.
+            self.cursor = None
+            changes = get_task_changes(None, token)
+        if self.cursor is None:
+            self.tasks = {}
+        self.apply(changes)
+        self.save()
+        return self.all()
+
+    def clear(self):
+        """Forget the replica (e.g. on sign-out); the next sync is a full download."""
+        self.tasks = {}
+        self.cursor = None
+        self.path.unlink(missing_ok=True)
+
+    def all(self):
+        return sorted(self.tasks.values(), key=lambda t: (t["created_at"] or "", t["id"]), reverse=True)
@@ -16,6 +16,22 @@ type Task = {
   created_at: string;
 };
 
+type TaskChanges = {
+  changed: Task[];
+  deleted: number[];
+  cursor: string | null;
+};
+
+// Fold a GET /tasks/changes response into the local list, newest first.
+function mergeTaskChanges(tasks: Task[], changes: TaskChanges): Task[] {
+  const byId = new Map(tasks.map((t) => [t.id, t]));
+  for (const id of changes.deleted) byId.delete(id);
+  for (const t of changes.changed) byId.set(t.id, t);
+  return [...byId.values()].sort((a, b) =>
+    a.created_at === b.created_at ? b.id - a.id : a.created_at < b.created_at ? 1 : -1
+  );
+}
+
 type ScheduledItem = {
   task_id: number;
   title: string;
@@ -93,6 +109,8 @@ export default function DashboardView({ onSignOut }: Props) {
   const [creating, setCreating] = useState(false);
   const [createErr, setCreateErr] = useState<string | null>(null);
   const modalRef = useRef<HTMLDivElement>(null);
+  // Sync cursor for GET /tasks/changes; null until the first full download.
+  const syncCursor = useRef<string | null>(null);
 
   const today = new Date();
   const [calYear, setCalYear] = useState(today.getFullYear());
@@ -121,15 +139,24 @@ export default function DashboardView({ onSignOut }: Props) {
     setLoading(true);
     setErr(null);
     try {
-      const res = await fetch(`${API_BASE}/tasks/`, {
+      const since = syncCursor.current;
+      const url = since
+        ? `${API_BASE}/tasks/changes?since=${encodeURIComponent(since)}`
+        : `${API_BASE}/tasks/changes`;
+      const res = await fetch(url, {
         headers: { Authorization: `Bearer ${t}` },
       });
       if (res.status === 401) {
         onSignOut();
         return;
       }
-      const data = await res.json();
-      setTasks(Array.isArray(data.tasks) ? data.tasks : []);
+      if (!res.ok) {
+        syncCursor.current = null; // start over with a full download next time
+        throw new Error(`HTTP ${res.status}`);
+      }
+      const data: TaskChanges = await res.json();
+      setTasks((prev) => mergeTaskChanges(since ? prev : [], data));
+      syncCursor.current = data.cursor;
       emit("tasks-updated").catch(() => {});
     } catch {
       setErr("Could not load tasks. Is the backend running?");
@@ -0,0 +1,274 @@
+"""
+Benchmark suite for backend/scheduler.
+
+Times the scheduler phases on seeded synthetic workloads and records peak
+memory per phase, so scheduler changes can be compared release to release.
+
+Run from the project root:
+    python scripts/bench_scheduler.py                          # default sizes, table
+    python scripts/bench_scheduler.py --out bench.json         # also save JSON
+    python scripts/bench_scheduler.py --sizes 10 100 1000 10000 --profiles calendar_dense
+    python scripts/bench_scheduler.py --compare old.json       # ratios vs a saved run
+
+Phases measured for every (profile, size):
+    find_free_slots   -- free windows between the fixed tasks
+    rank_tasks        -- priority ranking of the flexible/semi tasks
+    apply_constraints -- final constraint pass over a proposed schedule
+    build_schedule    -- the whole pipeline, end to end
+
+Timings are the median (and min) over --repeat runs. Peak memory comes
+from a separate tracemalloc run of each phase, because tracing slows the
+code down.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+# Ensure the project root is on sys.path so backend imports work.
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from backend.scheduler.constraints import ScheduledTask, apply_constraints, find_free_slots, hhmm_to_min, min_to_hhmm
+from backend.scheduler.priority_engine import rank_tasks
+from backend.scheduler.rule_based import DEFAULT_PREFS, build_schedule
+
+# ── Constants ────────────────────────────────────────────────────────────────
+
+BENCH_DATE    = "2030-01-07"   # fixed date so deadlines/urgency are reproducible
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_SEED  = 1234
+
+# Share of fixed / semi / flexible tasks per profile. calendar_dense also
+# makes the fixed tasks short back-to-back events, like a busy calendar import.
+PROFILES: dict[str, dict[str, Any]] = {
+    "balanced"       : {"mix": (0.2, 0.3, 0.5), "dense_calendar": False},
+    "flexible_heavy" : {"mix": (0.05, 0.15, 0.8), "dense_calendar": False},
+    "calendar_dense" : {"mix": (0.6, 0.1, 0.3), "dense_calendar": True},
+}
+
+DURATIONS = [15, 20, 30, 45, 60, 90, 120]
+
+
+# ── Workload generators ──────────────────────────────────────────────────────
+
+def make_tasks(n: int, profile: str, seed: int) -> list[dict]:
+    """Seeded task dicts in the shape routes/schedules.task_to_dict() produces."""
+    rng = random.Random(f"{profile}:{n}:{seed}")
+    fixed_share, semi_share, _ = PROFILES[profile]["mix"]
+    dense = PROFILES[profile]["dense_calendar"]
+    day   = date.fromisoformat(BENCH_DATE)
+
+    tasks = []
+    for i in range(n):
+        roll = rng.random()
+        task_type = "fixed" if roll < fixed_share else "semi" if roll < fixed_share + semi_share else "flexible"
+
+        task: dict[str, Any] = {
+            "id"                   : i + 1,
+            "title"                : f"{task_type} {i + 1}",
+            "task_type"            : task_type,
+            "duration_minutes"     : rng.choice(DURATIONS),
+            "deadline"             : None,
+            "importance"           : rng.randint(1, 5),
+            "energy_level"         : rng.choice(["low", "medium", "high"]),
+            "preferred_time"       : rng.choice(["none", "none", "morning", "afternoon", "evening"]),
+            "preferred_time_locked": False,
+            "fixed_start"          : None,
+            "fixed_end"            : None,
+            "recurrence"           : "none",
+            "recurrence_days"      : None,
+            "times_rescheduled"    : rng.choice([0, 0, 0, 1, 2, 5]),
+            "completed"            : False,
+        }
+
+        if task_type == "fixed":
+            if dense:
+                # Calendar imports: 15-60 min meetings on a 15-min grid, often overlapping
+                start = hhmm_to_min("08:00") + 15 * rng.randrange(40)
+                end   = start + rng.choice([15, 30, 30, 45, 60])
+            else:
+                start = hhmm_to_min("07:00") + 30 * rng.randrange(30)
+                end   = start + rng.choice([30, 60, 90])
+            task["fixed_start"]      = min_to_hhmm(start)
+            task["fixed_end"]        = min_to_hhmm(end)
+            task["duration_minutes"] = end - start
+            task["deadline"]         = BENCH_DATE
+        elif rng.random() < 0.6:
+            task["deadline"] = (day + timedelta(days=rng.randrange(-2, 14))).isoformat()
+
+        tasks.append(task)
+    return tasks
+
+
+def fixed_schedule(tasks: list[dict]) -> list[ScheduledTask]:
+    """Fixed tasks as ScheduledTasks, sorted -- the input find_free_slots() gets."""
+    fixed = [
+        ScheduledTask(
+            task_id=t["id"], title=t["title"],
+            start_min=hhmm_to_min(t["fixed_start"]), end_min=hhmm_to_min(t["fixed_end"]),
+            energy_level=t["energy_level"], task_type="fixed", times_rescheduled=0,
+        )
+        for t in tasks if t["task_type"] == "fixed"
+    ]
+    fixed.sort(key=lambda t: t.start_min)
+    return fixed
+
+
+def proposed_schedule(tasks: list[dict], seed: int) -> list[ScheduledTask]:
+    """Fixed tasks plus every flexible task at a random start -- lots of conflicts to resolve."""
+    rng = random.Random(seed)
+    schedule = fixed_schedule(tasks)
+    for t in tasks:
+        if t["task_type"] == "fixed":
+            continue
+        start = hhmm_to_min("07:00") + 15 * rng.randrange(64)
+        schedule.append(ScheduledTask(
+            task_id=t["id"], title=t["title"],
+            start_min=start, end_min=start + t["duration_minutes"],
+            energy_level=t["energy_level"], task_type=t["task_type"], times_rescheduled=0,
+        ))
+    return schedule
+
+
+# ── Measurement ──────────────────────────────────────────────────────────────
+
+def time_ms(fn: Callable[[], Any], repeat: int) -> tuple[float, float]:
+    """(median, min) wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def peak_kib(fn: Callable[[], Any]) -> float:
+    """Peak traced allocation of one fn() call, in KiB."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def phases(tasks: list[dict], seed: int) -> dict[str, Callable[[], Any]]:
+    """One zero-argument callable per phase, with inputs prepared up front."""
+    prefs    = DEFAULT_PREFS
+    fixed    = fixed_schedule(tasks)
+    day_start, day_end = hhmm_to_min(prefs["wake_time"]), hhmm_to_min(prefs["sleep_time"])
+    buffer   = prefs["preferred_buffer_minutes"]
+    proposal = proposed_schedule(tasks, seed)
+
+    return {
+        "find_free_slots"  : lambda: find_free_slots(fixed, day_start, day_end, buffer),
+        "rank_tasks"       : lambda: rank_tasks(tasks, BENCH_DATE, prefs),
+        "apply_constraints": lambda: apply_constraints(proposal, day_start, day_end, buffer),
+        "build_schedule"   : lambda: build_schedule(tasks, None, BENCH_DATE),
+    }
+
+
+def run(sizes: list[int], profiles: list[str], repeat: int, seed: int) -> list[dict]:
+    results = []
+    for profile in profiles:
+        for n in sizes:
+            tasks = make_tasks(n, profile, seed)
+            # Fewer repeats for the big sizes so a full run stays reasonable.
+            reps = max(1, repeat if n <= 1000 else repeat // 5)
+            for phase, fn in phases(tasks, seed).items():
+                fn()  # warm-up (imports, numpy init, caches)
+                median, fastest = time_ms(fn, reps)
+                results.append({
+                    "profile"  : profile,
+                    "n"        : n,
+                    "phase"    : phase,
+                    "repeat"   : reps,
+                    "median_ms": round(median, 4),
+                    "min_ms"   : round(fastest, 4),
+                    "peak_kib" : round(peak_kib(fn), 1),
+                })
+    return results
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+# ── Reporting ────────────────────────────────────────────────────────────────
+
+def _key(row: dict) -> tuple:
+    return row["profile"], row["n"], row["phase"]
+
+
+def print_table(results: list[dict], baseline: list[dict] | None = None) -> None:
+    base = {_key(r): r for r in baseline or []}
+    header = f"{'profile':<16}{'n':>7}  {'phase':<18}{'median ms':>11}{'min ms':>10}{'peak KiB':>11}"
+    if baseline is not None:
+        header += f"{'time x':>9}{'mem x':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        line = (f"{r['profile']:<16}{r['n']:>7}  {r['phase']:<18}"
+                f"{r['median_ms']:>11.3f}{r['min_ms']:>10.3f}{r['peak_kib']:>11.1f}")
+        old = base.get(_key(r))
+        if old is not None:
+            t = r["median_ms"] / old["median_ms"] if old["median_ms"] else float("nan")
+            m = r["peak_kib"] / old["peak_kib"] if old["peak_kib"] else float("nan")
+            line += f"{t:>9.2f}{m:>8.2f}"
+        print(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark backend/scheduler phases.")
+    parser.add_argument("--sizes",    type=int, nargs="+", default=DEFAULT_SIZES, help="task counts")
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=list(PROFILES))
+    parser.add_argument("--repeat",   type=int, default=10, help="timed runs per phase (sizes <= 1000)")
+    parser.add_argument("--seed",     type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out",      type=Path, help="write results as JSON to this file")
+    parser.add_argument("--compare",  type=Path, help="JSON from an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.profiles, args.repeat, args.seed)
+    report = {
+        "meta": {
+            "git_revision": git_revision(),
+            "python"      : platform.python_version(),
+            "platform"    : platform.platform(),
+            "seed"        : args.seed,
+            "bench_date"  : BENCH_DATE,
+        },
+        "results": results,
+    }
+
+    baseline = json.loads(args.compare.read_text())["results"] if args.compare else None
+    print_table(results, baseline)
+
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nwrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -89,6 +89,9 @@ function friendlyError(raw: string, fallback: string): string {
       if (detail.includes("importance")) return "Importance must be between 1 and 5.";
       return detail;
     }
+    // POST /tasks/bulk: report the first operation that failed
+    const failed = detail?.results?.find((r: { ok: boolean }) => !r.ok);
+    if (failed) return friendlyError(JSON.stringify(failed), fallback);
   } catch {}
   return fallback;
 }
@@ -691,13 +694,11 @@ export default function Dashboard() {
     try {
       const basePayload = formToPayload(form);
       const dates = getRecurrenceDates(form);
-      for (const date of dates) {
-        const needsDeadline = form.task_type === "due_by" || form.task_type === "set_time" || (form.task_type === "flexible" && form.recurrence !== "once");
-        const payload = { ...basePayload, deadline: needsDeadline ? date : null };
-        const res = await fetch(`${API_BASE}/tasks/`, { method: "POST", headers: { "Content-Type": "application/json", Authorization: `Bearer ${t}` }, body: JSON.stringify(payload) });
-        if (res.status === 401) { sessionStorage.clear(); nav("/login", { replace: true }); return; }
-        if (!res.ok) { setCreateErr(friendlyError(await res.text(), "Failed to create task.")); return; }
-      }
+      const needsDeadline = form.task_type === "due_by" || form.task_type === "set_time" || (form.task_type === "flexible" && form.recurrence !== "once");
+      const operations = dates.map(date => ({ op: "create", data: { ...basePayload, deadline: needsDeadline ? date : null } }));
+      const res = await fetch(`${API_BASE}/tasks/bulk`, { method: "POST", headers: { "Content-Type": "application/json", Authorization: `Bearer ${t}` }, body: JSON.stringify({ operations }) });
+      if (res.status === 401) { sessionStorage.clear(); nav("/login", { replace: true }); return; }
+      if (!res.ok) { setCreateErr(friendlyError(await res.text(), "Failed to create task.")); return; }
       setShowAddModal(false); await fetchTasks();
     } catch { setCreateErr("Failed to create task. Is the backend running?"); }
     finally { setCreating(false); }
@@ -734,9 +735,13 @@ export default function Dashboard() {
       if (recurrenceNewlyAdded) {
         const dates = getRecurrenceDates(editForm).slice(1); // skip first (already updated above)
         const basePayload = formToPayload(editForm);
-        for (const date of dates) {
-          const payload = { ...basePayload, deadline: (editForm.task_type === "due_by" || editForm.task_type === "set_time" || (editForm.task_type === "flexible" && editForm.recurrence !== "once")) ? date : null };
-          await fetch(`${API_BASE}/tasks/`, { method: "POST", headers: { "Content-Type": "application/json", Authorization: `Bearer ${t}` }, body: JSON.stringify(payload) });
+        const needsDeadline = editForm.task_type === "due_by" || editForm.task_type === "set_time" || (editForm.task_type === "flexible" && editForm.recurrence !== "once");
+        const operations = dates.map(date => ({ op: "create", data: { ...basePayload, deadline: needsDeadline ? date : null } }));
+        if (operations.length) {
+          const bulk = await fetch(`${API_BASE}/tasks/bulk`, { method: "POST", headers: { "Content-Type": "application/json", Authorization: `Bearer ${t}` }, body: JSON.stringify({ operations }) });
+          if (bulk.status === 401) { sessionStorage.clear(); nav("/login", { replace: true }); return; }
+          // The task itself is already saved; only its repeats failed
+          if (!bulk.ok) { setEditErr(friendlyError(await bulk.text(), "Task updated, but its repeats could not be created.")); await fetchTasks(); return; }
         }
       }
 
@@ -774,9 +779,20 @@ export default function Dashboard() {
     );
     setTasks(prev => prev.filter(tk => !toDelete.find(d => d.id === tk.id)));
     try {
-      await Promise.all(toDelete.map(tk =>
-        fetch(`${API_BASE}/tasks/${tk.id}`, { method: "DELETE", headers: { Authorization: `Bearer ${t}` } })
-      ));
+      const send = (ids: number[]) => fetch(`${API_BASE}/tasks/bulk`, { method: "POST", headers: { "Content-Type": "application/json", Authorization: `Bearer ${t}` }, body: JSON.stringify({ operations: ids.map(id => ({ op: "delete", id })) }) });
+      let ids = toDelete.map(tk => tk.id);
+      let res = await send(ids);
+      if (res.status === 401) { sessionStorage.clear(); nav("/login", { replace: true }); return; }
+      if (res.status === 422) {
+        // Copies already deleted elsewhere come back 404; retry once without them
+        const results: { index: number; ok: boolean; status?: number }[] = (await res.clone().json().catch(() => null))?.detail?.results ?? [];
+        const gone = new Set(results.filter(r => !r.ok && r.status === 404).map(r => ids[r.index]));
+        if (gone.size && results.every(r => r.ok || r.status === 404)) {
+          ids = ids.filter(id => !gone.has(id));
+          if (ids.length) res = await send(ids);
+        }
+      }
+      if (!res.ok && ids.length) setErr("Could not delete all recurring tasks.");
       await fetchTasks();
     } catch { setErr("Could not delete all recurring tasks."); await fetchTasks(); }
   }